@@ -0,0 +1,65 @@
+"""Compares memory and construction time of Finding records against finding table dictionaries.
+
+Run with: python benchmarks/finding_records.py [COUNT]
+"""
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from codedx_api.APIs.FindingRecord import Finding
+
+SEVERITIES = ["Critical", "High", "Medium", "Low", "Info"]
+TOOLS = ["Semgrep", "ZAP", "Trivy", "SpotBugs"]
+
+
+def table_row(i: int) -> str:
+	"""JSON for a finding table row shaped like the CodeDx response"""
+	row = {
+		"id": i,
+		"severity": {"id": i % 5, "name": SEVERITIES[i % 5]},
+		"status": "unresolved",
+		"tool": TOOLS[i % 4],
+		"rule": {"id": i % 300, "name": f"rule-{ i % 300 }"},
+		"cwe": {"id": 79 + i % 20},
+		"descriptor": {"id": i % 300, "name": f"Descriptor { i % 300 }", "tool": TOOLS[i % 4]},
+		"primaryLocation": {"path": f"src/module{ i % 2000 }/file.py", "lineRange": {"start": i % 400, "end": i % 400 + 3}},
+		"creationDate": "2024-01-01T00:00:00Z",
+		"updateDate": "2024-02-01T00:00:00Z",
+		"projectHierarchy": [{"id": 1, "name": "Project"}]
+	}
+	return json.dumps(row)
+
+
+def measure(build, rows: list) -> tuple:
+	"""Returns the memory held by the built findings and the time to parse and build them"""
+	gc.collect()
+	start = time.perf_counter()
+	findings = [build(json.loads(row)) for row in rows]
+	elapsed = time.perf_counter() - start
+	del findings
+	gc.collect()
+	tracemalloc.start()
+	findings = [build(json.loads(row)) for row in rows]
+	current, _ = tracemalloc.get_traced_memory()
+	tracemalloc.stop()
+	del findings
+	return current, elapsed
+
+
+def main(count: int):
+	rows = [table_row(i) for i in range(count)]
+	dict_memory, dict_time = measure(lambda row: row, rows)
+	record_memory, record_time = measure(Finding, rows)
+	print(f"{ count } findings")
+	print("dict:    %8.1f MiB  %6.2f s" % (dict_memory / 2**20, dict_time))
+	print("Finding: %8.1f MiB  %6.2f s" % (record_memory / 2**20, record_time))
+	print("memory ratio: %.1fx" % (dict_memory / record_memory))
+
+
+if __name__ == "__main__":
+	main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
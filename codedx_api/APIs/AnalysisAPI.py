@@ -1,8 +1,41 @@
 import os
-from typing import List
+from typing import Callable, List
 
 from codedx_api.APIs.BaseAPIClient import (BaseAPIClient, JSONResponseHandler,
                                            ResponseHandler)
+from codedx_api.APIs.Concurrency import map_bounded
+
+
+ACCEPTED_FILE_TYPES = {
+	'.xml': 'text/xml',
+	'.json': 'application/json',
+	'.zip': 'application/zip',
+	'.csv': 'text/csv',
+	'.txt': 'text/plain'
+}
+
+
+def get_file_data(file_name: str) -> dict:
+	"""Describes a file for upload to an Analysis Prep
+
+	Args:
+		file_name (str): File for analysis
+
+	Returns:
+		dict: File name, path and content type
+	"""
+	file_ext = os.path.splitext(file_name)[1]
+	file_data = {
+		'file_name': file_name,
+		'file_path': file_name,
+		'file_type': ACCEPTED_FILE_TYPES[file_ext]
+	}
+	return file_data
+
+
+def latest_analysis_id(analyses: list):
+	"""Returns the id of the newest analysis in a list of analysis details, or None for an empty list"""
+	return max((analysis["id"] for analysis in analyses), default=None)
 
 
 # Jobs API Client for Code DX Projects API
@@ -10,20 +43,7 @@ class Analysis(BaseAPIClient):
 
 
 	def __get_file_data(self, file_name):
-		file_ext = os.path.splitext(file_name)[1]
-		accepted_file_types = {
-			'.xml': 'text/xml',
-			'.json': 'application/json',
-			'.zip': 'application/zip',
-			'.csv': 'text/csv',
-			'.txt': 'text/plain'
-		}
-		file_data = {
-			'file_name': file_name,
-			'file_path': file_name,
-			'file_type': accepted_file_types[file_ext]
-		}
-		return file_data
+		return get_file_data(file_name)
 
 
 	def create_analysis(self, project: int) -> dict:
@@ -55,26 +75,64 @@ class Analysis(BaseAPIClient):
 		return data
 
 
-	def upload_analysis(self, prep_id: str, file_name: str, client_request_id: str = None) -> dict:
+	def upload_analysis(self,
+		prep_id: str,
+		file_name: str,
+		client_request_id: str = None,
+		source=None,
+		compress: bool = False,
+		progress: Callable[[int, float], None] = None) -> dict:
 		"""Analysis Preps should be populated by uploading files to Code Dx.
 
 		This will create a job to determine the contents of the file.
+		Giving a source, compress or progress streams the upload instead of sending the file as-is,
+		so files of any size are uploaded with constant memory.
 		Args:
 			prep_id (str): Analysis Prep ID
-			file_name (str): File for analysis
+			file_name (str): File for analysis. Its extension sets the file type, and it is read unless a source is given.
 			client_request_id (str, optional): Arbitrary identifier used to make modifications to analysis later. Defaults to None.
+			source (file | bytes | Iterable[bytes], optional): Content to upload instead of reading file_name. Defaults to None.
+			compress (bool, optional): Zip the file on the fly while uploading. Defaults to False.
+			progress (Callable[[int, float], None], optional): Called with (bytes sent, bytes per second). Defaults to None.
 
 		Returns:
 			dict: Data about the job created
 		"""
 		path = f'/api/analysis-prep/{ prep_id }/upload'
 		file_data = self.__get_file_data(file_name)
+		headers = {}
 		if client_request_id:
 			headers['X-Client-Request-Id'] = client_request_id
-		data = JSONResponseHandler(self.upload(path, file_data=file_data)).get_data()
+		if source is not None or compress or progress:
+			file_data['file_name'] = os.path.basename(file_name)
+			file_data['source'] = file_name if source is None else source
+			res = self.upload_stream(path, file_data=file_data, local_headers=headers, compress=compress, progress=progress)
+		else:
+			res = self.upload(path, file_data=file_data, local_headers=headers)
+		data = JSONResponseHandler(res).get_data()
 		return data
 
 
+	def upload_analyses(self, prep_id: str, file_names: List[str], max_workers: int = 4, compress: bool = False) -> dict:
+		"""Uploads several files to one Analysis Prep concurrently.
+
+		A file listed more than once is uploaded once.
+
+		Args:
+			prep_id (str): Analysis Prep ID
+			file_names (List[str]): Files for analysis
+			max_workers (int, optional): Number of concurrent uploads. Defaults to 4.
+			compress (bool, optional): Zip each file on the fly while uploading. Defaults to False.
+
+		Returns:
+			dict: File names to the upload job, or to the exception raised by its upload
+		"""
+		file_names = list(dict.fromkeys(file_names))
+		upload = lambda file_name: self.upload_analysis(prep_id, file_name, compress=compress)
+		jobs = {file_name: error if error is not None else job for file_name, job, error in map_bounded(upload, file_names, max_workers)}
+		return {file_name: jobs[file_name] for file_name in file_names}
+
+
 	def get_input_metadata(self, prep_id: str, input_id: str) -> dict:
 		"""[summary]
 
@@ -147,9 +205,6 @@ class Analysis(BaseAPIClient):
 		return data
 
 
-	def upload_run_analysis(self, project: int, file_names: List[str]) -> dict:
-		pass
-
 	def get_all_analysis(self, project: int) -> list:
 		"""Get list of analysis details for analysis associated with a project
 
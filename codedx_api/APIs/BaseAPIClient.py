@@ -1,37 +1,81 @@
 import logging
+import os
+from contextlib import contextmanager
 from enum import Enum
 
 import requests
 from requests import Response
+from requests.adapters import HTTPAdapter
 from requests.exceptions import ContentDecodingError, HTTPError
 
+from codedx_api.APIs.UploadStream import UPLOAD_CHUNK_SIZE, upload_body
+
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 class BaseAPIClient(object):
 
-	def __init__(self, base_url: str, api_key: str):
+	def __init__(self,
+		base_url: str,
+		api_key: str,
+		pool_connections: int = 10,
+		pool_maxsize: int = 10,
+		pool_block: bool = False,
+		keep_alive: bool = True,
+		timeout: float = None,
+		session: requests.Session = None):
 		"""Constructor for the base CodeDx API client
 
+		All requests go through a pooled requests.Session so that connections to CodeDx are reused.
+		Request building never modifies client state, so one client can be shared by many threads.
+
 		Args:
 			base_url (str): The CodeDx base url. Must be in the correct format: https://[CODEDX-HOST]/codedx
 			api_key (str): An API key from CodeDx.
+			pool_connections (int, optional): Number of per-host connection pools to cache. Defaults to 10.
+			pool_maxsize (int, optional): Maximum number of connections kept open per host. Defaults to 10.
+			pool_block (bool, optional): Block when no pooled connection is free instead of opening a new one. Defaults to False.
+			keep_alive (bool, optional): Keep connections open between requests. Defaults to True.
+			timeout (float, optional): Timeout in seconds for every request, None waits forever. Defaults to None.
+			session (requests.Session, optional): Existing session to share. It is not closed by this client. Defaults to None.
 		"""
 		self.base_url = base_url
 		self.api_key = api_key
+		self.timeout = timeout
 		self.headers = {
 			'API-Key': self.api_key,
 			'accept': 'application/json',
 			'Content-Type': 'application/json'
 		}
+		if not keep_alive:
+			self.headers['Connection'] = 'close'
+		self._owns_session = session is None
+		if session is None:
+			session = requests.Session()
+			adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block)
+			session.mount('https://', adapter)
+			session.mount('http://', adapter)
+		self.session = session
+
+	def close(self):
+		"""Closes the pooled connections if the session is owned by this client"""
+		if self._owns_session:
+			self.session.close()
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, exc_type, exc_value, traceback):
+		self.close()
 
 	def _compose_url(self, path: str):
 		return self.base_url + path
 
-	def _compose_headers(self,local_headers):
-		headers = self.headers
-		if local_headers == None:
-			local_headers = {}
-		for key in local_headers:
-			headers[key] = local_headers[key]
+	def _compose_headers(self, local_headers):
+		"""Returns a new header dictionary for a single request, leaving the client headers untouched"""
+		headers = dict(self.headers)
+		if local_headers:
+			headers.update(local_headers)
 		return headers
 
 	@staticmethod
@@ -41,7 +85,7 @@ class BaseAPIClient(object):
 			raise Exception(msg)
 		return True
 
-	def get(self, path, json_data=None, content_type='application/json;charset=utf-8', local_headers=None):
+	def get(self, path, json_data=None, content_type='application/json;charset=utf-8', local_headers=None, timeout=None):
 		""" Composes a get request to CodeDx
 
 		Args:
@@ -49,25 +93,27 @@ class BaseAPIClient(object):
 			json_data ([type], optional): [description]. Defaults to None.
 			content_type (str, optional): [description]. Defaults to 'application/json;charset=utf-8'.
 			local_headers ([type], optional): [description]. Defaults to None.
+			timeout (float, optional): Timeout for this request. Defaults to the client timeout.
 
 		Returns:
 			[type]: [description]
 		"""
 		url = self._compose_url(path)
 		headers = self._compose_headers(local_headers)
-		res = requests.get(url, headers=headers)
+		res = self.session.get(url, headers=headers, timeout=self.timeout if timeout is None else timeout)
 		return res
 
-	def download(self, path, json_data=None, content_type='application/json;charset=utf-8', local_headers=None):
+	def download(self, path, json_data=None, content_type='application/json;charset=utf-8', local_headers=None, stream=False):
+		"""Composes a get request for file content. With stream, the body is only read when iterated."""
 		url = self._compose_url(path)
 		headers = self._compose_headers(local_headers)
-		res = requests.get(url, headers=headers)
+		res = self.session.get(url, headers=headers, stream=stream, timeout=self.timeout)
 		return res
 
 	def post(self, path, json_data=None, content_type='application/json;charset=utf-8', local_headers=None):
 		url = self._compose_url(path)
 		headers = self._compose_headers(local_headers)
-		res = requests.post(url, headers=headers, json=json_data)
+		res = self.session.post(url, headers=headers, json=json_data, timeout=self.timeout)
 		return res
 
 	def upload(self, path, file_data, local_headers=None):
@@ -78,19 +124,39 @@ class BaseAPIClient(object):
 			files = {
 				'file': (file_data['file_name'], f, file_data['file_type'])
 			}
-			res = requests.post(url, headers=headers, files=files)
+			res = self.session.post(url, headers=headers, files=files, timeout=self.timeout)
+		return res
+
+	def upload_stream(self, path, file_data, local_headers=None, compress=False, progress=None, chunk_size=UPLOAD_CHUNK_SIZE):
+		"""Uploads a file as a streamed multipart body without reading it into memory
+
+		Args:
+			path (str): API path
+			file_data (dict): 'source' (path, file object, bytes or iterator of bytes), 'file_name' and 'file_type'
+			local_headers (dict, optional): Extra request headers. Defaults to None.
+			compress (bool, optional): Zip the source on the fly. Defaults to False.
+			progress (Callable[[int, float], None], optional): Called with (bytes sent, bytes per second). Defaults to None.
+			chunk_size (int, optional): Bytes read per chunk from the source. Defaults to 1 MiB.
+
+		Returns:
+			Response: CodeDx response
+		"""
+		url = self._compose_url(path)
+		headers = self._compose_headers(local_headers)
+		headers['Content-Type'], body = upload_body(file_data, compress, progress, chunk_size)
+		res = self.session.post(url, headers=headers, data=body, timeout=self.timeout)
 		return res
 
 	def put(self, path, json_data, content_type='application/json;charset=utf-8', local_headers=None):
 		url = self._compose_url(path)
 		headers = self._compose_headers(local_headers)
-		res = requests.put(url,headers=headers,json=json_data)
+		res = self.session.put(url, headers=headers, json=json_data, timeout=self.timeout)
 		return res
 
 	def delete(self, path, json_data=None, content_type='application/json;charset=utf-8', local_headers=None):
 		url = self._compose_url(path)
 		headers = self._compose_headers(local_headers)
-		res = requests.delete(url, headers=headers)
+		res = self.session.delete(url, headers=headers, timeout=self.timeout)
 		return res
 
 
@@ -164,3 +230,47 @@ class ContentResponseHandler(ResponseHandler):
 		"""Returns the content of the response"""
 		self.validate()
 		return self.response.content
+
+	def write_to(self, destination, chunk_size: int = DOWNLOAD_CHUNK_SIZE) -> int:
+		"""Validates the response headers, then streams the body to a file in chunks
+
+		Args:
+			destination (str | file): File path or writable binary file object
+			chunk_size (int, optional): Bytes read per chunk. Defaults to 1 MiB.
+
+		Returns:
+			int: Number of bytes written
+		"""
+		try:
+			self.validate()
+			written = 0
+			with open_destination(destination) as f:
+				for chunk in self.response.iter_content(chunk_size):
+					f.write(chunk)
+					written += len(chunk)
+			return written
+		finally:
+			self.response.close()
+
+
+@contextmanager
+def open_destination(destination):
+	"""Opens a download destination for binary writing
+
+	Paths are written to a temporary file that replaces the destination once the download succeeds,
+	so a failed download never leaves a truncated file behind. File objects are used as they are.
+
+	Args:
+		destination (str | file): File path or writable binary file object
+	"""
+	if hasattr(destination, 'write'):
+		yield destination
+		return
+	partial = f"{ destination }.part"
+	try:
+		with open(partial, 'wb') as f:
+			yield f
+		os.replace(partial, destination)
+	finally:
+		if os.path.exists(partial):
+			os.remove(partial)
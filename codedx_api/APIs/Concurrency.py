@@ -0,0 +1,44 @@
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+
+def map_bounded(fn, items, max_workers: int = 8, in_flight: int = None):
+	"""Calls fn on each item from a thread pool and yields results as they complete
+
+	Items are read lazily and at most in_flight calls are queued at once, so large or endless
+	iterables are processed with bounded memory. Errors are yielded instead of raised so that
+	one failing item does not stop the others.
+
+	Args:
+		fn (Callable): Function called with each item
+		items (Iterable): Items to process
+		max_workers (int, optional): Number of worker threads. Defaults to 8.
+		in_flight (int, optional): Maximum number of queued calls. Defaults to twice max_workers.
+
+	Yields:
+		tuple: (item, result, error) with either result or error set
+	"""
+	in_flight = in_flight or max_workers * 2
+	items = iter(items)
+	pending = {}
+	with ThreadPoolExecutor(max_workers=max_workers) as pool:
+		try:
+			for item in items:
+				pending[pool.submit(fn, item)] = item
+				if len(pending) >= in_flight:
+					break
+			while pending:
+				done, _ = wait(pending, return_when=FIRST_COMPLETED)
+				for future in done:
+					item = pending.pop(future)
+					try:
+						result, error = future.result(), None
+					except Exception as e:
+						result, error = None, e
+					yield item, result, error
+				for item in items:
+					pending[pool.submit(fn, item)] = item
+					if len(pending) >= in_flight:
+						break
+		finally:
+			for future in pending:
+				future.cancel()
@@ -0,0 +1,61 @@
+FIELD_PATHS = {
+	"id": ("id",),
+	"severity": ("severity",),
+	"status": ("status",),
+	"tool": ("tool", "detectionMethod", "descriptor.tool"),
+	"rule": ("rule", "descriptor.name"),
+	"cwe": ("cwe",),
+	"path": ("loc.path", "primaryLocation.path", "location.path"),
+	"line": ("loc.line", "primaryLocation.lineRange.start", "location.lineRange.start"),
+	"updateDate": ("updateDate", "lastUpdated"),
+	"creationDate": ("creationDate", "firstSeenOn")
+}
+
+
+def lookup(finding: dict, path: str):
+	"""Reads a dotted path from a finding, accepting flat keys such as "loc.path" as well as nested ones
+
+	Args:
+		finding (dict): Finding table row or metadata
+		path (str): Dotted path
+
+	Returns:
+		Value at the path, or None
+	"""
+	if path in finding:
+		return finding[path]
+	value = finding
+	for key in path.split("."):
+		if not isinstance(value, dict) or key not in value:
+			return None
+		value = value[key]
+	return value
+
+
+def scalar(value):
+	"""Reduces a CodeDx object such as {"id": 2, "name": "High"} to its name or id"""
+	if isinstance(value, dict):
+		for key in ("name", "id", "type"):
+			if key in value:
+				return value[key]
+		return None
+	return value
+
+
+def field_value(finding: dict, field: str):
+	"""Returns a finding field as a plain value
+
+	Known fields are read from any of the shapes CodeDx uses for them. Other fields are read as dotted paths.
+
+	Args:
+		finding (dict): Finding table row or metadata
+		field (str): Field name, such as "severity", "status", "tool", "cwe", "path" or "updateDate"
+
+	Returns:
+		Field value, or None
+	"""
+	for path in FIELD_PATHS.get(field, (field,)):
+		value = scalar(lookup(finding, path))
+		if value is not None:
+			return value
+	return None
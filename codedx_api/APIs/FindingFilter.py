@@ -0,0 +1,180 @@
+import fnmatch
+import re
+from datetime import datetime, timezone
+
+from codedx_api.APIs.FindingFields import field_value
+from codedx_api.APIs.FindingRecord import Finding
+
+FINDING_ID_FILTER = "finding"
+NEGATION_PREFIX = "~"
+
+RECORD_FIELDS = {
+	"id": "id",
+	"severity": "severity",
+	"status": "status",
+	"tool": "tool",
+	"rule": "rule",
+	"cwe": "cwe",
+	"path": "path",
+	"line": "line",
+	"updateDate": "update_date"
+}
+
+FILTER_FIELDS = {
+	FINDING_ID_FILTER: "id",
+	"severity": "severity",
+	"status": "status",
+	"tool": "tool",
+	"detectionMethod": "tool",
+	"rule": "rule",
+	"cwe": "cwe",
+	"path": "path",
+	"updateDate": "updateDate",
+	"creationDate": "creationDate"
+}
+
+
+class UnsupportedFilter(ValueError):
+	"""Raised for filter keys or values that can only be evaluated by CodeDx"""
+
+
+def finding_field(finding, field: str):
+	"""Returns a field of a finding table row, metadata dict or Finding record"""
+	if isinstance(finding, Finding):
+		if field in RECORD_FIELDS:
+			return getattr(finding, RECORD_FIELDS[field])
+		return field_value(finding.to_dict(), field)
+	return field_value(finding, field)
+
+
+def timestamp(value) -> float:
+	"""Converts epoch milliseconds or an ISO 8601 date to epoch seconds, reading dates without a zone as UTC"""
+	if value is None:
+		return None
+	if isinstance(value, (int, float)):
+		return value / 1000
+	text = re.sub(r"([+-]\d\d)(\d\d)$", r"\1:\2", str(value).replace("Z", "+00:00"))
+	date = datetime.fromisoformat(text)
+	if date.tzinfo is None:
+		date = date.replace(tzinfo=timezone.utc)
+	return date.timestamp()
+
+
+def _values(value) -> list:
+	return list(value) if isinstance(value, (list, tuple, set)) else [value]
+
+
+def _text(value) -> str:
+	return None if value is None else str(value).lower()
+
+
+def _equals(field: str, value):
+	wanted = {_text(item) for item in _values(value)}
+	return lambda finding: _text(finding_field(finding, field)) in wanted
+
+
+def _ids(field: str, value):
+	wanted = {int(item) for item in _values(value)}
+	def match(finding):
+		found = finding_field(finding, field)
+		return found is not None and int(found) in wanted
+	return match
+
+
+def _paths(field: str, value):
+	patterns = [str(item) for item in _values(value)]
+	def match(finding):
+		path = finding_field(finding, field)
+		if path is None:
+			return False
+		for pattern in patterns:
+			if fnmatch.fnmatchcase(path, pattern) or path == pattern or path.startswith(pattern.rstrip("/") + "/"):
+				return True
+		return False
+	return match
+
+
+def _dates(field: str, value):
+	if not isinstance(value, dict) or not set(value) <= {"start", "end"}:
+		raise UnsupportedFilter(f"Date filter { field } must be a dictionary with start and/or end, not { value }.")
+	start = timestamp(value.get("start"))
+	end = timestamp(value.get("end"))
+	def match(finding):
+		found = finding_field(finding, field)
+		if found is None:
+			return False
+		found = timestamp(found)
+		return (start is None or found >= start) and (end is None or found <= end)
+	return match
+
+
+MATCHERS = {
+	"id": _ids,
+	"severity": _equals,
+	"status": _equals,
+	"tool": _equals,
+	"rule": _equals,
+	"cwe": _ids,
+	"path": _paths,
+	"updateDate": _dates,
+	"creationDate": _dates
+}
+
+
+def compile_filter(filters: dict):
+	"""Compiles a CodeDx finding filter into a predicate for locally held findings
+
+	Supported keys are finding (ids), severity, status, tool or detectionMethod, rule, cwe, path,
+	updateDate and creationDate. Lists match any of their values, names match case-insensitively,
+	paths match exactly, as a directory prefix or as a glob, and dates take a {"start", "end"} range
+	of ISO dates or epoch milliseconds. A key prefixed with "~" excludes its matches. All keys must match.
+
+	Args:
+		filters (dict): Filter as passed to get_finding_table, get_finding_count or bulk_status_update
+
+	Raises:
+		UnsupportedFilter: A key can only be evaluated by CodeDx.
+
+	Returns:
+		Callable: Predicate taking a finding table row, metadata dict or Finding record
+	"""
+	predicates = []
+	for key, value in (filters or {}).items():
+		negated = key.startswith(NEGATION_PREFIX)
+		name = key[len(NEGATION_PREFIX):] if negated else key
+		if name not in FILTER_FIELDS:
+			raise UnsupportedFilter(f"Filter { key } is not supported locally. Choose from { sorted(FILTER_FIELDS) }.")
+		field = FILTER_FIELDS[name]
+		predicate = MATCHERS[field](field, value)
+		if negated:
+			predicate = (lambda match: lambda finding: not match(finding))(predicate)
+		predicates.append(predicate)
+	if len(predicates) == 1:
+		return predicates[0]
+	return lambda finding: all(predicate(finding) for predicate in predicates)
+
+
+def filter_findings(findings, filters: dict):
+	"""Yields the findings matching a CodeDx filter
+
+	Args:
+		findings (Iterable): Finding table rows, metadata or Finding records
+		filters (dict): CodeDx finding filter
+
+	Yields:
+		Matching findings
+	"""
+	return filter(compile_filter(filters), findings)
+
+
+def count_findings(findings, filters: dict) -> int:
+	"""Counts the findings matching a CodeDx filter, like get_finding_count without a request
+
+	Args:
+		findings (Iterable): Finding table rows, metadata or Finding records
+		filters (dict): CodeDx finding filter
+
+	Returns:
+		int: Number of matching findings
+	"""
+	return sum(1 for _ in filter_findings(findings, filters))
@@ -0,0 +1,60 @@
+import marshal
+import sys
+
+from codedx_api.APIs.FindingFields import field_value, lookup
+
+
+def _intern(value):
+	return sys.intern(value) if isinstance(value, str) else value
+
+
+class Finding(object):
+	"""Compact read-only finding record
+
+	Common fields are kept in slots, with repeated strings such as severities and tools interned.
+	The full finding is kept serialized and only decoded when a rarely used field is read,
+	which takes a fraction of the memory of the nested dictionaries returned by CodeDx.
+	"""
+	__slots__ = ("id", "severity", "status", "tool", "rule", "cwe", "path", "line", "update_date", "_raw")
+
+	def __init__(self, data: dict):
+		"""Builds a record from a finding table row or finding metadata
+
+		Args:
+			data (dict): Finding from CodeDx
+		"""
+		self.id = data["id"]
+		self.severity = _intern(field_value(data, "severity"))
+		self.status = _intern(field_value(data, "status"))
+		self.tool = _intern(field_value(data, "tool"))
+		self.rule = _intern(field_value(data, "rule"))
+		self.cwe = field_value(data, "cwe")
+		self.path = _intern(field_value(data, "path"))
+		self.line = field_value(data, "line")
+		self.update_date = field_value(data, "updateDate")
+		self._raw = marshal.dumps(data)
+
+	def __getitem__(self, path: str):
+		"""Reads any field of the original finding, such as finding["descriptor.name"]"""
+		value = lookup(self.to_dict(), path)
+		if value is None:
+			raise KeyError(path)
+		return value
+
+	def get(self, path: str, default=None):
+		"""Reads any field of the original finding, or returns the default"""
+		value = lookup(self.to_dict(), path)
+		return default if value is None else value
+
+	def to_dict(self) -> dict:
+		"""Returns the original finding"""
+		return marshal.loads(self._raw)
+
+	def __eq__(self, other):
+		return isinstance(other, Finding) and self.id == other.id and self.to_dict() == other.to_dict()
+
+	def __hash__(self):
+		return hash(self.id)
+
+	def __repr__(self):
+		return f"Finding(id={ self.id }, severity={ repr(self.severity) }, status={ repr(self.status) }, tool={ repr(self.tool) }, path={ repr(self.path) })"
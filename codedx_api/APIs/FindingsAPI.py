@@ -1,9 +1,15 @@
+import math
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from enum import Enum
 from typing import List
 
 from codedx_api.APIs.BaseAPIClient import (BaseAPIClient,
                                            ContentResponseHandler, ContentType,
                                            JSONResponseHandler)
+from codedx_api.APIs.Concurrency import map_bounded
+from codedx_api.APIs.FindingRecord import Finding
+from codedx_api.APIs.Snippets import group_windows, slice_windows
 
 
 class FindingStatus(str, Enum):
@@ -43,7 +49,44 @@ class FindingStatus(str, Enum):
 			print(status)
 
 
+DEFAULT_SORT = {"by": "id", "direction": "ascending"}
+FINDING_DETAILS = ("finding", "description", "history")
+
+
+def table_request(filters: dict = None, page: int = None, page_size: int = None, sort: dict = None) -> dict:
+	"""Builds a request body for the finding table and count endpoints
+
+	Args:
+		filters (dict, optional): Finding filters. Defaults to None.
+		page (int, optional): 1-based page number. Defaults to None.
+		page_size (int, optional): Findings per page. Defaults to None.
+		sort (dict, optional): Sort order, such as {"by": "id", "direction": "ascending"}. Defaults to None.
+
+	Returns:
+		dict: Request body
+	"""
+	req_body = {"filter": filters or {}}
+	if sort:
+		req_body["sort"] = sort
+	if page is not None:
+		req_body["pagination"] = {"page": page, "perPage": page_size}
+	return req_body
+
+
 class Findings(BaseAPIClient):
+	def __init__(self, base_url: str, api_key: str, file_cache=None, **kwargs):
+		"""Definitions for Findings API on CodeDx
+
+		Args:
+			base_url (str): The CodeDx base URL. https://[CODEDX_INSTANCE]/codedx
+			api_key (str): CodeDx API key
+			file_cache (SourceFileCache, optional): Cache backing get_finding_file. A cache without a client downloads through this one. Defaults to None.
+			**kwargs: Connection pool options passed to BaseAPIClient
+		"""
+		super().__init__(base_url, api_key, **kwargs)
+		self.file_cache = file_cache
+		if file_cache is not None and file_cache.client is None:
+			file_cache.client = self
 
 	def get_finding(self, finding: int, options: List[str] = None) -> dict:
 		"""Returns metadata for the given finding
@@ -92,16 +135,109 @@ class Findings(BaseAPIClient):
 		return data
 
 
-	def get_finding_table(self, project: int, options: List[str] = None, req_body: dict = None) -> dict:
+	def get_finding_details(self,
+		findings,
+		details: List[str] = ("finding",),
+		options: List[str] = None,
+		max_workers: int = 8,
+		description_cache=None):
+		"""Fetches details for many findings concurrently.
+
+		Duplicate ids are fetched once and results are yielded as soon as they arrive.
+		A failing finding yields its error instead of stopping the batch.
+
+		Args:
+			findings (Iterable[int]): Finding ids
+			details (List[str], optional): Any of "finding", "description" and "history". Defaults to ("finding",).
+			options (List[str], optional): Expand options for the finding metadata. Defaults to None.
+			max_workers (int, optional): Number of concurrent requests. Defaults to 8.
+			description_cache (DescriptionCache, optional): Cache used for descriptions, so each rule's description is downloaded once. Defaults to None.
+
+		Raises:
+			ValueError: Unknown detail requested.
+
+		Yields:
+			tuple: (finding id, dictionary of details) or (finding id, exception)
+		"""
+		unknown = set(details) - set(FINDING_DETAILS)
+		if unknown:
+			raise ValueError(f"Unknown finding details { unknown }. Choose from { FINDING_DETAILS }.")
+		if description_cache is not None and "finding" in details:
+			options = list(options or [])
+			if "descriptor" not in options:
+				options.append("descriptor")
+
+		def describe(finding, result):
+			if description_cache is None:
+				return self.get_finding_description(finding)
+			return description_cache.get(result.get("finding", finding))
+
+		fetchers = {
+			"finding": lambda finding, result: self.get_finding(finding, options),
+			"description": describe,
+			"history": lambda finding, result: self.get_finding_history(finding)
+		}
+
+		def fetch(finding):
+			result = {}
+			for detail in sorted(details, key=FINDING_DETAILS.index):
+				result[detail] = fetchers[detail](finding, result)
+			return result
+
+		def unique(findings):
+			seen = set()
+			for finding in findings:
+				if finding not in seen:
+					seen.add(finding)
+					yield finding
+
+		for finding, result, error in map_bounded(fetch, unique(findings), max_workers):
+			yield finding, result if error is None else error
+
+
+	def get_finding_snippets(self, project: int, findings, context: int = 3, max_workers: int = 4):
+		"""Fetches the lines of code around many findings.
+
+		Findings are grouped by file so each file is downloaded once, and files are fetched concurrently.
+		A file is sliced as soon as it arrives and then released, so at most max_workers files are held at once.
+		Findings without a location are skipped, and findings in a file that fails to download yield its error.
+
+		Args:
+			project (int): Project id
+			findings (Iterable): Finding table rows, metadata or Finding records
+			context (int, optional): Lines kept before and after each finding line. Defaults to 3.
+			max_workers (int, optional): Number of concurrent file downloads. Defaults to 4.
+
+		Yields:
+			tuple: (finding id, snippet) where snippet is {"path", "start", "line", "lines"}, or (finding id, exception)
+		"""
+		files = group_windows(findings, context)
+
+		def fetch(path):
+			snippets = slice_windows(self.get_finding_file(project, path), files[path])
+			for snippet in snippets.values():
+				snippet["path"] = path
+			return snippets
+
+		for path, snippets, error in map_bounded(fetch, list(files), max_workers, in_flight=max_workers):
+			if error is not None:
+				for window in files[path]:
+					yield window[0], error
+				continue
+			yield from snippets.items()
+
+
+	def get_finding_table(self, project: int, options: List[str] = None, req_body: dict = None, records: bool = False) -> list:
 		"""Returns filtered finding table data.
 
 		Args:
 			project (int): Project id
 			options (List[str], optional): The expand parameter is a comma separated list. Defaults to None.
 			req_body (dict, optional): Filters, pagination options. Defaults to None.
+			records (bool, optional): Return compact Finding records instead of dictionaries. Defaults to False.
 
 		Returns:
-			dict: [description]
+			list: Finding table rows
 		"""
 		path = f"/api/projects/{ project }/findings/table"
 		if options:
@@ -110,9 +246,151 @@ class Findings(BaseAPIClient):
 		if not req_body: 
 			req_body = {}
 		data = JSONResponseHandler(self.post(path, json_data=req_body)).get_data()
+		if records:
+			return [Finding(row) for row in data]
 		return data
 
 
+	def iter_finding_pages(self,
+		project: int,
+		filters: dict = None,
+		options: List[str] = None,
+		page_size: int = 500,
+		sort: dict = None,
+		prefetch: bool = True,
+		max_workers: int = 1,
+		ordered: bool = True,
+		records: bool = False,
+		start_page: int = 1):
+		"""Yields every page of the finding table matching the filters.
+
+		While a page is being processed the next one is fetched in the background,
+		so at most two pages are held in memory.
+
+		With more than one worker the pages are planned from get_finding_count and fetched concurrently,
+		keeping at most max_workers pages in flight.
+
+		Args:
+			project (int): Project id
+			filters (dict, optional): Finding filters. Defaults to None.
+			options (List[str], optional): The expand parameter is a comma separated list. Defaults to None.
+			page_size (int, optional): Findings per page. Defaults to 500.
+			sort (dict, optional): Sort order. Defaults to ascending finding id, which keeps pages stable.
+			prefetch (bool, optional): Fetch the next page while the current one is processed. Defaults to True.
+			max_workers (int, optional): Number of pages fetched concurrently. Defaults to 1.
+			ordered (bool, optional): Yield concurrent pages in sort order rather than as they arrive. Defaults to True.
+			records (bool, optional): Yield compact Finding records instead of dictionaries. Defaults to False.
+			start_page (int, optional): First page to fetch, for resuming. Defaults to 1.
+
+		Yields:
+			list: Finding table rows
+		"""
+		sort = sort or DEFAULT_SORT
+		fetch = lambda page: self.get_finding_table(project, options, table_request(filters, page, page_size, sort), records)
+		if max_workers > 1:
+			count = self.get_finding_count(project, table_request(filters))["count"]
+			pages = math.ceil(count / page_size)
+			seen = (start_page - 1) * page_size
+			for rows in self.__fetch_pages(fetch, start_page, pages, max_workers, ordered):
+				seen += len(rows)
+				yield rows
+			# A server capping perPage below page_size leaves findings after the planned pages
+			page = max(pages, start_page - 1) + 1
+			while seen < count:
+				rows = fetch(page)
+				if not rows:
+					return
+				seen += len(rows)
+				yield rows
+				page += 1
+			return
+		# Only an empty page ends the table, since the server may return fewer rows than page_size
+		if not prefetch:
+			page = start_page
+			rows = fetch(page)
+			while rows:
+				yield rows
+				page += 1
+				rows = fetch(page)
+			return
+		with ThreadPoolExecutor(max_workers=1) as pool:
+			page = start_page
+			pending = pool.submit(fetch, page)
+			try:
+				while True:
+					rows = pending.result()
+					if not rows:
+						pending = None
+						return
+					page += 1
+					pending = pool.submit(fetch, page)
+					yield rows
+			finally:
+				if pending is not None:
+					pending.cancel()
+
+
+	@staticmethod
+	def __fetch_pages(fetch, start_page: int, pages: int, max_workers: int, ordered: bool):
+		"""Fetches pages start_page to pages concurrently with at most max_workers requests in flight"""
+		with ThreadPoolExecutor(max_workers=max_workers) as pool:
+			plan = iter(range(start_page, pages + 1))
+			in_flight = deque()
+			try:
+				for page in plan:
+					in_flight.append(pool.submit(fetch, page))
+					if len(in_flight) == max_workers:
+						break
+				while in_flight:
+					if ordered:
+						future = in_flight.popleft()
+					else:
+						done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+						future = done.pop()
+						in_flight.remove(future)
+					rows = future.result()
+					page = next(plan, None)
+					if page is not None:
+						in_flight.append(pool.submit(fetch, page))
+					if rows:
+						yield rows
+			finally:
+				for future in in_flight:
+					future.cancel()
+
+
+	def iter_findings(self,
+		project: int,
+		filters: dict = None,
+		options: List[str] = None,
+		page_size: int = 500,
+		sort: dict = None,
+		prefetch: bool = True,
+		max_workers: int = 1,
+		ordered: bool = True,
+		records: bool = False,
+		start_page: int = 1):
+		"""Yields every finding matching the filters, fetching the finding table page by page.
+
+		Args:
+			project (int): Project id
+			filters (dict, optional): Finding filters. Defaults to None.
+			options (List[str], optional): The expand parameter is a comma separated list. Defaults to None.
+			page_size (int, optional): Findings per page. Defaults to 500.
+			sort (dict, optional): Sort order. Defaults to ascending finding id.
+			prefetch (bool, optional): Fetch the next page while the current one is processed. Defaults to True.
+			max_workers (int, optional): Number of pages fetched concurrently. Defaults to 1.
+			ordered (bool, optional): Yield concurrent pages in sort order rather than as they arrive. Defaults to True.
+			records (bool, optional): Yield compact Finding records instead of dictionaries. Defaults to False.
+			start_page (int, optional): First page to fetch, for resuming. Defaults to 1.
+
+		Yields:
+			dict: Finding table row
+		"""
+		for rows in self.iter_finding_pages(project, filters, options, page_size, sort, prefetch, max_workers, ordered, records, start_page):
+			yield from rows
+
+
 	def get_finding_count(self, project: int, req_body: dict = None) -> dict:
 		"""Returns the count of all findings in the project matching the given filter.
 
@@ -158,31 +436,60 @@ class Findings(BaseAPIClient):
 		return data
 
 
-	def get_finding_file(self, project: int, path_id: int) -> str:
-		"""Returns the contents of a given file, as long as it is a text file.
+	def get_file_by_id(self, project: int, path_id: int) -> bytes:
+		"""Returns the contents of a given file by path id, as long as it is a text file.
 
 		Args:
 			project (int): Project id
 			path_id (int): Path id
 
 		Returns:
-			str: Contains the requested file's content
+			bytes: Contains the requested file's content
 		"""
 		path = f"/api/projects/{ project }/files/{ path_id }"
 		data = ContentResponseHandler(self.get(path), ContentType.TEXT.text()).get_data()
 		return data
 
 
-	def get_finding_file(self, project: int, file_path: str) -> str:
-		"""Returns the contents of a given file, as long as it is a text file.
+	def get_file_by_path(self, project: int, file_path: str) -> bytes:
+		"""Returns the contents of a given file by its path, as long as it is a text file.
 
 		Args:
 			project (int): Project id
 			file_path (str): The literal path to the file
 
 		Returns:
-			str: Contains the requested file's content
+			bytes: Contains the requested file's content
 		"""
 		path = f"/api/projects/{ project }/files/tree/{ file_path }"
 		data = ContentResponseHandler(self.get(path), ContentType.TEXT.text()).get_data()
 		return data
+
+
+	def get_finding_file(self, project: int, file, use_cache: bool = True, by: str = None) -> bytes:
+		"""Returns the contents of a given file, as long as it is a text file.
+
+		If the client has a file_cache, unchanged files are read from it instead of CodeDx.
+
+		Args:
+			project (int): Project id
+			file (int | str): Path id, or the literal path to the file
+			use_cache (bool, optional): Use the file cache if one is set. Defaults to True.
+			by (str, optional): "id" or "path". Defaults to "id" for ints and numeric strings, otherwise "path".
+
+		Raises:
+			ValueError: by is neither "id" nor "path".
+
+		Returns:
+			bytes: Contains the requested file's content
+		"""
+		if by is None:
+			by = "id" if isinstance(file, int) or str(file).isdigit() else "path"
+		if by not in ("id", "path"):
+			raise ValueError(f"Cannot get a file by { by }. Choose from ['id', 'path'].")
+		file = int(file) if by == "id" else str(file)
+		if use_cache and self.file_cache is not None:
+			return self.file_cache.get(project, file)
+		if by == "id":
+			return self.get_file_by_id(project, file)
+		return self.get_file_by_path(project, file)
@@ -0,0 +1,102 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+class ProjectCache(object):
+
+	def __init__(self, ttl: float = 300, max_size: int = 4096, negative: bool = False, clock=time.monotonic):
+		"""Thread-safe TTL and LRU cache of CodeDx project names to ids
+
+		With negative caching, a bulk load from get_projects also tells which names do not exist,
+		until the load expires or an entry is evicted. It is off by default because projects created by
+		other clients would then look missing until the load expires.
+
+		Args:
+			ttl (float, optional): Seconds an entry stays valid. Defaults to 300.
+			max_size (int, optional): Maximum number of cached projects. Defaults to 4096.
+			negative (bool, optional): Answer for names missing from the last load. Defaults to False.
+		"""
+		self.ttl = ttl
+		self.max_size = max_size
+		self.negative = negative
+		self.hits = 0
+		self.misses = 0
+		self._clock = clock
+		self._entries = OrderedDict()
+		self._complete_until = None
+		self._lock = threading.Lock()
+
+	def __len__(self):
+		return len(self._entries)
+
+	def _expired(self, expires: float) -> bool:
+		return self._clock() >= expires
+
+	def lookup(self, name: str) -> tuple:
+		"""Looks up a project id
+
+		Args:
+			name (str): Project name
+
+		Returns:
+			tuple: (True, id) when the cache can answer, where id is None for a project known not to exist,
+				or (False, None) when CodeDx must be asked
+		"""
+		with self._lock:
+			entry = self._entries.get(name)
+			if entry is not None and not self._expired(entry[1]):
+				self._entries.move_to_end(name)
+				self.hits += 1
+				return True, entry[0]
+			if entry is not None:
+				del self._entries[name]
+			if self._complete_until is not None and not self._expired(self._complete_until):
+				self.hits += 1
+				return True, None
+			self.misses += 1
+			return False, None
+
+	def put(self, name: str, project_id: int):
+		"""Caches a project id
+
+		Args:
+			name (str): Project name
+			project_id (int): Project id
+		"""
+		with self._lock:
+			self._entries[name] = (project_id, self._clock() + self.ttl)
+			self._entries.move_to_end(name)
+			while len(self._entries) > self.max_size:
+				self._entries.popitem(last=False)
+				self._complete_until = None
+
+	def load(self, projects: list):
+		"""Replaces the cache with a complete project list
+
+		Args:
+			projects (list): Project dictionaries with name and id, as returned by get_projects
+		"""
+		with self._lock:
+			expires = self._clock() + self.ttl
+			self._entries = OrderedDict((project["name"], (project["id"], expires)) for project in projects)
+			self._complete_until = expires if self.negative and len(self._entries) <= self.max_size else None
+			while len(self._entries) > self.max_size:
+				self._entries.popitem(last=False)
+
+	def invalidate(self, name: str = None, project_id: int = None):
+		"""Removes entries by name or id, or clears the cache if neither is given
+
+		Args:
+			name (str, optional): Project name. Defaults to None.
+			project_id (int, optional): Project id. Defaults to None.
+		"""
+		with self._lock:
+			if name is None and project_id is None:
+				self._entries.clear()
+			self._complete_until = None
+			if name is not None:
+				self._entries.pop(name, None)
+			if project_id is not None:
+				for key in [key for key, entry in self._entries.items() if entry[0] == project_id]:
+					del self._entries[key]
@@ -2,20 +2,23 @@ import re
 
 from codedx_api.APIs.BaseAPIClient import (BaseAPIClient, JSONResponseHandler,
                                            ResponseHandler)
+from codedx_api.APIs.ProjectCache import ProjectCache
 
 
 # Projects Client for Code DX Projects API
 class Projects(BaseAPIClient):
-	def __init__(self, base_url: str, api_key: str):
+	def __init__(self, base_url: str, api_key: str, project_cache: ProjectCache = None, **kwargs):
 		"""Definitions for Projects API on CodeDx
 
 		Args:
 			base (str): The CodeDx base URL. https://[CODEDX_INSTANCE]/codedx
 			api_key (str): CodeDx API key
+			project_cache (ProjectCache, optional): Cache of project ids to share. Defaults to a new ProjectCache.
+			**kwargs: Connection pool options passed to BaseAPIClient
 		"""
-		super().__init__(base_url, api_key)
-		#TODO: don't have projects stored locally
-		self.projects = {}
+		# Set before the other APIs are initialized so that they can share the cache
+		self.project_cache = ProjectCache() if project_cache is None else project_cache
+		super().__init__(base_url, api_key, **kwargs)
 
 
 	def __query_criteria(self, filters: dict, limit: int = None, offset: int = None) -> dict:
@@ -47,6 +50,7 @@ class Projects(BaseAPIClient):
 		"""
 		path = '/api/projects'
 		data = JSONResponseHandler(self.get(path)).get_data()
+		self.project_cache.load(data.get('projects', []))
 		return data
 
 
@@ -64,6 +68,10 @@ class Projects(BaseAPIClient):
 			"name": name
 		}
 		data = JSONResponseHandler(self.put(path, params)).get_data()
+		if 'id' in data:
+			self.project_cache.put(name, data['id'])
+		else:
+			self.project_cache.invalidate(name=name)
 		return data
 
 
@@ -82,6 +90,7 @@ class Projects(BaseAPIClient):
 		if new_name:
 			params['name'] = new_name
 		ResponseHandler(self.put(path, json_data=params)).validate()
+		self.project_cache.invalidate(name=new_name, project_id=project)
 		return
 
 
@@ -93,6 +102,7 @@ class Projects(BaseAPIClient):
 		"""
 		path = f'/api/projects/{ project }'
 		ResponseHandler(self.delete(path)).validate()
+		self.project_cache.invalidate(project_id=project)
 		return
 
 
@@ -108,7 +118,7 @@ class Projects(BaseAPIClient):
 			list: List of projects
 		"""
 		path = '/api/projects/query'
-		criteria = self.__query_criteria(filters, offset, limit)
+		criteria = self.__query_criteria(filters, limit, offset)
 		data = JSONResponseHandler(self.post(path, json_data=criteria)).get_data()
 		return data
 
@@ -227,19 +237,46 @@ class Projects(BaseAPIClient):
 			print(f"{ name } ({ pid })")
 
 
-	def get_project_id(self, name: str) -> int:
+	def get_project_id(self, name: str, use_cache: bool = True) -> int:
 		"""Gets the project id
 
 		Args:
 			name (str): Name of the project on CodeDx
+			use_cache (bool, optional): Answer from the project cache when possible. Defaults to True.
 
 		Returns:
 			int: Project id
 		"""
+		if use_cache:
+			found, project_id = self.project_cache.lookup(name)
+			if found:
+				return project_id
 		filters = {
 			"name": name
 		}
 		projects = self.query_projects(filters)
 		project_id = next((project["id"] for project in projects if project["name"] == name), None)
+		if project_id is not None:
+			self.project_cache.put(name, project_id)
 
 		return project_id
+
+
+	def get_project_ids(self, names: list) -> dict:
+		"""Gets the ids of many projects, with at most one get_projects request
+
+		Args:
+			names (list): Names of projects on CodeDx
+
+		Returns:
+			dict: Project names to ids, None for projects that do not exist
+		"""
+		ids = {}
+		for name in names:
+			found, project_id = self.project_cache.lookup(name)
+			if not found:
+				projects = self.get_projects()['projects']
+				loaded = {project["name"]: project["id"] for project in projects}
+				return {name: loaded.get(name) for name in names}
+			ids[name] = project_id
+		return ids
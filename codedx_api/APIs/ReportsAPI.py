@@ -4,34 +4,41 @@ from codedx_api.APIs import Projects
 from codedx_api.APIs.BaseAPIClient import BaseAPIClient, JSONResponseHandler
 
 
+REPORT_COLUMNS = [
+	"projectHierarchy",
+	"id",
+	"creationDate",
+	"updateDate",
+	"severity",
+	"status",
+	"cwe",
+	"rule",
+	"tool",
+	"location",
+	"element",
+	"loc.path",
+	"loc.line"
+]
+
+MAC_ADDRESS_PATTERN = "^([0-9A-Fa-f]{2}:){5}([0-9A-Fa-f]{2})$"
+HOST_ADDRESS_PATTERN = "^((25[0-5]|2[0-4][0-9]|[01]?[0-9]?[0-9])\\.){3}((25[0-5]|2[0-4][0-9]|[01]?[0-9]?[0-9]))$"
+
+
 # Reports Client for Code DX Projects API
 class Reports(BaseAPIClient):
-	def __init__(self, base, api_key):
+	def __init__(self, base, api_key, **kwargs):
 		""" Creates an API Client for Code DX Projects API
 
 			Args:
 				base: String representing base url from Code DX
 				api_key: String representing API key from Code DX
 				verbose: Boolean - not supported yet
+				**kwargs: Connection pool options passed to BaseAPIClient
 
 		"""
-		super().__init__(base, api_key)
-		self.report_columns = [
-			"projectHierarchy",
-			"id",
-			"creationDate",
-			"updateDate",
-			"severity",
-			"status",
-			"cwe",
-			"rule",
-			"tool",
-			"location",
-			"element",
-			"loc.path",
-			"loc.line"
-		]
-		self.projects_api = Projects(base, api_key)
+		super().__init__(base, api_key, **kwargs)
+		self.report_columns = list(REPORT_COLUMNS)
+		self.projects_api = Projects(base, api_key, project_cache=getattr(self, 'project_cache', None), session=self.session, timeout=self.timeout)
 
 	def report_types(self, project: int) -> dict:
 		"""Provides a list of report types for a project.
@@ -43,7 +50,7 @@ class Reports(BaseAPIClient):
 			dict: Report types and report configuration options
 		"""
 		path = f'/api/projects/{ project }/report/types'
-		data = JSONResponseData(self.get(path)).get_data()
+		data = JSONResponseHandler(self.get(path)).get_data()
 		return data
 
 	def generate(self, project: int, report_type: str, config: dict, filters: dict = None) -> dict:
@@ -177,7 +184,7 @@ class Reports(BaseAPIClient):
 		Returns:
 			dict: Data about the queued reporting task wth jobId and inputID
 		"""		
-		if re.search(mac_address, "^([0-9A-Fa-f]{2}:){5}([0-9A-Fa-f]{2})$") is None:
+		if mac_address and re.search(MAC_ADDRESS_PATTERN, mac_address) is None:
 			raise RuntimeError("Nessus report not given a valid mac address.")
 		config = {
 			"defaultHost": default_host,
@@ -200,7 +207,7 @@ class Reports(BaseAPIClient):
 		Returns:
 			dict: Data about the queued reporting task wth jobId and inputID
 		"""		
-		if re.search(host_address, "^((25[0-5]|2[0-4][0-9]|[01]?[0-9]?[0-9])\\.){3}((25[0-5]|2[0-4][0-9]|[01]?[0-9]?[0-9]))$") is None:
+		if host_address and re.search(HOST_ADDRESS_PATTERN, host_address) is None:
 			raise RuntimeError("NBE report not given a valid IPv4 address.")
 		config = {
 			"hostAddresss": host_address
@@ -0,0 +1,62 @@
+from collections import defaultdict
+
+from codedx_api.APIs.FindingFields import field_value
+from codedx_api.APIs.FindingRecord import Finding
+
+
+def finding_location(finding):
+	"""Returns (id, path, line) for a finding table row, metadata dict or Finding record"""
+	if isinstance(finding, Finding):
+		return finding.id, finding.path, finding.line
+	return field_value(finding, "id"), field_value(finding, "path"), field_value(finding, "line")
+
+
+def group_windows(findings, context: int = 3) -> dict:
+	"""Groups the line windows needed for each finding by file
+
+	Findings without a path or line are skipped.
+
+	Args:
+		findings (Iterable): Finding table rows, metadata or Finding records
+		context (int, optional): Lines kept before and after the finding line. Defaults to 3.
+
+	Returns:
+		dict: path -> list of (finding id, first line, finding line, last line)
+	"""
+	files = defaultdict(list)
+	for finding in findings:
+		finding_id, path, line = finding_location(finding)
+		if path is None or line is None:
+			continue
+		line = int(line)
+		files[path].append((finding_id, max(1, line - context), line, line + context))
+	return files
+
+
+def slice_windows(content, windows: list) -> dict:
+	"""Cuts the line windows out of a file in a single pass over its lines
+
+	Args:
+		content (bytes | str): File content
+		windows (list): (finding id, first line, finding line, last line) tuples, line numbers starting at 1
+
+	Returns:
+		dict: finding id -> {"start": first line, "line": finding line, "lines": [str]}
+	"""
+	if isinstance(content, bytes):
+		content = content.decode("utf-8", errors="replace")
+	pending = sorted(windows, key=lambda window: window[1])
+	snippets = {finding_id: {"start": start, "line": line, "lines": []} for finding_id, start, line, _ in pending}
+	last = max((window[3] for window in pending), default=0)
+	active = []
+	position = 0
+	for number, text in enumerate(content.splitlines(), 1):
+		if number > last:
+			break
+		while position < len(pending) and pending[position][1] <= number:
+			active.append(pending[position])
+			position += 1
+		active = [window for window in active if window[3] >= number]
+		for window in active:
+			snippets[window[0]]["lines"].append(text)
+	return snippets
@@ -0,0 +1,130 @@
+import time
+import uuid
+import zipfile
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+class _ChunkSink(object):
+	"""Write-only, unseekable buffer that hands written bytes back to a generator"""
+
+	def __init__(self):
+		self.chunks = []
+
+	def write(self, data) -> int:
+		self.chunks.append(bytes(data))
+		return len(data)
+
+	def flush(self):
+		pass
+
+	def drain(self) -> bytes:
+		data = b"".join(self.chunks)
+		self.chunks = []
+		return data
+
+
+def iter_source(source, chunk_size: int = UPLOAD_CHUNK_SIZE):
+	"""Yields the content of an upload source in chunks
+
+	Args:
+		source (str | file | bytes | Iterable[bytes]): File path, readable binary file object, bytes or an iterator of bytes
+		chunk_size (int, optional): Bytes read per chunk from paths and file objects. Defaults to 1 MiB.
+	"""
+	if isinstance(source, str):
+		with open(source, 'rb') as f:
+			yield from iter_source(f, chunk_size)
+	elif hasattr(source, 'read'):
+		chunk = source.read(chunk_size)
+		while chunk:
+			yield chunk
+			chunk = source.read(chunk_size)
+	elif isinstance(source, (bytes, bytearray)):
+		yield bytes(source)
+	else:
+		for chunk in source:
+			if chunk:
+				yield chunk
+
+
+def zip_stream(chunks, arcname: str):
+	"""Compresses chunks into a single-entry zip archive while they are read
+
+	Nothing is buffered beyond the compressor output for the current chunk.
+
+	Args:
+		chunks (Iterable[bytes]): Uncompressed content
+		arcname (str): Name of the file inside the archive
+	"""
+	sink = _ChunkSink()
+	with zipfile.ZipFile(sink, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+		with archive.open(arcname, 'w', force_zip64=True) as entry:
+			for chunk in chunks:
+				entry.write(chunk)
+				data = sink.drain()
+				if data:
+					yield data
+	data = sink.drain()
+	if data:
+		yield data
+
+
+def multipart_stream(chunks, file_name: str, file_type: str, boundary: str, field: str = 'file'):
+	"""Wraps chunks of file content in a multipart/form-data body with a single file field
+
+	Args:
+		chunks (Iterable[bytes]): File content
+		file_name (str): File name sent to CodeDx
+		file_type (str): Content type of the file
+		boundary (str): Multipart boundary
+		field (str, optional): Form field name. Defaults to 'file'.
+	"""
+	yield (
+		f'--{ boundary }\r\n'
+		f'Content-Disposition: form-data; name="{ field }"; filename="{ file_name }"\r\n'
+		f'Content-Type: { file_type }\r\n\r\n'
+	).encode()
+	yield from chunks
+	yield f'\r\n--{ boundary }--\r\n'.encode()
+
+
+def track_progress(chunks, progress):
+	"""Reports the bytes sent and the average rate in bytes/sec after every chunk
+
+	Args:
+		chunks (Iterable[bytes]): Request body
+		progress (Callable[[int, float], None]): Called with (bytes sent, bytes per second)
+	"""
+	start = time.monotonic()
+	sent = 0
+	for chunk in chunks:
+		yield chunk
+		sent += len(chunk)
+		elapsed = time.monotonic() - start
+		progress(sent, sent / elapsed if elapsed > 0 else 0.0)
+
+
+def upload_body(file_data: dict, compress: bool = False, progress=None, chunk_size: int = UPLOAD_CHUNK_SIZE):
+	"""Builds a streaming multipart body for an upload
+
+	Args:
+		file_data (dict): 'source', 'file_name' and 'file_type' of the upload
+		compress (bool, optional): Zip the source while it is sent. Defaults to False.
+		progress (Callable[[int, float], None], optional): Progress callback. Defaults to None.
+		chunk_size (int, optional): Bytes read per chunk from the source. Defaults to 1 MiB.
+
+	Returns:
+		tuple: Content type header value and an iterator over the body
+	"""
+	file_name = file_data['file_name']
+	file_type = file_data['file_type']
+	chunks = iter_source(file_data['source'], chunk_size)
+	if compress:
+		chunks = zip_stream(chunks, file_name)
+		file_name = f'{ file_name }.zip'
+		file_type = 'application/zip'
+	boundary = uuid.uuid4().hex
+	body = multipart_stream(chunks, file_name, file_type, boundary)
+	if progress:
+		body = track_progress(body, progress)
+	return f'multipart/form-data; boundary={ boundary }', body
@@ -0,0 +1,96 @@
+import hashlib
+import json
+import os
+import threading
+import time
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def file_digest(file_name: str, chunk_size: int = HASH_CHUNK_SIZE) -> str:
+	"""Returns the sha256 of a file, read in chunks so files of any size hash with constant memory"""
+	digest = hashlib.sha256()
+	with open(file_name, 'rb') as f:
+		for chunk in iter(lambda: f.read(chunk_size), b""):
+			digest.update(chunk)
+	return digest.hexdigest()
+
+
+class AnalysisManifest(object):
+
+	def __init__(self, path: str = None):
+		"""Record of the scan files behind each project's last analysis
+
+		Every analysis is stored with the file name and sha256 of each uploaded file, keyed by project name.
+		When a project is analyzed again with byte-identical files, the previous analysis can be reused
+		instead of uploading and analyzing the files again. The manifest is saved after every change.
+
+		Args:
+			path (str, optional): JSON file the manifest is loaded from and saved to. Defaults to None.
+		"""
+		self.path = path
+		self._projects = {}
+		self._lock = threading.Lock()
+		if path and os.path.exists(path):
+			with open(path) as f:
+				self._projects = json.load(f)
+
+	def __len__(self):
+		return len(self._projects)
+
+	@staticmethod
+	def digest(file_names: list) -> list:
+		"""Hashes scan files
+
+		Files are identified by name without directory, so the same build in another checkout still matches,
+		and every file keeps its own entry even when several share a name.
+
+		Args:
+			file_names (list): Scan files
+
+		Returns:
+			list: Sorted [file name, sha256] pairs
+		"""
+		return sorted([os.path.basename(file_name), file_digest(file_name)] for file_name in file_names)
+
+	def lookup(self, project: str, digests: list) -> int:
+		"""Returns the id of the project's last analysis if it was run on exactly these files, otherwise None
+
+		Args:
+			project (str): CodeDx project name
+			digests (list): File hashes from digest()
+		"""
+		with self._lock:
+			entry = self._projects.get(project)
+		if entry and entry["files"] == digests:
+			return entry["analysis"]
+		return None
+
+	def record(self, project: str, digests: list, analysis: int):
+		"""Stores the files and id of a finished analysis
+
+		Args:
+			project (str): CodeDx project name
+			digests (list): File hashes from digest()
+			analysis (int): Analysis id
+		"""
+		with self._lock:
+			self._projects[project] = {"files": digests, "analysis": analysis, "recorded": time.time()}
+		self.save()
+
+	def forget(self, project: str):
+		"""Drops a project, so its next analysis always uploads its files"""
+		with self._lock:
+			self._projects.pop(project, None)
+		self.save()
+
+	def save(self):
+		"""Writes the manifest to its file, if one was given"""
+		if not self.path:
+			return
+		with self._lock:
+			data = dict(self._projects)
+			partial = f"{ self.path }.part"
+			with open(partial, 'w') as f:
+				json.dump(data, f)
+			os.replace(partial, self.path)
@@ -0,0 +1,202 @@
+from codedx_api.APIs.AnalysisAPI import get_file_data
+from codedx_api.APIs.BaseAPIClient import JSONResponseHandler, ResponseHandler
+from codedx_api.AsyncAPIs.AsyncBaseAPIClient import AsyncBaseAPIClient
+
+
+# Asynchronous Analysis API Client for Code DX Projects API
+class AsyncAnalysis(AsyncBaseAPIClient):
+
+
+	async def create_analysis(self, project: int) -> dict:
+		"""Create a new Analysis Prep associated with a particular project.
+
+		Args:
+			project (int): project id
+
+		Returns:
+			dict: new Analysis Prep as JSON
+		"""
+		path = '/api/analysis-prep'
+		params = {"projectId": project}
+		data = JSONResponseHandler(await self.post(path, params)).get_data()
+		return data
+
+
+	async def get_prep(self, prep_id: str) -> dict:
+		"""Get lists of Input IDs and Verification Errors for an Analysis Prep.
+
+		Args:
+			prep_id (str): Analysis Prep id
+
+		Returns:
+			dict: input ids and verification errors
+		"""
+		path = f'/api/analysis-prep/{ prep_id }'
+		data = JSONResponseHandler(await self.get(path)).get_data()
+		return data
+
+
+	async def upload_analysis(self, prep_id: str, file_name: str, client_request_id: str = None) -> dict:
+		"""Analysis Preps should be populated by uploading files to Code Dx.
+
+		This will create a job to determine the contents of the file.
+		Args:
+			prep_id (str): Analysis Prep ID
+			file_name (str): File for analysis
+			client_request_id (str, optional): Arbitrary identifier used to make modifications to analysis later. Defaults to None.
+
+		Returns:
+			dict: Data about the job created
+		"""
+		path = f'/api/analysis-prep/{ prep_id }/upload'
+		file_data = get_file_data(file_name)
+		headers = {}
+		if client_request_id:
+			headers['X-Client-Request-Id'] = client_request_id
+		data = JSONResponseHandler(await self.upload(path, file_data=file_data, local_headers=headers)).get_data()
+		return data
+
+
+	async def get_input_metadata(self, prep_id: str, input_id: str) -> dict:
+		"""Get metadata for an input of an Analysis Prep
+
+		Args:
+			prep_id (str): Prep ID
+			input_id (str): Input ID
+
+		Returns:
+			dict: Input data
+		"""
+		path = f'/api/analysis-prep/{ prep_id }/{ input_id }'
+		data = JSONResponseHandler(await self.get(path)).get_data()
+		return data
+
+
+	async def delete_input(self, prep_id: str, input_id: str):
+		"""Delete an input
+
+		Args:
+			prep_id (str): Prep ID
+			input_id (str): Input ID
+		"""
+		path = f'/api/analysis-prep/{ prep_id }/{ input_id }'
+		ResponseHandler(await self.delete(path)).validate()
+		return
+
+
+	async def delete_pending(self, prep_id: str, client_request_id: str):
+		"""Delete input that is still pending and has no input ID yet
+
+		Args:
+			prep_id (str): Prep ID
+			client_request_id (str): X-Client-Request-Id used to upload input
+		"""
+		path = f'/api/analysis-prep/{ prep_id }/pending'
+		headers = {'X-Client-Request-Id': client_request_id}
+		ResponseHandler(await self.delete(path, local_headers=headers)).validate()
+		return
+
+
+	async def toggle_display_tag(self, prep_id: str, input_id: str, tag_id: str, enabled: bool) -> dict:
+		"""Enable and disable individual display tags on individual prop inputs.
+
+		Args:
+			prep_id (str): Prep ID
+			input_id (str): Input ID
+			tag_id (str): Tag ID
+			enabled (bool): True to enable, False to disable
+
+		Returns:
+			dict: Input Display Info object as JSON, representing the new state of the input
+		"""
+		path = f'/api/analysis-prep/{ prep_id }/{ input_id }/tag/{ tag_id }'
+		params = {"enabled": enabled}
+		data = JSONResponseHandler(await self.put(path, json_data=params)).get_data()
+		return data
+
+
+	async def run_analysis(self, prep_id: str) -> dict:
+		"""Start an analysis
+
+		Args:
+			prep_id (str): Analysis prep id
+
+		Returns:
+			dict: Analysis ID and Job ID for analysis
+		"""
+		path = f'/api/analysis-prep/{ prep_id }/analyze'
+		data = JSONResponseHandler(await self.post(path)).get_data()
+		return data
+
+
+	async def get_all_analysis(self, project: int) -> list:
+		"""Get list of analysis details for analysis associated with a project
+
+		Args:
+			project (int): Project ID
+
+		Returns:
+			list: List of analysis details
+		"""
+		path = f'/api/projects/{ project }/analyses'
+		data = JSONResponseHandler(await self.get(path)).get_data()
+		return data
+
+
+	async def get_analysis(self, project: int, analysis: int) -> dict:
+		"""Obtain analysis details, such as start and finish times
+
+		Args:
+			project (int): Project ID
+			analysis (int): Analysis ID
+
+		Returns:
+			dict: Analysis details
+		"""
+		path = f'/api/projects/{ project }/analyses/{ analysis }'
+		data = JSONResponseHandler(await self.get(path)).get_data()
+		return data
+
+
+	async def name_analysis(self, project: int, analysis: int, name: str):
+		"""Set a name for a specific analysis
+
+		Args:
+			project (int): Project ID
+			analysis (int): Analysis ID
+			name (str): New analysis name
+		"""
+		path = f'/api/projects/{ project }/analyses/{ analysis }'
+		params = {"name": name}
+		ResponseHandler(await self.put(path, json_data=params)).validate()
+		return
+
+
+	async def enable_display_tag(self, prep_id: str, input_id: str, tag_id: str) -> dict:
+		"""Enable an individual display tag on individual prop inputs.
+
+		Args:
+			prep_id (str): Prep ID
+			input_id (str): Input ID
+			tag_id (str): Tag
+
+		Returns:
+			dict: Input Display Info object as JSON, representing the new state of the input
+		"""
+		data = await self.toggle_display_tag(prep_id, input_id, tag_id, True)
+		return data
+
+
+	async def disable_display_tag(self, prep_id: str, input_id: str, tag_id: str) -> dict:
+		"""Disable an individual display tag on individual prop inputs.
+
+		Args:
+			prep_id (str): Prep ID
+			input_id (str): Input ID
+			tag_id (str): Tag
+
+		Returns:
+			dict: Input Display Info object as JSON, representing the new state of the input
+		"""
+		data = await self.toggle_display_tag(prep_id, input_id, tag_id, False)
+		return data
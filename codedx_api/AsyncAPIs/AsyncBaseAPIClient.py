@@ -0,0 +1,147 @@
+from codedx_api.APIs.BaseAPIClient import (DOWNLOAD_CHUNK_SIZE,
+                                           ContentResponseHandler, ContentType,
+                                           open_destination)
+
+try:
+	import httpx
+except ImportError:
+	httpx = None
+
+
+class AsyncBaseAPIClient(object):
+
+	def __init__(self,
+		base_url: str,
+		api_key: str,
+		max_connections: int = 100,
+		max_keepalive_connections: int = 20,
+		keepalive_expiry: float = 5.0,
+		timeout: float = None,
+		client=None):
+		"""Constructor for the asynchronous base CodeDx API client
+
+		Requests are sent with a pooled httpx.AsyncClient, so many calls can be in flight on a single event loop.
+		Responses are checked with the same response handlers as the synchronous client.
+
+		Args:
+			base_url (str): The CodeDx base url. Must be in the correct format: https://[CODEDX-HOST]/codedx
+			api_key (str): An API key from CodeDx.
+			max_connections (int, optional): Maximum number of concurrent connections. Defaults to 100.
+			max_keepalive_connections (int, optional): Maximum number of idle connections kept open. Defaults to 20.
+			keepalive_expiry (float, optional): Seconds an idle connection is kept open. Defaults to 5.0.
+			timeout (float, optional): Timeout in seconds for every request, None waits forever. Defaults to None.
+			client (httpx.AsyncClient, optional): Existing client to share. It is not closed by this client. Defaults to None.
+
+		Raises:
+			ImportError: httpx is not installed.
+		"""
+		if httpx is None:
+			raise ImportError("The asynchronous CodeDx client requires httpx. Install it with: pip install codedx_api[async]")
+		self.base_url = base_url
+		self.api_key = api_key
+		self.timeout = timeout
+		self.headers = {
+			'API-Key': self.api_key,
+			'accept': 'application/json',
+			'Content-Type': 'application/json'
+		}
+		self._owns_client = client is None
+		if client is None:
+			limits = httpx.Limits(
+				max_connections=max_connections,
+				max_keepalive_connections=max_keepalive_connections,
+				keepalive_expiry=keepalive_expiry
+			)
+			client = httpx.AsyncClient(limits=limits, timeout=timeout)
+		self.client = client
+
+	async def aclose(self):
+		"""Closes the pooled connections if the HTTP client is owned by this client"""
+		if self._owns_client:
+			await self.client.aclose()
+
+	async def __aenter__(self):
+		return self
+
+	async def __aexit__(self, exc_type, exc_value, traceback):
+		await self.aclose()
+
+	def _compose_url(self, path: str):
+		return self.base_url + path
+
+	def _compose_headers(self, local_headers):
+		"""Returns a new header dictionary for a single request, leaving the client headers untouched"""
+		headers = dict(self.headers)
+		if local_headers:
+			headers.update(local_headers)
+		return headers
+
+	async def get(self, path, json_data=None, content_type='application/json;charset=utf-8', local_headers=None, timeout=None):
+		url = self._compose_url(path)
+		headers = self._compose_headers(local_headers)
+		if timeout is None:
+			res = await self.client.get(url, headers=headers)
+		else:
+			res = await self.client.get(url, headers=headers, timeout=timeout)
+		return res
+
+	async def download(self, path, json_data=None, content_type='application/json;charset=utf-8', local_headers=None):
+		url = self._compose_url(path)
+		headers = self._compose_headers(local_headers)
+		res = await self.client.get(url, headers=headers)
+		return res
+
+	async def download_to(self, path, accept: ContentType, destination, chunk_size: int = DOWNLOAD_CHUNK_SIZE, local_headers=None) -> int:
+		"""Streams file content to a destination, validating the response headers before the body is read
+
+		Args:
+			path (str): API path
+			accept (ContentType): Expected content type
+			destination (str | file): File path or writable binary file object
+			chunk_size (int, optional): Bytes read per chunk. Defaults to 1 MiB.
+			local_headers (dict, optional): Extra request headers. Defaults to None.
+
+		Returns:
+			int: Number of bytes written
+		"""
+		url = self._compose_url(path)
+		headers = self._compose_headers(local_headers)
+		written = 0
+		async with self.client.stream('GET', url, headers=headers) as res:
+			if res.status_code > 299:
+				await res.aread()
+			ContentResponseHandler(res, accept).validate()
+			with open_destination(destination) as f:
+				async for chunk in res.aiter_bytes(chunk_size):
+					f.write(chunk)
+					written += len(chunk)
+		return written
+
+	async def post(self, path, json_data=None, content_type='application/json;charset=utf-8', local_headers=None):
+		url = self._compose_url(path)
+		headers = self._compose_headers(local_headers)
+		res = await self.client.post(url, headers=headers, json=json_data)
+		return res
+
+	async def upload(self, path, file_data, local_headers=None):
+		url = self._compose_url(path)
+		headers = self._compose_headers(local_headers)
+		headers.pop('Content-Type', None)
+		with open(file_data['file_path'], 'rb') as f:
+			files = {
+				'file': (file_data['file_name'], f, file_data['file_type'])
+			}
+			res = await self.client.post(url, headers=headers, files=files)
+		return res
+
+	async def put(self, path, json_data, content_type='application/json;charset=utf-8', local_headers=None):
+		url = self._compose_url(path)
+		headers = self._compose_headers(local_headers)
+		res = await self.client.put(url, headers=headers, json=json_data)
+		return res
+
+	async def delete(self, path, json_data=None, content_type='application/json;charset=utf-8', local_headers=None):
+		url = self._compose_url(path)
+		headers = self._compose_headers(local_headers)
+		res = await self.client.delete(url, headers=headers)
+		return res
@@ -0,0 +1,136 @@
+from typing import List
+
+from codedx_api.APIs.BaseAPIClient import (ContentResponseHandler, ContentType,
+                                           JSONResponseHandler)
+from codedx_api.AsyncAPIs.AsyncBaseAPIClient import AsyncBaseAPIClient
+
+
+# Asynchronous Findings API Client for Code DX Projects API
+class AsyncFindings(AsyncBaseAPIClient):
+
+	async def get_finding(self, finding: int, options: List[str] = None) -> dict:
+		"""Returns metadata for the given finding
+
+		Args:
+			finding (int): Finding id
+			options (List[str], optional): The expand parameter is a comma separated list, which can modify the reponse. Defaults to None.
+
+		Returns:
+			dict: Finding metadata
+		"""
+		path = f"/api/findings/{ finding }"
+		if options:
+			expanders = ",".join(options)
+			query = f'?expand={ expanders }'
+			path += query
+		data = JSONResponseHandler(await self.get(path)).get_data()
+		return data
+
+
+	async def get_finding_description(self, finding: int) -> dict:
+		"""Returns the descriptions for the given finding from all available sources.
+
+		Args:
+			finding (int): Finding id
+
+		Returns:
+			dict: Contains the description(s) for the finding
+		"""
+		path = f"/api/findings/{ finding }/description"
+		data = JSONResponseHandler(await self.get(path)).get_data()
+		return data
+
+
+	async def get_finding_history(self, finding: int) -> list:
+		"""Responds with an array of "activity event" objects.
+
+		Args:
+			finding (int): Finding id
+
+		Returns:
+			list: An array of "activity event" objects
+		"""
+		path = f"/api/findings/{ finding }/history"
+		data = JSONResponseHandler(await self.get(path)).get_data()
+		return data
+
+
+	async def get_finding_table(self, project: int, options: List[str] = None, req_body: dict = None) -> list:
+		"""Returns filtered finding table data.
+
+		Args:
+			project (int): Project id
+			options (List[str], optional): The expand parameter is a comma separated list. Defaults to None.
+			req_body (dict, optional): Filters, pagination options. Defaults to None.
+
+		Returns:
+			list: Finding table rows
+		"""
+		path = f"/api/projects/{ project }/findings/table"
+		if options:
+			query = "?expand=" + ",".join(options)
+			path += query
+		if not req_body:
+			req_body = {}
+		data = JSONResponseHandler(await self.post(path, json_data=req_body)).get_data()
+		return data
+
+
+	async def get_finding_count(self, project: int, req_body: dict = None) -> dict:
+		"""Returns the count of all findings in the project matching the given filter.
+
+		Args:
+			project (int): Project ID
+			req_body (dict, optional): Filters, pagination options. Defaults to None.
+
+		Returns:
+			dict: Dictionary with project finding count
+		"""
+		path = f"/api/projects/{ project }/findings/count"
+		if not req_body: req_body = {}
+		data = JSONResponseHandler(await self.post(path, json_data=req_body)).get_data()
+		return data
+
+
+	async def get_finding_group_count(self, project: int, req_body: dict) -> list:
+		"""Returns filtered finding counts, grouped by the specified field.
+
+		Args:
+			project (int): Project ID
+			req_body (dict): Dictionary with "countBy" key and filters.
+
+		Returns:
+			list: Grouped counts
+		"""
+		path = f"/api/projects/{ project }/findings/grouped-counts"
+		data = JSONResponseHandler(await self.post(path, json_data=req_body)).get_data()
+		return data
+
+
+	async def get_finding_flow(self, project: int, req_body: dict) -> list:
+		"""Returns filtered finding flow data.
+
+		Args:
+			project (int): Project ID
+			req_body (dict): Filters
+		Returns:
+			list: Contains the filtered flow data
+		"""
+		path = f"/api/projects/{ project }/findings/flow"
+		data = JSONResponseHandler(await self.post(path, json_data=req_body)).get_data()
+		return data
+
+
+	async def get_finding_file(self, project: int, file_path: str) -> bytes:
+		"""Returns the contents of a given file, as long as it is a text file.
+
+		Args:
+			project (int): Project id
+			file_path (str): The literal path to the file
+
+		Returns:
+			bytes: Contains the requested file's content
+		"""
+		path = f"/api/projects/{ project }/files/tree/{ file_path }"
+		data = ContentResponseHandler(await self.get(path), ContentType.TEXT.text()).get_data()
+		return data
@@ -0,0 +1,46 @@
+from codedx_api.APIs.BaseAPIClient import (DOWNLOAD_CHUNK_SIZE,
+                                           ContentResponseHandler, ContentType,
+                                           JSONResponseHandler)
+from codedx_api.AsyncAPIs.AsyncBaseAPIClient import AsyncBaseAPIClient
+
+
+# Asynchronous Jobs API Client for Code DX Projects API
+class AsyncJobs(AsyncBaseAPIClient):
+
+
+	async def job_status(self, job: str, timeout: float = None) -> dict:
+		"""Queries the status of a running job.
+
+		Args:
+			job (str): Job id
+			timeout (float, optional): Request timeout in seconds. Defaults to the client timeout.
+
+		Returns:
+			dict: Job status
+		"""
+		path = f'/api/jobs/{ job }'
+		data = JSONResponseHandler(await self.get(path, timeout=timeout)).get_data()
+		return data
+
+
+	async def job_result(self, job: str, accept: ContentType, destination=None, chunk_size: int = DOWNLOAD_CHUNK_SIZE):
+		"""Fetches the result from a job.
+
+		When a destination is given the result is streamed to it in chunks, so memory use does not
+		depend on the size of the result. The content type is checked before the body is read.
+
+		Args:
+			job (str): Job ID
+			accept (ContentType): Job content type
+			destination (str | file, optional): File path or writable binary file object for the result. Defaults to None.
+			chunk_size (int, optional): Bytes read per chunk when streaming. Defaults to 1 MiB.
+
+		Returns:
+			bytes: Job result is returned - the response headers and body will match the job result.
+				If a destination is given, the number of bytes written is returned instead.
+		"""
+		path = f'/api/jobs/{ job }/result'
+		if destination is not None:
+			return await self.download_to(path, accept, destination, chunk_size)
+		data = ContentResponseHandler(await self.download(path), accept).get_data()
+		return data
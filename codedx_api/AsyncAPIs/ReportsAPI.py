@@ -0,0 +1,195 @@
+import re
+
+from codedx_api.APIs.BaseAPIClient import JSONResponseHandler
+from codedx_api.APIs.ReportsAPI import (HOST_ADDRESS_PATTERN,
+                                        MAC_ADDRESS_PATTERN, REPORT_COLUMNS)
+from codedx_api.AsyncAPIs.AsyncBaseAPIClient import AsyncBaseAPIClient
+
+
+# Asynchronous Reports Client for Code DX Projects API
+class AsyncReports(AsyncBaseAPIClient):
+	def __init__(self, base, api_key, **kwargs):
+		""" Creates an asynchronous API Client for Code DX Reports API
+
+			Args:
+				base: String representing base url from Code DX
+				api_key: String representing API key from Code DX
+				**kwargs: Connection pool options passed to AsyncBaseAPIClient
+
+		"""
+		super().__init__(base, api_key, **kwargs)
+		self.report_columns = list(REPORT_COLUMNS)
+
+	async def report_types(self, project: int) -> dict:
+		"""Provides a list of report types for a project.
+
+		Args:
+			project (int): Project id
+
+		Returns:
+			dict: Report types and report configuration options
+		"""
+		path = f'/api/projects/{ project }/report/types'
+		data = JSONResponseHandler(await self.get(path)).get_data()
+		return data
+
+	async def generate(self, project: int, report_type: str, config: dict, filters: dict = None) -> dict:
+		"""Allows user to queue a job to generate a report.
+
+		Args:
+			project (int): Project id
+			report_type (str): Report type
+			config (dict): Report configuration options
+			filters (dict, optional): Filters for findings in report. Defaults to None.
+
+		Returns:
+			dict: Data about the queued reporting task wth jobId and inputID
+		"""
+		params = {
+			"config": config
+		}
+		if filters:
+			params["filter"] = filters
+		path = f'/api/projects/{ project }/report/{ report_type }'
+		data = JSONResponseHandler(await self.post(path, json_data=params)).get_data()
+		return data
+
+	async def generate_pdf(self,
+		project: int,
+		summary_mode: str = "simple",
+		details_mode: str = "with-source",
+		include_result_details: bool = False,
+		include_comments: bool = False,
+		include_request_response: bool = False,
+		filters: dict = None) -> dict:
+		"""Allows user to queue a job to generate a PDF report.
+
+		Args:
+			project (int): CodeDx project id
+			summary_mode (str, optional): Summary mode. Defaults to "simple".
+			details_mode (str, optional): Details mode. Defaults to "with-source".
+			include_result_details (bool, optional): Include result details. Defaults to False.
+			include_comments (bool, optional): Include comments. Defaults to False.
+			include_request_response (bool, optional): Include HTTP requests/responses. Defaults to False.
+			filters (dict, optional): Filter findings in the reports. Defaults to None.
+
+		Raises:
+			RuntimeError: Invalid summary mode input.
+			RuntimeError: Invalid details mode input.
+
+		Returns:
+			dict: Data about the queued reporting task wth jobId and inputID
+		"""
+		if not filters:
+			filters = {}
+		if summary_mode not in ["none", "simple", "detailed"]:
+			raise RuntimeError("Invalid summary mode input.")
+		if details_mode not in ["none", "simple", "with-source"]:
+			raise RuntimeError("Invalid details mode input given.")
+		config = {
+			"summaryMode": summary_mode,
+			"detailsMode": details_mode,
+			"includeResultDetails": include_result_details,
+			"includeComments": include_comments,
+			"includeRequestResponse": include_request_response
+		}
+		data = await self.generate(project, "pdf", config, filters)
+		return data
+
+	def get_csv_columns(self) -> list:
+		"""Returns a list of optional columns for a project csv report."""
+		return self.report_columns
+
+	async def generate_csv(self, project: int, cols: list = None) -> dict:
+		"""Allows user to queue a job to generate a CSV report.
+
+		Args:
+			project (int): CodeDx project id.
+			cols (list, optional): Columns to include in CSV report. Defaults to None.
+
+		Returns:
+			dict: Data about the queued reporting task wth jobId and inputID
+		"""
+		if not cols:
+			cols = self.report_columns
+		config = {
+			"columns": cols
+		}
+		data = await self.generate(project, "csv", config)
+		return data
+
+	async def generate_xml(self,
+		project: int,
+		include_standards: bool = False,
+		include_source: bool = False,
+		include_rule_descriptions: bool = True) -> dict:
+		"""Allows user to queue a job to generate a XML report.
+
+		Args:
+			project (int): CodeDx project id.
+			include_standards (bool, optional): Include standards. Defaults to False.
+			include_source (bool, optional): Include source. Defaults to False.
+			include_rule_descriptions (bool, optional): Include rule descriptions. Defaults to True.
+
+		Returns:
+			dict: Data about the queued reporting task wth jobId and inputID
+		"""
+		config = {
+			"includeStandards": include_standards,
+			"includeSource": include_source,
+			"includeRuleDescriptions": include_rule_descriptions
+		}
+		data = await self.generate(project, "xml", config)
+		return data
+
+	async def generate_nessus(self,
+		project: int,
+		default_host: str = None,
+		operating_system: str = "",
+		mac_address: str = "",
+		netBIOS_name: str = "") -> dict:
+		"""Allows user to queue a job to generate a Nessus report.
+
+		Args:
+			project (int): CodeDx project id.
+			default_host (str, optional): Default host. Defaults to None.
+			operating_system (str, optional): Operating system. Defaults to "".
+			mac_address (str, optional): MAC address. Defaults to "".
+			netBIOS_name (str, optional): netBIOS name. Defaults to "".
+
+		Raises:
+			RuntimeError: Raise if given an invalid mac address.
+
+		Returns:
+			dict: Data about the queued reporting task wth jobId and inputID
+		"""
+		if mac_address and re.search(MAC_ADDRESS_PATTERN, mac_address) is None:
+			raise RuntimeError("Nessus report not given a valid mac address.")
+		config = {
+			"defaultHost": default_host,
+			"operatingSystem": operating_system,
+			"macAddress": mac_address,
+			"netBIOSName": netBIOS_name
+		}
+		data = await self.generate(project, "nessus", config)
+		return data
+
+	async def generate_nbe(self, project: int, host_address: str = None) -> dict:
+		"""Allows user to queue a job to generate a NBE report.
+
+		Args:
+			project (int): CodeDx project id.
+			host_address (str, optional): IP address. Defaults to None.
+
+		Raises:
+			RuntimeError: Given an invalid host address
+		Returns:
+			dict: Data about the queued reporting task wth jobId and inputID
+		"""
+		if host_address and re.search(HOST_ADDRESS_PATTERN, host_address) is None:
+			raise RuntimeError("NBE report not given a valid IPv4 address.")
+		config = {
+			"hostAddresss": host_address
+		}
+		data = await self.generate(project, "nbe", config)
+		return data
@@ -0,0 +1,7 @@
+"""Initialize"""
+from .ActionsAPI import AsyncActions
+from .AnalysisAPI import AsyncAnalysis
+from .FindingsAPI import AsyncFindings
+from .JobsAPI import AsyncJobs
+from .ProjectsAPI import AsyncProjects
+from .ReportsAPI import AsyncReports
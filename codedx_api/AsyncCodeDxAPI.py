@@ -0,0 +1,249 @@
+import asyncio
+import logging
+from typing import List
+
+from codedx_api.APIs.BaseAPIClient import ContentType
+from codedx_api.AsyncAPIs import (AsyncActions, AsyncAnalysis, AsyncFindings,
+                                  AsyncJobs, AsyncProjects, AsyncReports)
+from codedx_api.JobPolling import PollingStrategy, async_poll_job
+
+
+class AsyncCodeDx(AsyncProjects, AsyncReports, AsyncJobs, AsyncAnalysis, AsyncActions, AsyncFindings):
+
+
+	def __init__(self, base: str, api_key: str, verbose: bool = False, polling: PollingStrategy = None, **kwargs):
+		"""Asynchronous CodeDx API
+
+		Mirrors CodeDx with coroutines on a non-blocking httpx transport, so a single event loop
+		can drive many CodeDx operations at once. Use the client as an async context manager or
+		await aclose() to release its connections. Requires the optional httpx dependency.
+
+		Args:
+			base (str): CodeDx URL. Should be in the form of "https://[your-instance]/codedx".
+			api_key (str): API Key from CodeDx.
+			verbose (bool): Set logging level to info.
+			polling (PollingStrategy, optional): Default schedule for waiting on jobs. Defaults to PollingStrategy().
+			**kwargs: Connection pool options (max_connections, max_keepalive_connections, keepalive_expiry, timeout, client).
+		"""
+		super().__init__(base, api_key, **kwargs)
+		self.polling = polling or PollingStrategy()
+		if verbose:
+			logging.basicConfig(
+				level=logging.INFO,
+				format='[CODEDX-API %(levelname)s] %(message)s'
+			)
+		else:
+			logging.basicConfig(
+				format='[CODEDX-API %(levelname)s] %(message)s'
+			)
+
+
+	def download_report(self, data: bytes, file_name: str) -> None:
+		"""Write data to file
+
+		Args:
+			data (bytes): Data from CodeDx
+			file_name (str): Name of file
+		"""
+		with open(file_name, 'wb') as f:
+			f.write(data)
+
+
+	async def poll_job(self, job: dict, job_desc: str = "Waiting for job.", polling: PollingStrategy = None) -> tuple:
+		"""Waits for job to complete without blocking the event loop and reports how the wait went.
+
+		Args:
+			job (dict): Job object from CodeDx.
+			job_desc (str, optional): Message for debugging. Defaults to "Waiting for job.".
+			polling (PollingStrategy, optional): Polling schedule for this wait. Defaults to the client strategy.
+
+		Raises:
+			RuntimeError: The job failed, was cancelled or timed out.
+
+		Returns:
+			tuple: Job object and WaitStats with the number of polls and the wall time of the wait
+		"""
+		logging.info(job_desc)
+		job, stats = await async_poll_job(self.job_status, job, polling or self.polling, job_desc)
+		logging.info(f"Job { stats.job_id } { stats.status } after { stats.polls } polls in { round(stats.elapsed, 1) }s.")
+		return job, stats
+
+
+	async def wait_for_job(self, job: dict, job_desc: str = "Waiting for job.", polling: PollingStrategy = None) -> dict:
+		"""Waits for job to complete without blocking the event loop.
+
+		Args:
+			job (dict): Job object from CodeDx.
+			job_desc (str, optional): Message for debugging. Defaults to "Waiting for job.".
+			polling (PollingStrategy, optional): Polling schedule for this wait. Defaults to the client strategy.
+
+		Returns:
+			dict: Job object
+		"""
+		job, _ = await self.poll_job(job, job_desc, polling)
+		return job
+
+
+	async def get_report(self, job: dict, content_type: ContentType, file_name) -> None:
+		"""Given a report generation job, downloads a report.
+
+		The report is streamed to disk in chunks rather than held in memory.
+
+		Args:
+			job (dict): Job object for report generation
+			content_type (ContentType): Report type
+			file_name (str | file): Name of file or writable binary file object for downloaded report
+		"""
+		description = f"Waiting for { content_type } report generation."
+		await self.wait_for_job(job, description)
+		logging.info("Report successfully generated. Downloading report.")
+		await self.job_result(job["jobId"], content_type, destination=file_name)
+		return
+
+
+	async def get_pdf(self,
+			project: str,
+			summary_mode: str = "simple",
+			details_mode: str = "with-source",
+			include_result_details: bool = False,
+			include_comments: bool = False,
+			include_request_response: bool = False,
+			file_name: str = 'report.pdf',
+			filters: dict = None) -> None:
+		"""Download a project report in PDF format.
+
+		Args:
+			project (str): CodeDx project name
+			summary_mode (str, optional): Report summary type. Defaults to "simple".
+			details_mode (str, optional): Report details. Defaults to "with-source".
+			include_result_details (bool, optional): Include result details. Defaults to False.
+			include_comments (bool, optional): Include comments. Defaults to False.
+			include_request_response (bool, optional): Include HTTP requests/responses. Defaults to False.
+			file_name (str, optional): Name for report file. Defaults to 'report.pdf'.
+			filters (dict, optional): Report filters. Defaults to None.
+		"""
+		pid = await self.get_project_id(project)
+		if not filters:
+			filters = {}
+		job = await self.generate_pdf(pid, summary_mode, details_mode, include_result_details, include_comments, include_request_response, filters)
+		await self.get_report(job, ContentType.PDF, file_name)
+		return
+
+
+	async def get_csv(self, project: str, cols: list = None, file_name: str = 'report.csv') -> None:
+		"""Download a project report in CSV format.
+
+		Args:
+			project (str): CodeDx project name
+			cols (list[str], optional): List of columns, will include all columns in None specified. Defaults to None.
+			file_name (str, optional): Name for report file. Defaults to 'report.csv'.
+		"""
+		pid = await self.get_project_id(project)
+		if not cols:
+			cols = self.get_csv_columns()
+		job = await self.generate_csv(pid, cols)
+		await self.get_report(job, ContentType.CSV, file_name)
+		return
+
+
+	async def get_xml(self,
+		project: str,
+		include_standards: bool = False,
+		include_source: bool = False,
+		include_rule_descriptions: bool = True,
+		file_name: str = 'report.xml') -> None:
+		"""Download a project report in XML format.
+
+		Args:
+			project (str): CodeDx project name
+			include_standards (bool, optional): List standards violations. Defaults to False.
+			include_source (bool, optional): Include source code snippets. Defaults to False.
+			include_rule_descriptions (bool, optional): Include rule descriptions. Defaults to True.
+			file_name (str, optional): Name for report file. Defaults to 'report.xml'.
+		"""
+		pid = await self.get_project_id(project)
+		job = await self.generate_xml(pid, include_standards, include_source, include_rule_descriptions)
+		await self.get_report(job, ContentType.XML, file_name)
+		return
+
+
+	async def upload_run_analysis(self, project: int, file_names: List[str]) -> dict:
+		"""Upload several vulnerability scans to one analysis prep and start a single analysis.
+
+		The files are uploaded concurrently and their input jobs are waited on together.
+
+		Args:
+			project (int): CodeDx project id.
+			file_names (List[str]): Files to upload.
+
+		Raises:
+			RuntimeError: A file failed to upload or its input job failed.
+			ValueError: The analysis prep has verification errors.
+
+		Returns:
+			dict: Analysis ID and Job ID for the analysis.
+		"""
+		prep = await self.create_analysis(project)
+		prep_id = prep["prepId"]
+		logging.info(f"Uploading { len(file_names) } reports to analysis prep { prep_id }.")
+
+		async def upload(file_name):
+			job = await self.upload_analysis(prep_id, file_name)
+			return await self.wait_for_job(job, f"Analyzing external report content: { file_name }")
+
+		results = await asyncio.gather(*[upload(file_name) for file_name in file_names], return_exceptions=True)
+		failed = [file_name for file_name, result in zip(file_names, results) if isinstance(result, Exception)]
+		if failed:
+			for file_name, result in zip(file_names, results):
+				if isinstance(result, Exception):
+					logging.warning(f"Upload of { file_name } failed: { result }")
+			raise RuntimeError(f"Failed to upload external reports: { failed }")
+		prep = await self.get_prep(prep_id)
+		if 'verificationErrors' in prep and len(prep['verificationErrors']) > 0:
+			logging.warning(f"Verification Errors in { file_names }: { prep['verificationErrors'] }")
+			raise ValueError("Fix verification errors in external vulnerability report.")
+		return await self.run_analysis(prep_id)
+
+
+	async def analyze(self, project: str, file_name) -> dict:
+		"""Upload one or more vulnerability scans and run a single analysis.
+
+		Args:
+			project (str): CodeDx project name.
+			file_name (str | List[str]): File or files to upload.
+
+		Raises:
+			Exception: ValueError if there are errors in the file uploaded.
+
+		Returns:
+			dict: Analysis object.
+		"""
+		file_names = [file_name] if isinstance(file_name, str) else list(file_name)
+		logging.info(f"Creating analysis for { project }.")
+		pid = await self.get_project_id(project)
+		if not pid:
+			logging.info(f"Project name { project } did not exist, creating new project.")
+			new_project = await self.create_project(project)
+			pid = new_project["id"]
+		analysis_job = await self.upload_run_analysis(pid, file_names)
+		await self.wait_for_job(analysis_job, f"Running analysis for { project }.")
+		analysis = await self.get_analysis(pid, analysis_job["analysisId"])
+		logging.info(f"Analysis complete. Vulnerability reports { file_names } successsfully uploaded to { project }.")
+		return analysis
+
+
+	async def update_statuses(self, project: str, status: str = "false-positive", filters: dict = None) -> None:
+		"""Update status of findings in a project.
+
+		Args:
+			project (str): CodeDx project name.
+			status (str, optional): New issue status. Defaults to "false-positive".
+			filters (dict, optional): Apply status to filtered findings. Defaults to None.
+		"""
+		pid = await self.get_project_id(project)
+		if not filters:
+			filters = {}
+		logging.info(f"Updating statuses in { project }.")
+		job = await self.bulk_status_update(pid, status, filters)
+		await self.wait_for_job(job, "Waiting for statuses to update.")
+		logging.info(f"Completed bulk status update \"{ status }\" for project { project }.")
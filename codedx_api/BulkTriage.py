@@ -0,0 +1,133 @@
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from codedx_api.JobPolling import PollingStrategy, run_timeout
+from codedx_api.JobTracker import JobTracker
+
+
+class TriageResult(object):
+
+	def __init__(self, project, status: str, filters: dict = None):
+		"""Outcome of one bulk status update
+
+		Args:
+			project (str | int): CodeDx project name or id
+			status (str): New finding status
+			filters (dict, optional): Findings the status is applied to. Defaults to None.
+		"""
+		self.project = project
+		self.status = status
+		self.filters = filters or {}
+		self.project_id = project if isinstance(project, int) else None
+		self.job_id = None
+		self.error = None
+		self.elapsed = None
+
+	@property
+	def ok(self) -> bool:
+		return self.error is None and self.elapsed is not None
+
+	def __repr__(self):
+		return f"TriageResult(project={ repr(self.project) }, status={ repr(self.status) }, job_id={ repr(self.job_id) }, error={ repr(self.error) })"
+
+
+class BulkTriageRunner(object):
+
+	def __init__(self, client, submit_workers: int = 8, status_workers: int = 8, polling: PollingStrategy = None, timeout: float = None):
+		"""Applies bulk status updates across many projects at once
+
+		Project names are resolved with one get_projects call, update jobs are queued with bounded concurrency
+		and every job is tracked by a single JobTracker as soon as it is queued.
+		Jobs queued together wait on each other in CodeDx, so they have no timeout of their own by default;
+		timeout bounds the wait for the whole run instead, so one wedged job cannot block the run forever.
+
+		Args:
+			client (CodeDx): CodeDx client
+			submit_workers (int, optional): Maximum number of update jobs queued at once. Defaults to 8.
+			status_workers (int, optional): Maximum number of job status requests in flight. Defaults to 8.
+			polling (PollingStrategy, optional): Polling schedule for update jobs. Defaults to the client strategy without its timeout.
+			timeout (float, optional): Seconds to wait for all update jobs. Defaults to the per-job timeout of the client strategy
+				for every wave of submit_workers jobs, waiting forever only if that strategy has no timeout.
+		"""
+		self.client = client
+		self.submit_workers = submit_workers
+		self.status_workers = status_workers
+		self.client_polling = getattr(client, "polling", None) or PollingStrategy()
+		self.polling = polling or self.client_polling.with_timeout(None)
+		self.timeout = timeout
+
+	def run(self, updates: list) -> list:
+		"""Queues every update and waits for all of them
+
+		Errors are recorded per update, so one failing project does not stop the others.
+
+		Args:
+			updates (list): (project, status, filters) tuples, with the project as a name or id
+
+		Returns:
+			list: TriageResult for every update, in order
+		"""
+		start = time.monotonic()
+		results = [TriageResult(*update) for update in updates]
+		names = list(dict.fromkeys(result.project for result in results if result.project_id is None))
+		if names:
+			project_ids = self.client.get_project_ids(names)
+			for result in results:
+				if result.project_id is None:
+					result.project_id = project_ids.get(result.project)
+					if result.project_id is None:
+						result.error = ValueError(f"Project { result.project } does not exist.")
+
+		tracker = JobTracker(self.client, polling=self.polling, max_workers=self.status_workers)
+		with ThreadPoolExecutor(max_workers=self.submit_workers) as pool:
+			futures = {
+				pool.submit(self.client.bulk_status_update, result.project_id, result.status, result.filters): result
+				for result in results if result.error is None
+			}
+			for future in as_completed(futures):
+				result = futures[future]
+				try:
+					job = future.result()
+				except Exception as e:
+					result.error = e
+					continue
+				result.job_id = job["jobId"]
+				tracker.add(job, result)
+		logging.info(f"Queued { len(tracker) } bulk status updates.")
+		timeout = self.timeout if self.timeout is not None else run_timeout(self.client_polling, len(tracker), self.submit_workers)
+
+		try:
+			for tracked in tracker.as_completed(timeout):
+				result = tracked.label
+				result.error = tracked.error
+				result.elapsed = time.monotonic() - start
+		except RuntimeError as e:
+			logging.warning(str(e))
+			for tracked in tracker.jobs:
+				if not tracked.done:
+					tracked.label.error = e
+		failed = sum(1 for result in results if not result.ok)
+		logging.info(f"Completed { len(results) - failed } of { len(results) } bulk status updates.")
+		return results
+
+
+def triage_report(results: list) -> dict:
+	"""Summarizes bulk status update results per project
+
+	Args:
+		results (list): TriageResult objects from BulkTriageRunner.run
+
+	Returns:
+		dict: Project -> {"updates", "succeeded", "failed", "errors"}
+	"""
+	report = {}
+	for result in results:
+		summary = report.setdefault(result.project, {"updates": 0, "succeeded": 0, "failed": 0, "errors": []})
+		summary["updates"] += 1
+		if result.ok:
+			summary["succeeded"] += 1
+		else:
+			summary["failed"] += 1
+			summary["errors"].append(result.error)
+	return report
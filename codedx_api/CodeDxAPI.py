@@ -1,23 +1,40 @@
 import logging
-import time
+from typing import List
 
+from codedx_api.AnalysisManifest import AnalysisManifest
 from codedx_api.APIs import (Actions, Analysis, Findings, Jobs, Projects,
                              Reports)
 from codedx_api.APIs.BaseAPIClient import ContentType
+from codedx_api.BulkTriage import BulkTriageRunner
+from codedx_api.IngestionPipeline import IngestionPipeline
+from codedx_api.JobPolling import PollingStrategy, poll_job
+from codedx_api.JobTracker import JobTracker
+from codedx_api.ReportPipeline import ReportPipeline
+from codedx_api.SourceCache import SourceFileCache
+from codedx_api.TriagePlanner import MAX_FILTER_IDS, TriagePlanner
 
 
 class CodeDx(Projects, Reports, Jobs, Analysis, Actions, Findings):
 
 
-	def __init__(self, base: str, api_key: str, verbose: bool = False):
+	def __init__(self, base: str, api_key: str, verbose: bool = False, polling: PollingStrategy = None, manifest: AnalysisManifest = None, file_cache: SourceFileCache = None, **kwargs):
 		"""CodeDx API
 
+		A single connection pool is shared by every API of the client. Use the client as a context
+		manager or call close() to release its connections. The client is safe to share between threads.
+
 		Args:
 			base (str): CodeDx URL. Should be in the form of "https://[your-instance]/codedx".
 			api_key (str): API Key from CodeDx.
 			verbose (bool): Set logging level to info.
+			polling (PollingStrategy, optional): Default schedule for waiting on jobs. Defaults to PollingStrategy().
+			manifest (AnalysisManifest, optional): Lets analyze reuse the previous analysis of unchanged files. Defaults to None.
+			file_cache (SourceFileCache, optional): On-disk cache backing get_finding_file. Defaults to None.
+			**kwargs: Connection pool options (pool_connections, pool_maxsize, pool_block, keep_alive, timeout, session).
 		"""		
-		super().__init__(base, api_key)
+		super().__init__(base, api_key, file_cache=file_cache, **kwargs)
+		self.polling = polling or PollingStrategy()
+		self.manifest = manifest
 		if verbose:
 			logging.basicConfig(
 				level=logging.INFO,
@@ -40,39 +57,69 @@ class CodeDx(Projects, Reports, Jobs, Analysis, Actions, Findings):
 			f.write(data)
 
 
-	def wait_for_job(self, job: dict, job_desc: str = "Waiting for job.") -> dict:
+	def poll_job(self, job: dict, job_desc: str = "Waiting for job.", polling: PollingStrategy = None) -> tuple:
+		"""Waits for job to complete and reports how the wait went.
+
+		Args:
+			job (dict): Job object from CodeDx.
+			job_desc (str, optional): Message for debugging. Defaults to "Waiting for job.".
+			polling (PollingStrategy, optional): Polling schedule for this wait. Defaults to the client strategy.
+
+		Raises:
+			RuntimeError: The job failed, was cancelled or timed out.
+
+		Returns:
+			tuple: Job object and WaitStats with the number of polls and the wall time of the wait
+		"""
+		logging.info(job_desc)
+		job, stats = poll_job(self.job_status, job, polling or self.polling, job_desc)
+		logging.info(f"Job { stats.job_id } { stats.status } after { stats.polls } polls in { round(stats.elapsed, 1) }s.")
+		return job, stats
+
+
+	def wait_for_job(self, job: dict, job_desc: str = "Waiting for job.", polling: PollingStrategy = None) -> dict:
 		"""Waits for job to complete.
 
 		Args:
 			job (dict): Job object from CodeDx.
 			job_desc (str, optional): Message for debugging. Defaults to "Waiting for job.".
+			polling (PollingStrategy, optional): Polling schedule for this wait. Defaults to the client strategy.
 
 		Returns:
 			dict: Job object
 		"""
-		timeout = time.time() + 60*10
-		while "status" not in job or job["status"] != "completed":
-			if time.time() > timeout:
-				raise RuntimeError(f"Timeout waiting for job to complete: { job_desc }")
-			time.sleep(1)
-			logging.info(job_desc)
-			job = self.job_status(job["jobId"])
+		job, _ = self.poll_job(job, job_desc, polling)
 		return job
 
 
-	def get_report(self, job: dict, content_type: ContentType, file_name: str) -> None:
+	def track_jobs(self, jobs=None, polling: PollingStrategy = None, max_workers: int = 8) -> JobTracker:
+		"""Creates a tracker that waits on many jobs at once.
+
+		Args:
+			jobs (list | dict, optional): Job objects, or a dictionary of labels to job objects. Defaults to None.
+			polling (PollingStrategy, optional): Polling schedule for every job. Defaults to the client strategy.
+			max_workers (int, optional): Maximum number of status requests in flight. Defaults to 8.
+
+		Returns:
+			JobTracker: Tracker with as_completed() and wait_all()
+		"""
+		return JobTracker(self, jobs, polling or self.polling, max_workers)
+
+
+	def get_report(self, job: dict, content_type: ContentType, file_name) -> None:
 		"""Given a report generation job, downloads a report.
 
+		The report is streamed to disk in chunks rather than held in memory.
+
 		Args:
 			job (dict): Job object for report generation
 			content_type (ContentType): Report type
-			file_name (str): Name of file for downloaded report
+			file_name (str | file): Name of file or writable binary file object for downloaded report
 		"""		
 		description = f"Waiting for { content_type } report generation."
 		self.wait_for_job(job, description)
 		logging.info("Report successfully generated. Downloading report.")
-		res = self.job_result(job["jobId"], content_type)
-		self.download_report(res, file_name)
+		self.job_result(job["jobId"], content_type, destination=file_name)
 		return
 
 
@@ -138,10 +185,34 @@ class CodeDx(Projects, Reports, Jobs, Analysis, Actions, Findings):
 		"""		 
 		pid = self.get_project_id(project)
 		job = self.generate_xml(pid, include_standards, include_source, include_rule_descriptions)
-		self.download_report(job, file_name)
+		self.get_report(job, ContentType.XML, file_name)
 		return
 
 
+	def get_reports(self,
+		projects: list,
+		report_type: str = "pdf",
+		output_dir: str = ".",
+		submit_workers: int = 8,
+		download_workers: int = 4,
+		**options) -> dict:
+		"""Download reports for many projects at once.
+
+		Args:
+			projects (list[str]): CodeDx project names
+			report_type (str, optional): "pdf", "csv" or "xml". Defaults to "pdf".
+			output_dir (str, optional): Directory for the reports, named [project].[type]. Defaults to ".".
+			submit_workers (int, optional): Maximum number of report jobs queued at once. Defaults to 8.
+			download_workers (int, optional): Maximum number of concurrent downloads. Defaults to 4.
+			**options: Report options, as for get_pdf, get_csv and get_xml.
+
+		Returns:
+			dict: Project names to ReportResult with the file name, bytes written or error
+		"""
+		pipeline = ReportPipeline(self, submit_workers, download_workers)
+		return pipeline.run(projects, report_type, output_dir, **options)
+
+
 	def get_nessus(self):
 		pass
 
@@ -150,12 +221,74 @@ class CodeDx(Projects, Reports, Jobs, Analysis, Actions, Findings):
 		pass
 
 
-	def analyze(self, project: str, file_name: str) -> dict:
-		"""Upload a vulnerability scan and run an analysis.
+	def upload_run_analysis(self, project: int, file_names: List[str], max_workers: int = 4, compress: bool = False) -> dict:
+		"""Upload several vulnerability scans to one analysis prep and start a single analysis.
+
+		The files are uploaded concurrently and their input jobs are waited on together.
+
+		Args:
+			project (int): CodeDx project id.
+			file_names (List[str]): Files to upload.
+			max_workers (int, optional): Number of concurrent uploads. Defaults to 4.
+			compress (bool, optional): Zip each file on the fly while uploading. Defaults to False.
+
+		Raises:
+			RuntimeError: A file failed to upload or its input job failed.
+			ValueError: The analysis prep has verification errors.
+
+		Returns:
+			dict: Analysis ID and Job ID for the analysis.
+		"""
+		prep = self.create_analysis(project)
+		prep_id = prep["prepId"]
+		logging.info(f"Uploading { len(file_names) } reports to analysis prep { prep_id }.")
+		uploads = self.upload_analyses(prep_id, file_names, max_workers, compress)
+		failed = {file_name: job for file_name, job in uploads.items() if isinstance(job, Exception)}
+		if not failed:
+			tracker = JobTracker(self, uploads)
+			failed = {tracked.label: tracked.error for tracked in tracker.wait_all() if not tracked.ok}
+		if failed:
+			for file_name, error in failed.items():
+				logging.warning(f"Upload of { file_name } failed: { error }")
+			raise RuntimeError(f"Failed to upload external reports: { list(failed) }")
+		prep = self.get_prep(prep_id)
+		if 'verificationErrors' in prep and len(prep['verificationErrors']) > 0:
+			logging.warning(f"Verification Errors in { file_names }: { prep['verificationErrors'] }")
+			raise ValueError("Fix verification errors in external vulnerability report.")
+		return self.run_analysis(prep_id)
+
+
+	def previous_analysis(self, project: str, digests: list) -> dict:
+		"""Returns the analysis recorded in the manifest for these exact files, or None.
+
+		Args:
+			project (str): CodeDx project name.
+			digests (list): File hashes from AnalysisManifest.digest.
+
+		Returns:
+			dict: Analysis object, or None if the files changed or the analysis no longer exists.
+		"""
+		analysis_id = self.manifest.lookup(project, digests) if self.manifest is not None else None
+		if analysis_id is None:
+			return None
+		pid = self.get_project_id(project)
+		try:
+			return self.get_analysis(pid, analysis_id) if pid else None
+		except Exception as e:
+			logging.warning(f"Previous analysis { analysis_id } of { project } is not available: { e }")
+			return None
+
+
+	def analyze(self, project: str, file_name, max_workers: int = 4) -> dict:
+		"""Upload one or more vulnerability scans and run a single analysis.
+
+		With a manifest, files identical to those of the project's last analysis are not uploaded again
+		and that analysis is returned instead.
 
 		Args:
 			project (str): CodeDx project name.
-			file_name (str): File to upload.
+			file_name (str | List[str]): File or files to upload.
+			max_workers (int, optional): Number of concurrent uploads. Defaults to 4.
 
 		Raises:
 			Exception: ValueError if there are errors in the file uploaded.
@@ -163,27 +296,40 @@ class CodeDx(Projects, Reports, Jobs, Analysis, Actions, Findings):
 		Returns:
 			dict: Analysis object.
 		"""		
+		file_names = [file_name] if isinstance(file_name, str) else list(file_name)
+		if self.manifest is not None:
+			digests = self.manifest.digest(file_names)
+			analysis = self.previous_analysis(project, digests)
+			if analysis is not None:
+				logging.info(f"Vulnerability reports { file_names } are unchanged, reusing analysis { analysis['id'] } of { project }.")
+				return analysis
 		logging.info(f"Creating analysis for { project }.")
-		pid = self.get_project_id(project)
+		pid = self.get_project_id(project) or self.get_project_id(project, use_cache=False)
 		if not pid:
 			logging.info(f"Project name { project } did not exist, creating new project.")
-			new_project = create_project(project)
+			new_project = self.create_project(project)
 			pid = new_project["id"]
-		prep = self.create_analysis(pid)
-		prep_id = prep["prepId"]
-		logging.info(f"Uploading report { file_name } to { project } analysis.")
-		ext_analysis = self.upload_analysis(prep_id, file_name)
-		self.wait_for_job(ext_analysis, "Analyzing external report content.")
-		prep = self.get_prep(prep_id)
-		if 'verificationErrors' in prep and len(prep['verificationErrors']) > 0:
-			logging.warning(f"Verification Errors in { file_name }: { prep['verificationErrors'] }")
-			raise ValueError("Fix verification errors in external vulnerability report.")
-		else:
-			analysis_job = self.run_analysis(prep_id)
-			self.wait_for_job(analysis_job, f"Running analysis for { project }.")
-			analysis = self.get_analysis(pid, analysis_job["analysisId"])
-			logging.info(f"Analysis complete. Vulnerability report { file_name } successsfully uploaded to { project }.")
-			return analysis
+		analysis_job = self.upload_run_analysis(pid, file_names, max_workers)
+		self.wait_for_job(analysis_job, f"Running analysis for { project }.")
+		analysis = self.get_analysis(pid, analysis_job["analysisId"])
+		if self.manifest is not None:
+			self.manifest.record(project, digests, analysis_job["analysisId"])
+		logging.info(f"Analysis complete. Vulnerability reports { file_names } successsfully uploaded to { project }.")
+		return analysis
+
+
+	def ingest(self, jobs, upload_workers: int = 4, wait_workers: int = 16) -> list:
+		"""Upload scans and run analyses for many projects at once.
+
+		Args:
+			jobs (Iterable): (project name, file or list of files) tuples
+			upload_workers (int, optional): Projects uploading at once. Defaults to 4.
+			wait_workers (int, optional): Projects waiting on CodeDx jobs at once. Defaults to 16.
+
+		Returns:
+			list: IngestResult for every job, with the analysis or the error and failed stage
+		"""
+		return IngestionPipeline(self, upload_workers, wait_workers).run(jobs)
 
 
 	def update_statuses(self, project: str, status: str = "false-positive", filters: dict = None) -> None:
@@ -201,3 +347,29 @@ class CodeDx(Projects, Reports, Jobs, Analysis, Actions, Findings):
 		job = self.bulk_status_update(pid, status, filters)
 		self.wait_for_job(job, "Waiting for statuses to update.")
 		logging.info(f"Completed bulk status update \"{ status }\" for project { project }.")
+
+
+	def update_statuses_bulk(self, updates: list, submit_workers: int = 8) -> list:
+		"""Update statuses of findings in many projects at once.
+
+		Args:
+			updates (list): (project, status, filters) tuples, with the project as a name or id
+			submit_workers (int, optional): Maximum number of update jobs queued at once. Defaults to 8.
+
+		Returns:
+			list: TriageResult for every update, with the job id or error
+		"""
+		return BulkTriageRunner(self, submit_workers).run(updates)
+
+
+	def apply_triage(self, decisions: list, chunk_size: int = MAX_FILTER_IDS) -> list:
+		"""Apply per-finding status decisions with as few bulk status updates as possible.
+
+		Args:
+			decisions (list): (project, finding id, status) tuples, with the project as a name or id
+			chunk_size (int, optional): Maximum number of finding ids in one update. Defaults to MAX_FILTER_IDS.
+
+		Returns:
+			list: TriageResult for every bulk update that was run
+		"""
+		return TriagePlanner(self, chunk_size).apply(decisions)
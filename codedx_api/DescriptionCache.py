@@ -0,0 +1,123 @@
+import json
+import os
+import threading
+
+
+def rule_key(finding: dict) -> str:
+	"""Identifies the rule of a finding from its metadata
+
+	Uses the descriptor expanded on finding metadata and table rows, and falls back to the tool and rule names.
+
+	Args:
+		finding (dict): Finding metadata or table row
+
+	Returns:
+		str: Rule key, or None if the finding does not identify its rule
+	"""
+	descriptor = finding.get("descriptor")
+	if isinstance(descriptor, dict) and descriptor.get("id") is not None:
+		return f"descriptor:{ descriptor['id'] }"
+	tool = finding.get("tool")
+	rule = finding.get("rule")
+	if isinstance(rule, dict):
+		rule = rule.get("name")
+	if tool and rule:
+		return f"rule:{ tool }:{ rule }"
+	return None
+
+
+class DescriptionCache(object):
+
+	def __init__(self, client, path: str = None):
+		"""Thread-safe cache of finding descriptions by rule
+
+		Findings of the same rule share a description, so it is downloaded once per rule
+		instead of once per finding. Findings are identified by their expanded "descriptor";
+		pass finding metadata or table rows to avoid an extra metadata request per id.
+
+		Args:
+			client (Findings): Client used for get_finding and get_finding_description
+			path (str, optional): JSON file the cache is loaded from and saved to. Defaults to None.
+		"""
+		self.client = client
+		self.path = path
+		self.hits = 0
+		self.misses = 0
+		self._descriptions = {}
+		self._rules = {}
+		self._loading = {}
+		self._lock = threading.Lock()
+		if path and os.path.exists(path):
+			with open(path) as f:
+				self._descriptions = json.load(f)
+
+	def __len__(self):
+		return len(self._descriptions)
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, exc_type, exc_value, traceback):
+		self.save()
+
+	def save(self):
+		"""Writes the cached descriptions to the cache file, if one was given"""
+		if not self.path:
+			return
+		with self._lock:
+			data = dict(self._descriptions)
+		partial = f"{ self.path }.part"
+		with open(partial, 'w') as f:
+			json.dump(data, f)
+		os.replace(partial, self.path)
+
+	def _key(self, finding) -> tuple:
+		if isinstance(finding, dict):
+			return finding["id"], rule_key(finding)
+		with self._lock:
+			if finding in self._rules:
+				return finding, self._rules[finding]
+		key = rule_key(self.client.get_finding(finding, ["descriptor"]))
+		with self._lock:
+			self._rules[finding] = key
+		return finding, key
+
+	def get(self, finding) -> dict:
+		"""Returns the description of a finding, downloading it only for the first finding of each rule
+
+		Args:
+			finding (int | dict): Finding id, metadata or table row
+
+		Returns:
+			dict: Contains the description(s) for the finding
+		"""
+		finding_id, key = self._key(finding)
+		if key is None:
+			with self._lock:
+				self.misses += 1
+			return self.client.get_finding_description(finding_id)
+		while True:
+			with self._lock:
+				if key in self._descriptions:
+					self.hits += 1
+					return self._descriptions[key]
+				loading = self._loading.get(key)
+				if loading is None:
+					loading = self._loading[key] = threading.Event()
+					self.misses += 1
+					break
+			loading.wait()
+		try:
+			description = self.client.get_finding_description(finding_id)
+			with self._lock:
+				self._descriptions[key] = description
+			return description
+		finally:
+			with self._lock:
+				del self._loading[key]
+			loading.set()
+
+	def stats(self) -> dict:
+		"""Returns hit and miss counts and the number of cached rules"""
+		with self._lock:
+			return {"hits": self.hits, "misses": self.misses, "rules": len(self._descriptions)}
@@ -0,0 +1,143 @@
+import gzip
+import json
+import logging
+import os
+import time
+
+from codedx_api.APIs.FindingsAPI import DEFAULT_SORT, table_request
+
+
+class ExportStats(object):
+
+	def __init__(self, resumed_rows: int = 0, last_id: int = None):
+		"""Progress of a findings export
+
+		Args:
+			resumed_rows (int, optional): Rows already in the file when the export started. Defaults to 0.
+			last_id (int, optional): Last finding id already in the file. Defaults to None.
+		"""
+		self.resumed_rows = resumed_rows
+		self.last_id = last_id
+		self.rows = 0
+		self.started = time.monotonic()
+		self.elapsed = 0.0
+
+	@property
+	def rows_per_sec(self) -> float:
+		return self.rows / self.elapsed if self.elapsed else 0.0
+
+	def __repr__(self):
+		return f"ExportStats(rows={ self.rows }, resumed_rows={ self.resumed_rows }, last_id={ self.last_id }, rows_per_sec={ round(self.rows_per_sec, 1) })"
+
+
+def _open(file_name: str, mode: str, compress: bool):
+	if compress:
+		return gzip.open(file_name, mode + "b")
+	return open(file_name, mode + "b")
+
+
+def read_position(file_name: str, compress: bool) -> tuple:
+	"""Finds where an interrupted export stopped
+
+	The file is read as a stream. A partly written last line is dropped: plain files are truncated
+	after the last complete line, and a gzip file cut off mid-stream is rewritten without it.
+
+	Args:
+		file_name (str): NDJSON export file
+		compress (bool): Whether the file is gzip compressed
+
+	Returns:
+		tuple: (rows, last finding id), or (0, None) if the file does not exist
+	"""
+	if not os.path.exists(file_name):
+		return 0, None
+	rows, last_id, complete = 0, None, 0
+	truncated = False
+	with _open(file_name, "r", compress) as f:
+		try:
+			for line in f:
+				if not line.endswith(b"\n"):
+					truncated = True
+					break
+				last_id = json.loads(line)["id"]
+				rows += 1
+				complete += len(line)
+		except (EOFError, gzip.BadGzipFile):
+			truncated = True
+	if truncated and not compress:
+		with open(file_name, "r+b") as f:
+			f.truncate(complete)
+	elif truncated:
+		partial = f"{ file_name }.part"
+		with _open(file_name, "r", True) as source, _open(partial, "w", True) as target:
+			remaining = complete
+			while remaining:
+				chunk = source.read(min(remaining, 1024 * 1024))
+				target.write(chunk)
+				remaining -= len(chunk)
+		os.replace(partial, file_name)
+	return rows, last_id
+
+
+def _start_page(client, project: int, filters: dict, page_size: int, rows: int, last_id: int) -> int:
+	"""Finds the first page that may hold findings after last_id, stepping back if findings were deleted"""
+	page = rows // page_size + 1
+	while page > 1:
+		first = client.get_finding_table(project, None, table_request(filters, page, page_size, DEFAULT_SORT))
+		if first and first[0]["id"] <= last_id:
+			break
+		page -= 1
+	return page
+
+
+def export_findings(client,
+	project: int,
+	file_name: str,
+	filters: dict = None,
+	options: list = None,
+	page_size: int = 500,
+	compress: bool = None,
+	resume: bool = False,
+	max_workers: int = 1,
+	progress=None) -> ExportStats:
+	"""Streams the findings of a project to a newline-delimited JSON file, one finding per line
+
+	Findings are read page by page in ascending id order and written as they arrive, so memory does not grow
+	with the project. The file is flushed after every page. With resume, rows already in the file are kept
+	and the export continues after its last finding id, so an interrupted export loses at most one page.
+
+	Args:
+		client (Findings): Client used for the finding table
+		project (int): Project id
+		file_name (str): Output file
+		filters (dict, optional): Finding filters. Defaults to None.
+		options (list, optional): Expand options for the finding table. Defaults to None.
+		page_size (int, optional): Findings per page. Defaults to 500.
+		compress (bool, optional): Gzip the output. Defaults to True for names ending in ".gz".
+		resume (bool, optional): Continue an existing export instead of replacing it. Defaults to False.
+		max_workers (int, optional): Pages fetched concurrently. Defaults to 1.
+		progress (Callable, optional): Called after every page with the ExportStats. Defaults to None.
+
+	Returns:
+		ExportStats: Rows written and rows per second
+	"""
+	if compress is None:
+		compress = file_name.endswith(".gz")
+	rows, last_id = read_position(file_name, compress) if resume else (0, None)
+	stats = ExportStats(rows, last_id)
+	start_page = _start_page(client, project, filters, page_size, rows, last_id) if last_id is not None else 1
+	pages = client.iter_finding_pages(project, filters, options, page_size, DEFAULT_SORT, max_workers=max_workers, start_page=start_page)
+	with _open(file_name, "a" if resume else "w", compress) as f:
+		for page in pages:
+			lines = [json.dumps(row, separators=(",", ":")) for row in page if last_id is None or row["id"] > last_id]
+			if lines:
+				f.write(("\n".join(lines) + "\n").encode())
+				f.flush()
+				stats.rows += len(lines)
+				stats.last_id = page[-1]["id"]
+			stats.elapsed = time.monotonic() - stats.started
+			if progress:
+				progress(stats)
+	stats.elapsed = time.monotonic() - stats.started
+	logging.info(f"Exported { stats.rows } findings of project { project } to { file_name } at { round(stats.rows_per_sec) } rows/sec")
+	return stats
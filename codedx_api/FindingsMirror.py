@@ -0,0 +1,309 @@
+import json
+import logging
+import sqlite3
+import threading
+import time
+
+from codedx_api.APIs.FindingFields import field_value
+from codedx_api.APIs.FindingFilter import FINDING_ID_FILTER, compile_filter, timestamp
+
+INDEXED_FIELDS = ("severity", "status", "tool", "cwe", "path", "updateDate")
+NAME_COLUMNS = {"severity": "severity", "status": "status", "tool": "tool", "detectionMethod": "tool"}
+ID_COLUMNS = {FINDING_ID_FILTER: "id", "cwe": "cwe"}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS findings (
+	project INTEGER NOT NULL,
+	id INTEGER NOT NULL,
+	severity TEXT,
+	status TEXT,
+	tool TEXT,
+	cwe TEXT,
+	path TEXT,
+	updateDate TEXT,
+	data TEXT NOT NULL,
+	updated REAL,
+	PRIMARY KEY (project, id)
+);
+CREATE INDEX IF NOT EXISTS findings_severity ON findings (project, severity);
+CREATE INDEX IF NOT EXISTS findings_status ON findings (project, status);
+CREATE INDEX IF NOT EXISTS findings_tool ON findings (project, tool);
+CREATE INDEX IF NOT EXISTS findings_cwe ON findings (project, cwe);
+CREATE INDEX IF NOT EXISTS findings_path ON findings (project, path);
+CREATE TABLE IF NOT EXISTS sync_state (
+	project INTEGER PRIMARY KEY,
+	watermark TEXT,
+	synced_at REAL NOT NULL
+);
+"""
+
+
+UPDATED_SCHEMA = """
+CREATE INDEX IF NOT EXISTS findings_updated ON findings (project, updated);
+"""
+
+
+def update_filter(watermark) -> dict:
+	"""Default filter for findings updated since the watermark"""
+	return {"updateDate": {"start": watermark}}
+
+
+class FindingsMirror(object):
+
+	def __init__(self, client, path: str = ":memory:", options: list = None, page_size: int = 500, max_workers: int = 4, since_filter=update_filter):
+		"""Local SQLite copy of project findings
+
+		snapshot() copies every finding of a project. sync() then only fetches findings updated since the
+		newest update time already stored, so repeated analytics run locally and only changes cross the network.
+		Findings deleted on CodeDx are only removed by a new snapshot. Queries take the same filters as
+		get_finding_count and keep running while pages are downloaded.
+
+		Args:
+			client (Findings): Client used for the finding table
+			path (str, optional): SQLite database file. Defaults to an in-memory database.
+			options (list, optional): Expand options for the finding table. Defaults to None.
+			page_size (int, optional): Findings per page. Defaults to 500.
+			max_workers (int, optional): Pages fetched concurrently. Defaults to 4.
+			since_filter (Callable, optional): Builds the finding filter for updates after a watermark. Defaults to an updateDate range.
+		"""
+		self.client = client
+		self.options = options
+		self.page_size = page_size
+		self.max_workers = max_workers
+		self.since_filter = since_filter
+		self._lock = threading.Lock()
+		self._stages = 0
+		self.db = sqlite3.connect(path, check_same_thread=False)
+		self.db.row_factory = sqlite3.Row
+		with self._lock, self.db:
+			self.db.executescript(SCHEMA)
+			self._migrate()
+			self.db.executescript(UPDATED_SCHEMA)
+
+	def close(self):
+		self.db.close()
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, exc_type, exc_value, traceback):
+		self.close()
+
+	def _migrate(self):
+		"""Adds the numeric update time to databases written before it was stored"""
+		columns = [row[1] for row in self.db.execute("PRAGMA table_info(findings)")]
+		if "updated" in columns:
+			return
+		self.db.execute("ALTER TABLE findings ADD COLUMN updated REAL")
+		rows = self.db.execute("SELECT project, id, data FROM findings").fetchall()
+		self.db.executemany("UPDATE findings SET updated = ? WHERE project = ? AND id = ?",
+			[(self._updated(json.loads(row[2])), row[0], row[1]) for row in rows])
+
+	@staticmethod
+	def _updated(finding: dict) -> float:
+		"""Update time in epoch seconds, whether CodeDx sent an ISO date or epoch milliseconds"""
+		try:
+			return timestamp(field_value(finding, "updateDate"))
+		except (TypeError, ValueError):
+			return None
+
+	@classmethod
+	def _row(cls, project: int, finding: dict) -> tuple:
+		values = [field_value(finding, field) for field in INDEXED_FIELDS]
+		values = [None if value is None else str(value) for value in values]
+		return (project, finding["id"], *values, json.dumps(finding), cls._updated(finding))
+
+	def _newest(self, project: int):
+		"""Returns the updateDate of the most recently updated finding as CodeDx sent it, or None"""
+		row = self.db.execute("SELECT data FROM findings WHERE project = ? AND updated IS NOT NULL ORDER BY updated DESC LIMIT 1", (project,)).fetchone()
+		return field_value(json.loads(row[0]), "updateDate") if row else None
+
+	def _store(self, project: int, filters: dict, watermark, replace: bool) -> int:
+		"""Stages fetched pages in a temporary table, then applies them to the findings in one transaction
+
+		The lock is only taken around each page insert and the final swap, never while pages are downloaded,
+		so queries keep running during a sync and always see either the old or the new findings.
+		"""
+		with self._lock:
+			self._stages += 1
+			stage = f"stage_{ self._stages }"
+			self.db.execute(f"CREATE TEMP TABLE { stage } AS SELECT * FROM findings WHERE 0")
+		count = 0
+		try:
+			for rows in self.client.iter_finding_pages(project, filters, self.options, self.page_size, max_workers=self.max_workers):
+				values = [self._row(project, row) for row in rows]
+				with self._lock, self.db:
+					self.db.executemany(f"INSERT OR REPLACE INTO { stage } VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", values)
+				count += len(rows)
+			with self._lock, self.db:
+				if replace:
+					self.db.execute("DELETE FROM findings WHERE project = ?", (project,))
+				self.db.execute(f"INSERT OR REPLACE INTO findings SELECT * FROM { stage }")
+				newest = self._newest(project)
+				self.db.execute("INSERT OR REPLACE INTO sync_state VALUES (?, ?, ?)", (project, watermark if newest is None else newest, time.time()))
+		finally:
+			with self._lock:
+				self.db.execute(f"DROP TABLE temp.{ stage }")
+		return count
+
+	def watermark(self, project: int):
+		"""Returns the newest updateDate stored for a project, or None if it was never synced
+
+		The newest finding is chosen by its time, not its text, so ISO dates with other offsets or
+		fractions and epoch milliseconds compare correctly. Epoch milliseconds are returned as ints.
+		"""
+		with self._lock:
+			row = self.db.execute("SELECT watermark FROM sync_state WHERE project = ?", (project,)).fetchone()
+		if not row or row[0] is None:
+			return None
+		return int(row[0]) if row[0].isdigit() else row[0]
+
+	def synced(self, project: int) -> bool:
+		"""Returns whether a project has been mirrored"""
+		with self._lock:
+			row = self.db.execute("SELECT 1 FROM sync_state WHERE project = ?", (project,)).fetchone()
+		return row is not None
+
+	def snapshot(self, project: int) -> int:
+		"""Replaces the stored findings of a project with a full copy
+
+		Args:
+			project (int): Project id
+
+		Returns:
+			int: Number of findings stored
+		"""
+		count = self._store(project, None, None, replace=True)
+		logging.info(f"Mirrored { count } findings of project { project }.")
+		return count
+
+	def sync(self, project: int) -> int:
+		"""Fetches findings updated since the last sync, or takes a snapshot of a new project
+
+		Args:
+			project (int): Project id
+
+		Returns:
+			int: Number of findings fetched
+		"""
+		if not self.synced(project):
+			return self.snapshot(project)
+		watermark = self.watermark(project)
+		filters = self.since_filter(watermark) if watermark is not None else None
+		count = self._store(project, filters, watermark, replace=watermark is None)
+		logging.info(f"Synced { count } updated findings of project { project }.")
+		return count
+
+	def _where(self, project: int, filters: dict) -> tuple:
+		"""Splits a CodeDx filter into SQL conditions on the indexed columns and a predicate for the other keys
+
+		Returns:
+			tuple: (where clause, parameters, predicate or None when SQL answers the whole filter)
+		"""
+		clauses = ["project = ?"]
+		params = [project]
+		rest = {}
+		for key, value in (filters or {}).items():
+			values = list(value) if isinstance(value, (list, tuple, set)) else [value]
+			if key in NAME_COLUMNS and None not in values:
+				clauses.append(f"{ NAME_COLUMNS[key] } COLLATE NOCASE IN ({ ', '.join('?' for _ in values) })")
+				params.extend(str(value) for value in values)
+			elif key in ID_COLUMNS and None not in values:
+				clauses.append(f"{ ID_COLUMNS[key] } IN ({ ', '.join('?' for _ in values) })")
+				params.extend(int(value) if key == FINDING_ID_FILTER else str(int(value)) for value in values)
+			elif key == "updateDate" and isinstance(value, dict) and value and set(value) <= {"start", "end"}:
+				if value.get("start") is not None:
+					clauses.append("updated >= ?")
+					params.append(timestamp(value["start"]))
+				if value.get("end") is not None:
+					clauses.append("updated <= ?")
+					params.append(timestamp(value["end"]))
+			else:
+				rest[key] = value
+		return " AND ".join(clauses), params, compile_filter(rest) if rest else None
+
+	def _scan(self, where: str, params: list, predicate, column: str = "id", batch_size: int = 500):
+		"""Yields (column value, finding) for matching findings in id order, reading them in batches"""
+		last = None
+		while True:
+			query = f"SELECT id, data, { column } FROM findings WHERE { where }"
+			batch_params = list(params)
+			if last is not None:
+				query += " AND id > ?"
+				batch_params.append(last)
+			with self._lock:
+				rows = self.db.execute(query + " ORDER BY id LIMIT ?", batch_params + [batch_size]).fetchall()
+			for row in rows:
+				finding = json.loads(row[1])
+				if predicate is None or predicate(finding):
+					yield row[2], finding
+			if len(rows) < batch_size:
+				return
+			last = rows[-1][0]
+
+	def count(self, project: int, filters: dict = None, **fields) -> int:
+		"""Counts stored findings, like get_finding_count without a request
+
+		Such as count(1, {"severity": ["High", "Critical"], "~status": "fixed"}) or count(1, status="unresolved").
+		Names, ids and update dates are matched in SQL and other keys by compile_filter.
+
+		Args:
+			project (int): Project id
+			filters (dict, optional): CodeDx finding filter. Defaults to None.
+			**fields: Filter keys to a value or list of values, added to filters
+
+		Raises:
+			UnsupportedFilter: A key can only be evaluated by CodeDx.
+
+		Returns:
+			int: Number of matching findings
+		"""
+		where, params, predicate = self._where(project, dict(filters or {}, **fields))
+		if predicate is not None:
+			return sum(1 for _ in self._scan(where, params, predicate))
+		with self._lock:
+			return self.db.execute(f"SELECT COUNT(*) FROM findings WHERE { where }", params).fetchone()[0]
+
+	def group_count(self, project: int, field: str, filters: dict = None, **fields) -> dict:
+		"""Counts stored findings grouped by an indexed field
+
+		Args:
+			project (int): Project id
+			field (str): Indexed field to group by
+			filters (dict, optional): CodeDx finding filter. Defaults to None.
+			**fields: Filter keys to a value or list of values, added to filters
+
+		Raises:
+			ValueError: The field is not indexed.
+			UnsupportedFilter: A filter key can only be evaluated by CodeDx.
+
+		Returns:
+			dict: Field values to counts
+		"""
+		if field not in INDEXED_FIELDS:
+			raise ValueError(f"Cannot group by { field }. Choose from { INDEXED_FIELDS }.")
+		where, params, predicate = self._where(project, dict(filters or {}, **fields))
+		if predicate is not None:
+			counts = {}
+			for value, _ in self._scan(where, params, predicate, field):
+				counts[value] = counts.get(value, 0) + 1
+			return counts
+		with self._lock:
+			rows = self.db.execute(f"SELECT { field }, COUNT(*) FROM findings WHERE { where } GROUP BY { field }", params).fetchall()
+		return {row[0]: row[1] for row in rows}
+
+	def findings(self, project: int, batch_size: int = 500, filters: dict = None, **fields):
+		"""Yields stored findings as dictionaries in id order, reading them in batches
+
+		Args:
+			project (int): Project id
+			batch_size (int, optional): Findings read per query. Defaults to 500.
+			filters (dict, optional): CodeDx finding filter. Defaults to None.
+			**fields: Filter keys to a value or list of values, added to filters
+
+		Raises:
+			UnsupportedFilter: A key can only be evaluated by CodeDx.
+		"""
+		where, params, predicate = self._where(project, dict(filters or {}, **fields))
+		for _, finding in self._scan(where, params, predicate, batch_size=batch_size):
+			yield finding
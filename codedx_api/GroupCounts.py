@@ -0,0 +1,115 @@
+import logging
+import threading
+from collections import defaultdict
+
+from codedx_api.APIs.AnalysisAPI import latest_analysis_id
+from codedx_api.APIs.Concurrency import map_bounded
+
+GROUP_FIELDS = {
+	"severity": "severity",
+	"status": "status",
+	"tool": "detectionMethod"
+}
+
+
+class GroupCountAggregator(object):
+
+	def __init__(self, client, fields=("severity", "status", "tool"), filters: dict = None, max_workers: int = 8):
+		"""Grouped finding counts for every project, merged into one table
+
+		Projects are listed once. Each refresh checks every project's latest analysis id concurrently and only
+		requests grouped counts for projects analyzed since their last refresh. Triage changes made without a new
+		analysis are only picked up by refresh(force=True).
+
+		Args:
+			client (CodeDx): Client used for projects, analyses and grouped counts
+			fields (tuple, optional): Any of "severity", "status" and "tool". Defaults to all three.
+			filters (dict, optional): Finding filter applied to every count. Defaults to None.
+			max_workers (int, optional): Projects refreshed concurrently. Defaults to 8.
+
+		Raises:
+			ValueError: Unknown field requested.
+		"""
+		unknown = set(fields) - set(GROUP_FIELDS)
+		if unknown:
+			raise ValueError(f"Unknown group count fields { unknown }. Choose from { tuple(GROUP_FIELDS) }.")
+		self.client = client
+		self.fields = tuple(fields)
+		self.filters = filters or {}
+		self.max_workers = max_workers
+		self.projects = None
+		self.counts = {}
+		self.analyses = {}
+		self.errors = {}
+		self.stats = {"refreshed": 0, "skipped": 0, "failed": 0}
+		self._lock = threading.Lock()
+
+	def load_projects(self) -> dict:
+		"""Lists the projects to aggregate, returning project name -> id"""
+		projects = self.client.get_projects().get("projects", [])
+		self.projects = {project["name"]: project["id"] for project in projects}
+		return self.projects
+
+	@staticmethod
+	def _groups(data: list) -> dict:
+		return {group.get("name", group.get("id")): group["count"] for group in data}
+
+	def _refresh_project(self, name: str, force: bool):
+		project = self.projects[name]
+		analysis = latest_analysis_id(self.client.get_all_analysis(project))
+		with self._lock:
+			if not force and name in self.counts and self.analyses.get(name) == analysis:
+				return False
+		counts = {}
+		for field in self.fields:
+			req_body = {"countBy": GROUP_FIELDS[field], "filter": self.filters}
+			counts[field] = self._groups(self.client.get_finding_group_count(project, req_body))
+		with self._lock:
+			self.counts[name] = counts
+			self.analyses[name] = analysis
+		return True
+
+	def refresh(self, force: bool = False) -> dict:
+		"""Updates the counts of projects analyzed since the last refresh
+
+		A failing project keeps its previous counts and its error is kept in errors.
+
+		Args:
+			force (bool, optional): Refresh every project. Defaults to False.
+
+		Returns:
+			dict: The merged table, see table()
+		"""
+		if self.projects is None:
+			self.load_projects()
+		self.stats = {"refreshed": 0, "skipped": 0, "failed": 0}
+		self.errors = {}
+		for name, refreshed, error in map_bounded(lambda name: self._refresh_project(name, force), list(self.projects), self.max_workers):
+			if error is not None:
+				logging.warning(f"Group counts for { name } failed: { error }")
+				self.errors[name] = error
+				self.stats["failed"] += 1
+			else:
+				self.stats["refreshed" if refreshed else "skipped"] += 1
+		return self.table()
+
+	def table(self) -> dict:
+		"""Returns the counts of all projects as field -> group -> project name -> count"""
+		table = {field: defaultdict(dict) for field in self.fields}
+		with self._lock:
+			for name, counts in self.counts.items():
+				for field, groups in counts.items():
+					for group, count in groups.items():
+						table[field][group][name] = count
+		return {field: dict(groups) for field, groups in table.items()}
+
+	def totals(self, field: str) -> dict:
+		"""Returns the counts of a field summed over all projects, as group -> count"""
+		return {group: sum(projects.values()) for group, projects in self.table()[field].items()}
+
+	def rows(self):
+		"""Yields the table as flat (project, field, group, count) rows, for CSV or dataframes"""
+		for field, groups in self.table().items():
+			for group, projects in groups.items():
+				for name, count in projects.items():
+					yield name, field, group, count
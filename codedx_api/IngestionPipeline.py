@@ -0,0 +1,250 @@
+import logging
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from codedx_api.JobPolling import PollingStrategy, run_timeout
+from codedx_api.JobTracker import JobTracker
+
+STAGES = ("upload", "inputs", "analysis")
+
+
+class IngestResult(object):
+
+	def __init__(self, project: str, files: list):
+		"""Outcome of the analysis of one project
+
+		Args:
+			project (str): CodeDx project name
+			files (list): Scan files uploaded to the analysis
+		"""
+		self.project = project
+		self.files = files
+		self.project_id = None
+		self.prep_id = None
+		self.digests = None
+		self.reused = False
+		self.analysis = None
+		self.error = None
+		self.failed_stage = None
+		self.timings = {}
+
+	@property
+	def ok(self) -> bool:
+		return self.error is None and self.analysis is not None
+
+	def __repr__(self):
+		return f"IngestResult(project={ repr(self.project) }, files={ len(self.files) }, failed_stage={ repr(self.failed_stage) }, error={ repr(self.error) })"
+
+
+class StageStats(object):
+
+	def __init__(self, name: str):
+		"""Throughput and latency of one pipeline stage
+
+		Args:
+			name (str): Stage name
+		"""
+		self.name = name
+		self.completed = 0
+		self.failed = 0
+		self.latencies = []
+		self.first_start = None
+		self.last_end = None
+
+	def record(self, start: float, end: float, ok: bool):
+		self.first_start = start if self.first_start is None else min(self.first_start, start)
+		self.last_end = end if self.last_end is None else max(self.last_end, end)
+		self.latencies.append(end - start)
+		if ok:
+			self.completed += 1
+		else:
+			self.failed += 1
+
+	@property
+	def throughput(self) -> float:
+		"""Projects completing the stage per second while the stage was active"""
+		if not self.completed or self.last_end == self.first_start:
+			return 0.0
+		return self.completed / (self.last_end - self.first_start)
+
+	@property
+	def mean_latency(self) -> float:
+		return sum(self.latencies) / len(self.latencies) if self.latencies else 0.0
+
+	@property
+	def p95_latency(self) -> float:
+		if not self.latencies:
+			return 0.0
+		latencies = sorted(self.latencies)
+		return latencies[min(len(latencies) - 1, math.ceil(0.95 * len(latencies)) - 1)]
+
+	def __repr__(self):
+		return f"StageStats(name={ repr(self.name) }, completed={ self.completed }, failed={ self.failed }, throughput={ round(self.throughput, 2) }, mean_latency={ round(self.mean_latency, 2) })"
+
+
+class IngestionPipeline(object):
+
+	def __init__(self,
+		client,
+		upload_workers: int = 4,
+		wait_workers: int = 16,
+		max_pending: int = None,
+		polling: PollingStrategy = None,
+		timeout: float = None):
+		"""Uploads and analyzes scan results for many projects at once
+
+		Each project goes through three stages: creating an analysis prep and uploading its files,
+		waiting for input detection and starting the analysis, and waiting for the analysis.
+		Uploads run on upload_workers threads and the two waits on wait_workers threads, so slow
+		analyses never hold up uploads. The files of a project are uploaded concurrently once each and
+		their input jobs are waited on together. Jobs are read lazily, and at most max_pending projects are
+		between their first upload and their finished analysis, which keeps both CodeDx and memory
+		from being flooded. A failing project records its error and stage without stopping the others.
+		When the client has an AnalysisManifest, projects whose files are unchanged reuse their previous
+		analysis and leave the pipeline after the upload stage without uploading anything.
+		Jobs of one project wait in CodeDx behind the jobs of the others, so they have no timeout of their own
+		by default; timeout bounds the whole run instead.
+
+		Args:
+			client (CodeDx): CodeDx client
+			upload_workers (int, optional): Projects uploading at once. Defaults to 4.
+			wait_workers (int, optional): Projects waiting on CodeDx jobs at once. Defaults to 16.
+			max_pending (int, optional): Projects in the pipeline at once. Defaults to upload_workers + wait_workers.
+			polling (PollingStrategy, optional): Polling schedule for the jobs. Defaults to the client strategy without its timeout.
+			timeout (float, optional): Seconds for the whole run, after which waiting projects fail. Defaults to the per-job
+				timeout of the client strategy for every wave of max_pending projects, waiting forever only if that strategy has no timeout.
+		"""
+		self.client = client
+		self.upload_workers = upload_workers
+		self.wait_workers = wait_workers
+		self.max_pending = max_pending or upload_workers + wait_workers
+		self.client_polling = getattr(client, "polling", None) or PollingStrategy()
+		self.polling = polling or self.client_polling.with_timeout(None)
+		self.timeout = timeout
+		self.stats = {stage: StageStats(stage) for stage in STAGES}
+		self._lock = threading.Lock()
+		self._create_lock = threading.Lock()
+		self._started = time.monotonic()
+		self._read = 0
+
+	def _stage(self, result: IngestResult, stage: str, work):
+		start = time.monotonic()
+		try:
+			value = work()
+		except Exception as e:
+			end = time.monotonic()
+			result.error = e
+			result.failed_stage = stage
+			logging.warning(f"Ingestion of { result.project } failed while in { stage }: { e }")
+			with self._lock:
+				self.stats[stage].record(start, end, False)
+			raise
+		end = time.monotonic()
+		result.timings[stage] = end - start
+		with self._lock:
+			self.stats[stage].record(start, end, True)
+		return value
+
+	def _project_id(self, project: str) -> int:
+		pid = self.client.get_project_id(project)
+		if pid:
+			return pid
+		with self._create_lock:
+			pid = self.client.get_project_id(project, use_cache=False)
+			if not pid:
+				logging.info(f"Project name { project } did not exist, creating new project.")
+				pid = self.client.create_project(project)["id"]
+		return pid
+
+	def _remaining(self) -> float:
+		"""Seconds left before the run times out, or None if it never does"""
+		timeout = self.timeout if self.timeout is not None else run_timeout(self.client_polling, self._read, self.max_pending)
+		if timeout is None:
+			return None
+		return max(self._started + timeout - time.monotonic(), 0)
+
+	def _wait_jobs(self, jobs: dict, job_desc: str):
+		tracker = JobTracker(self.client, jobs, self.polling)
+		failed = {tracked.label: tracked.error for tracked in tracker.wait_all(self._remaining()) if not tracked.ok}
+		if failed:
+			raise RuntimeError(f"{ job_desc } failed: { failed }")
+
+	def _upload(self, result: IngestResult) -> dict:
+		manifest = getattr(self.client, "manifest", None)
+		if manifest is not None:
+			result.digests = manifest.digest(result.files)
+			result.analysis = self.client.previous_analysis(result.project, result.digests)
+			if result.analysis is not None:
+				result.reused = True
+				return None
+		result.project_id = self._project_id(result.project)
+		result.prep_id = self.client.create_analysis(result.project_id)["prepId"]
+		jobs = self.client.upload_analyses(result.prep_id, result.files)
+		failed = {file_name: job for file_name, job in jobs.items() if isinstance(job, Exception)}
+		if failed:
+			raise RuntimeError(f"Failed to upload external reports for { result.project }: { failed }")
+		return jobs
+
+	def _start_analysis(self, result: IngestResult, input_jobs: dict) -> dict:
+		self._wait_jobs(input_jobs, f"Analyzing external report content for { result.project }")
+		prep = self.client.get_prep(result.prep_id)
+		if prep.get('verificationErrors'):
+			raise ValueError(f"Verification errors in { result.files }: { prep['verificationErrors'] }")
+		return self.client.run_analysis(result.prep_id)
+
+	def _analysis(self, result: IngestResult, analysis_job: dict) -> dict:
+		self._wait_jobs({result.project: analysis_job}, f"Running analysis for { result.project }")
+		analysis = self.client.get_analysis(result.project_id, analysis_job["analysisId"])
+		if result.digests is not None:
+			self.client.manifest.record(result.project, result.digests, analysis_job["analysisId"])
+		return analysis
+
+	def _wait(self, result: IngestResult, input_jobs: dict, pending: threading.Semaphore):
+		try:
+			analysis_job = self._stage(result, "inputs", lambda: self._start_analysis(result, input_jobs))
+			result.analysis = self._stage(result, "analysis", lambda: self._analysis(result, analysis_job))
+		except Exception:
+			pass
+		finally:
+			pending.release()
+
+	def run(self, jobs) -> list:
+		"""Runs an analysis for every (project, files) job
+
+		Args:
+			jobs (Iterable): (project name, file or list of files) tuples, read lazily
+
+		Returns:
+			list: IngestResult for every job, in order
+		"""
+		results = []
+		self._started = time.monotonic()
+		self._read = 0
+		pending = threading.Semaphore(self.max_pending)
+		waits = ThreadPoolExecutor(max_workers=self.wait_workers)
+
+		def upload(result):
+			try:
+				input_jobs = self._stage(result, "upload", lambda: self._upload(result))
+			except Exception:
+				input_jobs = None
+			if input_jobs is None:
+				pending.release()
+			else:
+				waits.submit(self._wait, result, input_jobs, pending)
+
+		try:
+			with ThreadPoolExecutor(max_workers=self.upload_workers) as uploads:
+				for project, files in jobs:
+					pending.acquire()
+					result = IngestResult(project, [files] if isinstance(files, str) else list(dict.fromkeys(files)))
+					results.append(result)
+					self._read = len(results)
+					uploads.submit(upload, result)
+		finally:
+			waits.shutdown(wait=True)
+		failed = sum(1 for result in results if not result.ok)
+		logging.info(f"Ingested { len(results) - failed } of { len(results) } projects: { list(self.stats.values()) }")
+		return results
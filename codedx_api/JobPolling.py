@@ -0,0 +1,180 @@
+import asyncio
+import logging
+import math
+import random
+import time
+
+FAILED_STATUSES = ("failed", "cancelled")
+
+
+class PollingStrategy(object):
+
+	def __init__(self,
+		initial_interval: float = 0.1,
+		fast_polls: int = 3,
+		backoff: float = 2.0,
+		max_interval: float = 15.0,
+		jitter: float = 0.1,
+		timeout: float = 60*10,
+		request_timeout: float = None):
+		"""Schedule for polling a CodeDx job until it completes
+
+		A few fast polls catch short jobs quickly, then the interval grows exponentially up to max_interval
+		so long jobs cost few status calls.
+
+		Args:
+			initial_interval (float, optional): Seconds between the first polls. Defaults to 0.1.
+			fast_polls (int, optional): Number of polls made at the initial interval. Defaults to 3.
+			backoff (float, optional): Factor the interval grows by after the fast polls. Defaults to 2.0.
+			max_interval (float, optional): Longest wait between polls in seconds. Defaults to 15.0.
+			jitter (float, optional): Random fraction added to or removed from each interval. Defaults to 0.1.
+			timeout (float, optional): Seconds to wait for the job in total, None waits forever. Defaults to 10 minutes.
+			request_timeout (float, optional): Timeout in seconds for each status request. Defaults to the client timeout.
+		"""
+		if initial_interval <= 0 or max_interval < initial_interval:
+			raise ValueError("Polling intervals must be positive and max_interval at least initial_interval.")
+		if backoff < 1:
+			raise ValueError("Polling backoff must be at least 1.")
+		self.initial_interval = initial_interval
+		self.fast_polls = fast_polls
+		self.backoff = backoff
+		self.max_interval = max_interval
+		self.jitter = jitter
+		self.timeout = timeout
+		self.request_timeout = request_timeout
+
+	def with_timeout(self, timeout: float):
+		"""Returns a copy of the strategy with another total timeout, None waiting forever"""
+		return PollingStrategy(self.initial_interval, self.fast_polls, self.backoff, self.max_interval, self.jitter, timeout, self.request_timeout)
+
+	def intervals(self):
+		"""Yields the seconds to wait before each poll"""
+		interval = self.initial_interval
+		polls = 0
+		while True:
+			if polls >= self.fast_polls:
+				interval = min(interval * self.backoff, self.max_interval)
+			polls += 1
+			yield interval * (1 + random.uniform(-self.jitter, self.jitter))
+
+
+class WaitStats(object):
+
+	def __init__(self, job_id: str, polls: int, elapsed: float, status: str):
+		"""Summary of a wait for a CodeDx job
+
+		Args:
+			job_id (str): Job id
+			polls (int): Number of status requests made
+			elapsed (float): Wall time of the wait in seconds
+			status (str): Final job status
+		"""
+		self.job_id = job_id
+		self.polls = polls
+		self.elapsed = elapsed
+		self.status = status
+
+	def __repr__(self):
+		return f"WaitStats(job_id={ repr(self.job_id) }, polls={ self.polls }, elapsed={ round(self.elapsed, 2) }, status={ repr(self.status) })"
+
+
+def run_timeout(polling: PollingStrategy, jobs: int, concurrency: int) -> float:
+	"""Default time limit for waiting on many jobs queued at once
+
+	CodeDx works through its queue a few jobs at a time, so the limit allows the per-job timeout
+	of the strategy for every wave of concurrency jobs.
+
+	Args:
+		polling (PollingStrategy): Strategy with the per-job timeout
+		jobs (int): Number of jobs
+		concurrency (int): Jobs expected to run at once
+
+	Returns:
+		float: Seconds to wait for all jobs, or None if the strategy never times out
+	"""
+	if polling.timeout is None:
+		return None
+	return polling.timeout * max(1, math.ceil(jobs / concurrency))
+
+
+def job_done(job: dict, job_desc: str = "") -> bool:
+	"""Checks whether a job has completed
+
+	Args:
+		job (dict): Job object from CodeDx
+		job_desc (str, optional): Message for errors. Defaults to "".
+
+	Raises:
+		RuntimeError: The job failed or was cancelled.
+
+	Returns:
+		bool: True if the job completed
+	"""
+	status = job.get("status")
+	if status in FAILED_STATUSES:
+		raise RuntimeError(f"Job { job.get('jobId') } { status }: { job_desc }")
+	return status == "completed"
+
+
+def _next_delay(delays, deadline: float, clock, job_desc: str) -> float:
+	delay = next(delays)
+	if deadline is not None:
+		remaining = deadline - clock()
+		if remaining <= 0:
+			raise RuntimeError(f"Timeout waiting for job to complete: { job_desc }")
+		delay = min(delay, remaining)
+	return delay
+
+
+def poll_job(job_status, job: dict, strategy: PollingStrategy, job_desc: str = "Waiting for job.", sleep=time.sleep, clock=time.monotonic) -> tuple:
+	"""Polls a job until it completes
+
+	Args:
+		job_status (Callable[[str, float], dict]): Fetches a job by id with a request timeout
+		job (dict): Job object from CodeDx
+		strategy (PollingStrategy): Polling schedule and timeouts
+		job_desc (str, optional): Message for debugging. Defaults to "Waiting for job.".
+
+	Raises:
+		RuntimeError: The job failed, was cancelled or did not complete before the timeout.
+
+	Returns:
+		tuple: Completed job object and WaitStats
+	"""
+	start = clock()
+	deadline = start + strategy.timeout if strategy.timeout is not None else None
+	delays = strategy.intervals()
+	polls = 0
+	while not job_done(job, job_desc):
+		sleep(_next_delay(delays, deadline, clock, job_desc))
+		logging.debug(job_desc)
+		job = job_status(job["jobId"], strategy.request_timeout)
+		polls += 1
+	return job, WaitStats(job.get("jobId"), polls, clock() - start, job.get("status"))
+
+
+async def async_poll_job(job_status, job: dict, strategy: PollingStrategy, job_desc: str = "Waiting for job.", sleep=asyncio.sleep, clock=time.monotonic) -> tuple:
+	"""Polls a job until it completes without blocking the event loop
+
+	Args:
+		job_status (Callable[[str, float], Awaitable[dict]]): Fetches a job by id with a request timeout
+		job (dict): Job object from CodeDx
+		strategy (PollingStrategy): Polling schedule and timeouts
+		job_desc (str, optional): Message for debugging. Defaults to "Waiting for job.".
+
+	Raises:
+		RuntimeError: The job failed, was cancelled or did not complete before the timeout.
+
+	Returns:
+		tuple: Completed job object and WaitStats
+	"""
+	start = clock()
+	deadline = start + strategy.timeout if strategy.timeout is not None else None
+	delays = strategy.intervals()
+	polls = 0
+	while not job_done(job, job_desc):
+		await sleep(_next_delay(delays, deadline, clock, job_desc))
+		logging.debug(job_desc)
+		job = await job_status(job["jobId"], strategy.request_timeout)
+		polls += 1
+	return job, WaitStats(job.get("jobId"), polls, clock() - start, job.get("status"))
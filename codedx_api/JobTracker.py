@@ -0,0 +1,185 @@
+import heapq
+import itertools
+import logging
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from codedx_api.JobPolling import PollingStrategy, WaitStats, job_done
+
+
+class TrackedJob(object):
+
+	def __init__(self, job: dict, label=None, polling: PollingStrategy = None, clock=time.monotonic):
+		"""A job followed by a JobTracker
+
+		Args:
+			job (dict): Job object returned when the job was queued, such as from generate_pdf or run_analysis
+			label (optional): Caller identifier for the job, such as a project name. Defaults to the job id.
+			polling (PollingStrategy, optional): Polling schedule for the job. Defaults to PollingStrategy().
+		"""
+		self.submitted = job
+		self.job = job
+		self.job_id = job["jobId"]
+		self.label = self.job_id if label is None else label
+		self.polling = polling or PollingStrategy()
+		self.error = None
+		self.stats = None
+		self.polls = 0
+		self.started = clock()
+		self.deadline = self.started + self.polling.timeout if self.polling.timeout is not None else None
+		self._delays = self.polling.intervals()
+
+	@property
+	def status(self) -> str:
+		return self.job.get("status")
+
+	@property
+	def done(self) -> bool:
+		return self.stats is not None
+
+	@property
+	def ok(self) -> bool:
+		return self.done and self.error is None
+
+	def __repr__(self):
+		return f"TrackedJob(label={ repr(self.label) }, job_id={ repr(self.job_id) }, status={ repr(self.status) }, error={ repr(self.error) })"
+
+
+class JobTracker(object):
+
+	def __init__(self, client, jobs=None, polling: PollingStrategy = None, max_workers: int = 8, clock=time.monotonic, sleep=time.sleep):
+		"""Waits on many CodeDx jobs at once
+
+		One scheduler loop keeps every job on its own polling schedule and sends the status requests
+		through a bounded pool of worker threads, so the total wait is as long as the slowest job
+		rather than the sum of all jobs.
+
+		Args:
+			client (Jobs): Client used for job_status requests
+			jobs (list | dict, optional): Jobs to track, or a dictionary of labels to jobs. Defaults to None.
+			polling (PollingStrategy, optional): Polling schedule for every job. Defaults to the client strategy.
+			max_workers (int, optional): Maximum number of status requests in flight. Defaults to 8.
+		"""
+		self.client = client
+		self.polling = polling or getattr(client, "polling", None) or PollingStrategy()
+		self.max_workers = max_workers
+		self.jobs = []
+		self._clock = clock
+		self._sleep = sleep
+		self._queue = []
+		self._finished = deque()
+		self._order = itertools.count()
+		if isinstance(jobs, dict):
+			for label, job in jobs.items():
+				self.add(job, label)
+		elif jobs:
+			for job in jobs:
+				self.add(job)
+
+	def __len__(self):
+		return len(self.jobs)
+
+	def add(self, job: dict, label=None) -> TrackedJob:
+		"""Starts tracking a job
+
+		Args:
+			job (dict): Job object with a jobId
+			label (optional): Caller identifier for the job. Defaults to the job id.
+
+		Returns:
+			TrackedJob: Tracked job
+		"""
+		tracked = TrackedJob(job, label, self.polling, self._clock)
+		self.jobs.append(tracked)
+		self._check(tracked, job)
+		return tracked
+
+	def _schedule(self, tracked: TrackedJob):
+		heapq.heappush(self._queue, (self._clock() + next(tracked._delays), next(self._order), tracked))
+
+	def _finish(self, tracked: TrackedJob, error: Exception = None):
+		tracked.error = error
+		tracked.stats = WaitStats(tracked.job_id, tracked.polls, self._clock() - tracked.started, tracked.status)
+		self._finished.append(tracked)
+
+	def _check(self, tracked: TrackedJob, job: dict):
+		tracked.job = job
+		try:
+			if job_done(job, str(tracked.label)):
+				self._finish(tracked)
+			else:
+				self._schedule(tracked)
+		except RuntimeError as e:
+			self._finish(tracked, e)
+
+	def _poll(self, tracked: TrackedJob) -> dict:
+		return self.client.job_status(tracked.job_id, tracked.polling.request_timeout)
+
+	def as_completed(self, timeout: float = None):
+		"""Yields tracked jobs as they complete, fail or time out
+
+		Failed jobs are yielded with their error set instead of raising, so one failure does not stop the others.
+
+		Args:
+			timeout (float, optional): Seconds to wait for all jobs, None waits forever. Defaults to None.
+
+		Raises:
+			RuntimeError: Jobs are still running when the timeout is reached.
+		"""
+		deadline = self._clock() + timeout if timeout is not None else None
+		in_flight = {}
+		with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+			while True:
+				while self._finished:
+					yield self._finished.popleft()
+				if not self._queue and not in_flight:
+					return
+				now = self._clock()
+				if deadline is not None and now >= deadline:
+					pending = len(self._queue) + len(in_flight)
+					raise RuntimeError(f"Timeout waiting for { pending } jobs to complete.")
+				while self._queue and self._queue[0][0] <= now and len(in_flight) < self.max_workers:
+					_, _, tracked = heapq.heappop(self._queue)
+					if tracked.deadline is not None and now >= tracked.deadline:
+						self._finish(tracked, RuntimeError(f"Timeout waiting for job to complete: { tracked.label }"))
+						continue
+					in_flight[pool.submit(self._poll, tracked)] = tracked
+				if self._finished:
+					continue
+				wait_time = None
+				if self._queue and len(in_flight) < self.max_workers:
+					wait_time = max(self._queue[0][0] - now, 0)
+				if deadline is not None:
+					remaining = max(deadline - now, 0)
+					wait_time = remaining if wait_time is None else min(wait_time, remaining)
+				if not in_flight:
+					self._sleep(wait_time)
+					continue
+				done, _ = wait(in_flight, timeout=wait_time, return_when=FIRST_COMPLETED)
+				for future in done:
+					tracked = in_flight.pop(future)
+					tracked.polls += 1
+					try:
+						job = future.result()
+					except Exception as e:
+						logging.warning(f"Error polling job { tracked.label }: { e }")
+						self._finish(tracked, e)
+						continue
+					self._check(tracked, job)
+
+	def wait_all(self, timeout: float = None) -> list:
+		"""Waits for every tracked job
+
+		Args:
+			timeout (float, optional): Seconds to wait for all jobs, None waits forever. Defaults to None.
+
+		Raises:
+			RuntimeError: Jobs are still running when the timeout is reached.
+
+		Returns:
+			list: Tracked jobs in the order they were added
+		"""
+		for _ in self.as_completed(timeout):
+			pass
+		return list(self.jobs)
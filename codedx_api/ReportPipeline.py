@@ -0,0 +1,149 @@
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from codedx_api.APIs.BaseAPIClient import ContentType
+from codedx_api.JobPolling import PollingStrategy, run_timeout
+from codedx_api.JobTracker import JobTracker
+
+REPORT_TYPES = {
+	"pdf": ("generate_pdf", ContentType.PDF, "pdf"),
+	"csv": ("generate_csv", ContentType.CSV, "csv"),
+	"xml": ("generate_xml", ContentType.XML, "xml")
+}
+
+
+class ReportResult(object):
+
+	def __init__(self, project: str, file_name: str):
+		"""Outcome of a report for one project
+
+		Args:
+			project (str): CodeDx project name
+			file_name (str): Report file path
+		"""
+		self.project = project
+		self.file_name = file_name
+		self.project_id = None
+		self.job_id = None
+		self.bytes = 0
+		self.error = None
+		self.elapsed = None
+
+	@property
+	def ok(self) -> bool:
+		return self.error is None and self.elapsed is not None
+
+	def __repr__(self):
+		return f"ReportResult(project={ repr(self.project) }, file_name={ repr(self.file_name) }, bytes={ self.bytes }, error={ repr(self.error) })"
+
+
+class ReportPipeline(object):
+
+	def __init__(self,
+		client,
+		submit_workers: int = 8,
+		download_workers: int = 4,
+		status_workers: int = 8,
+		polling: PollingStrategy = None,
+		timeout: float = None):
+		"""Generates and downloads reports for many projects at once
+
+		Project ids are resolved from the project cache or a single get_projects call, every report job is queued up front,
+		and each report is streamed to disk as soon as its job completes.
+		Because every job is queued at once, most of them wait in the CodeDx queue for a long time, so jobs
+		have no timeout of their own by default; timeout bounds the wait for the whole run instead, so a job stuck
+		in CodeDx fails with a timeout error rather than blocking the run forever.
+
+		Args:
+			client (CodeDx): CodeDx client
+			submit_workers (int, optional): Maximum number of report jobs queued at once. Defaults to 8.
+			download_workers (int, optional): Maximum number of concurrent downloads. Defaults to 4.
+			status_workers (int, optional): Maximum number of job status requests in flight. Defaults to 8.
+			polling (PollingStrategy, optional): Polling schedule for report jobs. Defaults to the client strategy without its timeout.
+			timeout (float, optional): Seconds to wait for all report jobs. Defaults to the per-job timeout of the client strategy
+				for every wave of submit_workers jobs, waiting forever only if that strategy has no timeout.
+		"""
+		self.client = client
+		self.submit_workers = submit_workers
+		self.download_workers = download_workers
+		self.status_workers = status_workers
+		self.client_polling = getattr(client, "polling", None) or PollingStrategy()
+		self.polling = polling or self.client_polling.with_timeout(None)
+		self.timeout = timeout
+
+	def run(self, projects: list, report_type: str = "pdf", output_dir: str = ".", filters: dict = None, **options) -> dict:
+		"""Generates a report for every project and downloads it
+
+		Errors are recorded per project, so one failing project does not stop the others.
+
+		Args:
+			projects (list): CodeDx project names
+			report_type (str, optional): "pdf", "csv" or "xml". Defaults to "pdf".
+			output_dir (str, optional): Directory for the reports, named [project].[type]. Defaults to ".".
+			filters (dict, optional): Report filters, only used by PDF reports. Defaults to None.
+			**options: Report options passed to generate_pdf, generate_csv or generate_xml.
+
+		Raises:
+			ValueError: Unsupported report type.
+
+		Returns:
+			dict: Project names to ReportResult
+		"""
+		if report_type not in REPORT_TYPES:
+			raise ValueError(f"Unsupported report type { report_type }. Choose from { list(REPORT_TYPES) }.")
+		generate_name, content_type, ext = REPORT_TYPES[report_type]
+		generate = getattr(self.client, generate_name)
+		if filters:
+			options["filters"] = filters
+		start = time.monotonic()
+		results = {project: ReportResult(project, os.path.join(output_dir, f"{ project }.{ ext }")) for project in projects}
+
+		for project, project_id in self.client.get_project_ids(projects).items():
+			results[project].project_id = project_id
+			if project_id is None:
+				results[project].error = ValueError(f"Project { project } does not exist.")
+
+		tracker = JobTracker(self.client, polling=self.polling, max_workers=self.status_workers)
+		with ThreadPoolExecutor(max_workers=self.submit_workers) as pool:
+			futures = {
+				pool.submit(generate, result.project_id, **options): result
+				for result in results.values() if result.error is None
+			}
+			for future in as_completed(futures):
+				result = futures[future]
+				try:
+					job = future.result()
+				except Exception as e:
+					result.error = e
+					continue
+				result.job_id = job["jobId"]
+				tracker.add(job, result.project)
+		logging.info(f"Queued { len(tracker) } { report_type } reports.")
+		timeout = self.timeout if self.timeout is not None else run_timeout(self.client_polling, len(tracker), self.submit_workers)
+
+		with ThreadPoolExecutor(max_workers=self.download_workers) as pool:
+			downloads = {}
+			try:
+				for tracked in tracker.as_completed(timeout):
+					result = results[tracked.label]
+					if tracked.error:
+						result.error = tracked.error
+						continue
+					downloads[pool.submit(self.client.job_result, tracked.job_id, content_type, result.file_name)] = result
+			except RuntimeError as e:
+				logging.warning(str(e))
+				for tracked in tracker.jobs:
+					if not tracked.done:
+						results[tracked.label].error = e
+			for future in as_completed(downloads):
+				result = downloads[future]
+				try:
+					result.bytes = future.result()
+					result.elapsed = time.monotonic() - start
+				except Exception as e:
+					result.error = e
+		failed = sum(1 for result in results.values() if not result.ok)
+		logging.info(f"Downloaded { len(results) - failed } of { len(results) } { report_type } reports.")
+		return results
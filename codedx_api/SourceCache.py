@@ -0,0 +1,151 @@
+import hashlib
+import os
+import threading
+import time
+
+from codedx_api.APIs.AnalysisAPI import latest_analysis_id
+
+
+class SourceFileCache(object):
+
+	def __init__(self, directory: str, client=None, max_bytes: int = 512 * 1024 * 1024, analysis_ttl: float = 60):
+		"""Bounded on-disk LRU cache of project source files
+
+		Files are keyed by project, file identity and the project's latest analysis id,
+		so a new analysis makes CodeDx the source again while unchanged files are never re-downloaded.
+		Pass it to CodeDx as file_cache to back get_finding_file.
+
+		Args:
+			directory (str): Cache directory
+			client (Findings, optional): Client used to download files and list analyses. Defaults to the client it is passed to.
+			max_bytes (int, optional): Maximum total size of cached files. Defaults to 512 MiB.
+			analysis_ttl (float, optional): Seconds a project's latest analysis id is trusted before it is checked again. Defaults to 60.
+		"""
+		self.client = client
+		self.directory = os.path.expanduser(directory)
+		self.max_bytes = max_bytes
+		self.analysis_ttl = analysis_ttl
+		self.hits = 0
+		self.misses = 0
+		self._analyses = {}
+		self._entries = {}
+		self._size = 0
+		self._loading = {}
+		self._lock = threading.Lock()
+		os.makedirs(self.directory, exist_ok=True)
+		for name in os.listdir(self.directory):
+			file_name = os.path.join(self.directory, name)
+			if name.endswith(".src") and os.path.isfile(file_name):
+				stat = os.stat(file_name)
+				self._entries[name] = (stat.st_size, stat.st_mtime)
+				self._size += stat.st_size
+
+	@property
+	def size(self) -> int:
+		return self._size
+
+	def latest_analysis(self, project: int):
+		"""Returns the id of the latest analysis of a project, checked at most once per analysis_ttl"""
+		with self._lock:
+			cached = self._analyses.get(project)
+			if cached and time.monotonic() < cached[1]:
+				return cached[0]
+		latest = latest_analysis_id(self.client.get_all_analysis(project))
+		with self._lock:
+			self._analyses[project] = (latest, time.monotonic() + self.analysis_ttl)
+		return latest
+
+	def _name(self, project: int, file, analysis) -> str:
+		kind = "id" if isinstance(file, int) else "path"
+		key = f"{ project }\0{ kind }\0{ file }\0{ analysis }"
+		return hashlib.sha256(key.encode()).hexdigest() + ".src"
+
+	def _read(self, name: str) -> bytes:
+		"""Reads a cached file and marks it as recently used, returning None if it was evicted meanwhile"""
+		file_name = os.path.join(self.directory, name)
+		try:
+			with open(file_name, 'rb') as f:
+				data = f.read()
+			now = time.time()
+			os.utime(file_name, (now, now))
+		except FileNotFoundError:
+			return None
+		with self._lock:
+			if name in self._entries:
+				self._entries[name] = (self._entries[name][0], now)
+			self.hits += 1
+		return data
+
+	def _write(self, name: str, data: bytes):
+		"""Stores a downloaded file, then evicts the least recently used files above max_bytes"""
+		if len(data) > self.max_bytes:
+			return
+		file_name = os.path.join(self.directory, name)
+		partial = f"{ file_name }.part"
+		with open(partial, 'wb') as f:
+			f.write(data)
+		os.replace(partial, file_name)
+		evicted = []
+		with self._lock:
+			old = self._entries.get(name)
+			if old:
+				self._size -= old[0]
+			self._entries[name] = (len(data), time.time())
+			self._size += len(data)
+			while self._size > self.max_bytes:
+				oldest = min(self._entries, key=lambda entry: self._entries[entry][1])
+				size, _ = self._entries.pop(oldest)
+				self._size -= size
+				evicted.append(oldest)
+		for oldest in evicted:
+			try:
+				os.remove(os.path.join(self.directory, oldest))
+			except FileNotFoundError:
+				pass
+
+	def get(self, project: int, file) -> bytes:
+		"""Returns a source file from the cache, downloading it on a miss
+
+		Only the bookkeeping is done under the lock, so hits and downloads of different files run in parallel.
+
+		Args:
+			project (int): Project id
+			file (int | str): Path id, or the literal path to the file
+
+		Returns:
+			bytes: File content
+		"""
+		name = self._name(project, file, self.latest_analysis(project))
+		while True:
+			with self._lock:
+				cached = name in self._entries
+				if not cached:
+					loading = self._loading.get(name)
+					if loading is None:
+						loading = self._loading[name] = threading.Event()
+						self.misses += 1
+						break
+			if not cached:
+				loading.wait()
+				continue
+			data = self._read(name)
+			if data is not None:
+				return data
+			with self._lock:
+				if name in self._entries:
+					self._size -= self._entries.pop(name)[0]
+		try:
+			data = self.client.get_finding_file(project, file, use_cache=False, by="id" if isinstance(file, int) else "path")
+			if isinstance(data, str):
+				data = data.encode()
+			self._write(name, data)
+			return data
+		finally:
+			with self._lock:
+				del self._loading[name]
+			loading.set()
+
+	def stats(self) -> dict:
+		"""Returns hit and miss counts, the number of cached files and their total size"""
+		with self._lock:
+			return {"hits": self.hits, "misses": self.misses, "files": len(self._entries), "bytes": self._size}
@@ -0,0 +1,133 @@
+import logging
+from collections import OrderedDict
+
+from codedx_api.APIs.Concurrency import map_bounded
+from codedx_api.APIs.FindingFilter import FINDING_ID_FILTER
+from codedx_api.APIs.FindingsAPI import FindingStatus
+from codedx_api.BulkTriage import BulkTriageRunner
+
+MAX_FILTER_IDS = 500
+
+
+class TriageBatch(object):
+
+	def __init__(self, project, status: str, findings: list):
+		"""Findings of one project that get the same status in a single bulk update
+
+		Args:
+			project (str | int): CodeDx project name or id
+			status (str): New finding status
+			findings (list): Finding ids
+		"""
+		self.project = project
+		self.status = status
+		self.findings = findings
+
+	@property
+	def filters(self) -> dict:
+		return {FINDING_ID_FILTER: self.findings}
+
+	def update(self) -> tuple:
+		"""Returns the (project, status, filters) tuple for BulkTriageRunner"""
+		return self.project, self.status, self.filters
+
+	def __repr__(self):
+		return f"TriageBatch(project={ repr(self.project) }, status={ repr(self.status) }, findings={ len(self.findings) })"
+
+
+def plan_batches(decisions, chunk_size: int = MAX_FILTER_IDS) -> list:
+	"""Coalesces per-finding status decisions into as few bulk updates as possible
+
+	Decisions are grouped by project and status, and each group is split into id filters of at most chunk_size findings.
+	When a finding has several decisions the last one wins.
+
+	Args:
+		decisions (Iterable): (project, finding id, status) tuples
+		chunk_size (int, optional): Maximum number of finding ids in one filter. Defaults to MAX_FILTER_IDS.
+
+	Raises:
+		ValueError: Unknown finding status.
+
+	Returns:
+		list: TriageBatch objects
+	"""
+	latest = OrderedDict()
+	for project, finding, status in decisions:
+		latest[(project, finding)] = FindingStatus(status).format()
+	groups = OrderedDict()
+	for (project, finding), status in latest.items():
+		groups.setdefault((project, status), []).append(finding)
+	batches = []
+	for (project, status), findings in groups.items():
+		findings.sort()
+		for start in range(0, len(findings), chunk_size):
+			batches.append(TriageBatch(project, status, findings[start:start + chunk_size]))
+	return batches
+
+
+class TriagePlanner(object):
+
+	def __init__(self, client, chunk_size: int = MAX_FILTER_IDS, check_workers: int = 8, submit_workers: int = 8, runner: BulkTriageRunner = None):
+		"""Applies reviewer decisions with the fewest bulk status update jobs
+
+		Args:
+			client (CodeDx): CodeDx client
+			chunk_size (int, optional): Maximum number of finding ids in one filter. Defaults to MAX_FILTER_IDS.
+			check_workers (int, optional): Concurrent get_finding_count checks. Defaults to 8.
+			submit_workers (int, optional): Maximum number of update jobs queued at once. Defaults to 8.
+			runner (BulkTriageRunner, optional): Runner for the update jobs. Defaults to a new BulkTriageRunner.
+		"""
+		self.client = client
+		self.chunk_size = chunk_size
+		self.check_workers = check_workers
+		self.runner = runner or BulkTriageRunner(client, submit_workers)
+		self.skipped = []
+
+	def _resolver(self, batches: list):
+		"""Resolves the project names of the batches with one lookup, returning a project -> id function"""
+		names = list(dict.fromkeys(batch.project for batch in batches if not isinstance(batch.project, int)))
+		project_ids = self.client.get_project_ids(names) if names else {}
+		return lambda project: project if isinstance(project, int) else project_ids.get(project)
+
+	def prune(self, batches: list) -> list:
+		"""Drops batches whose findings all have their new status already
+
+		One get_finding_count per batch, run concurrently. A batch whose check fails is kept.
+
+		Args:
+			batches (list): TriageBatch objects
+
+		Returns:
+			list: Batches that still change at least one finding
+		"""
+		project_id = self._resolver(batches)
+
+		def already_done(batch) -> bool:
+			pid = project_id(batch.project)
+			if pid is None:
+				return False
+			filters = dict(batch.filters, status=batch.status)
+			return self.client.get_finding_count(pid, {"filter": filters})["count"] >= len(batch.findings)
+
+		pending, self.skipped = [], []
+		done = {}
+		for batch, result, error in map_bounded(already_done, batches, self.check_workers):
+			if error is not None:
+				logging.warning(f"Could not check { batch }: { error }")
+			done[id(batch)] = result is True
+		for batch in batches:
+			(self.skipped if done[id(batch)] else pending).append(batch)
+		logging.info(f"Skipping { len(self.skipped) } of { len(batches) } triage batches with no changes.")
+		return pending
+
+	def apply(self, decisions) -> list:
+		"""Plans, prunes and runs the bulk updates for a list of decisions
+
+		Args:
+			decisions (Iterable): (project, finding id, status) tuples
+
+		Returns:
+			list: TriageResult for every bulk update that was run, with skipped batches kept in skipped
+		"""
+		batches = self.prune(plan_batches(decisions, self.chunk_size))
+		return self.runner.run([batch.update() for batch in batches])
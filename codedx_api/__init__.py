@@ -1,2 +1,3 @@
 """Initialize"""
 from .CodeDxAPI import CodeDx
+from .AsyncCodeDxAPI import AsyncCodeDx
@@ -13,6 +13,9 @@ setup(
     install_requires=[
         'requests'
     ],
+    extras_require={
+        'async': ['httpx']
+    },
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: TBD",
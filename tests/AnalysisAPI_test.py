@@ -1,5 +1,7 @@
+import io
 import os
 import unittest
+import zipfile
 from unittest.mock import patch
 
 from codedx_api.APIs.AnalysisAPI import Analysis
@@ -19,20 +21,20 @@ class AnalysisAPI_test(unittest.TestCase):
 		self.prep_id = "test_prep_id"
 
 
-	@patch('requests.post')
+	@patch('requests.Session.post')
 	def test_create_analysis(self, mock_create_analysis):
 		mock_create_analysis.return_value = JSONMock()
 		result = self.analysis_api.create_analysis(self.test_project)
 		self.assertIsInstance(result, dict)
 
 
-	@patch('requests.get')
+	@patch('requests.Session.get')
 	def test_get_prep(self, mock_get_prep):
 		mock_get_prep.return_value = JSONMock()
 		result = self.analysis_api.get_prep(self.prep_id)
 
 
-	@patch('requests.post')
+	@patch('requests.Session.post')
 	def test_upload_analysis(self, mock_upload_analysis):
 		mock_upload_analysis.return_value = JSONMock()
 		mock_upload_analysis.return_value.status_code = 202
@@ -45,7 +47,33 @@ class AnalysisAPI_test(unittest.TestCase):
 			self.analysis_api.upload_analysis(self.prep_id, "not_valid_ext.html")
 
 
-	@patch('requests.post')
+	@patch('requests.Session.post')
+	def test_upload_analysis_stream(self, mock_upload_analysis):
+		mock_upload_analysis.return_value = JSONMock()
+		mock_upload_analysis.return_value.status_code = 202
+		test_file_name = os.path.join(os.path.dirname(__file__), 'testdata.xml')
+		with open(test_file_name, 'rb') as f:
+			expected = f.read()
+		updates = []
+		self.analysis_api.upload_analysis(self.prep_id, test_file_name, compress=True, progress=lambda sent, rate: updates.append(sent))
+		kwargs = mock_upload_analysis.call_args.kwargs
+		body = b"".join(kwargs["data"])
+		boundary = kwargs["headers"]["Content-Type"].split("boundary=")[1]
+		self.assertIn(b'filename="testdata.xml.zip"', body)
+		self.assertIn(b'Content-Type: application/zip', body)
+		archive = body.split(b"\r\n\r\n", 1)[1].rsplit(f"\r\n--{ boundary }--".encode(), 1)[0]
+		self.assertEqual(zipfile.ZipFile(io.BytesIO(archive)).read("testdata.xml"), expected)
+		self.assertEqual(updates[-1], len(body))
+
+		chunks = iter([b"<xml>", b"</xml>"])
+		self.analysis_api.upload_analysis(self.prep_id, "scan.xml", source=chunks, client_request_id="req")
+		kwargs = mock_upload_analysis.call_args.kwargs
+		body = b"".join(kwargs["data"])
+		self.assertIn(b'filename="scan.xml"\r\nContent-Type: text/xml\r\n\r\n<xml></xml>\r\n', body)
+		self.assertEqual(kwargs["headers"]["X-Client-Request-Id"], "req")
+
+
+	@patch('requests.Session.post')
 	def test_run_analysis(self, mock_run_analysis):
 		mock_run_analysis.return_value = JSONMock()
 		mock_run_analysis.return_value.status_code = 202
@@ -53,63 +81,63 @@ class AnalysisAPI_test(unittest.TestCase):
 		self.assertIsInstance(result, dict)
 
 
-	@patch('requests.get')
+	@patch('requests.Session.get')
 	def test_get_input_metadata(self, mock_get_input_metadata):
 		mock_get_input_metadata.return_value = JSONMock()
 		result = self.analysis_api.get_input_metadata('1234', 'TEST')
 		self.assertIsInstance(result, dict)
 
 
-	@patch('requests.delete')
+	@patch('requests.Session.delete')
 	def test_delete_input(self, mock_delete_input):
 		mock_delete_input.return_value = SuccessMock()
 		result = self.analysis_api.delete_input('1234', 'TEST')
 		self.assertIsNone(result)
 
 
-	@patch('requests.delete')
+	@patch('requests.Session.delete')
 	def test_delete_pending(self, mock_delete_pending):
 		mock_delete_pending.return_value = SuccessMock()
 		result = self.analysis_api.delete_pending('1234', 'TEST')
 		self.assertIsNone(result)
 
 
-	@patch('requests.put')
+	@patch('requests.Session.put')
 	def test_toggle_display_tag(self, mock_toggle_display_tag):
 		mock_toggle_display_tag.return_value = JSONMock()
 		result = self.analysis_api.toggle_display_tag('1234', 'inputId', 'tagID', True)
 		self.assertIsInstance(result, dict)
 
 
-	@patch('requests.put')
+	@patch('requests.Session.put')
 	def test_enable_display_tag(self, mock_enable_display_tag):
 		mock_enable_display_tag.return_value = JSONMock()
 		result = self.analysis_api.enable_display_tag('1234', 'inputId', 'tagID')
 		self.assertIsInstance(result, dict)
 
 
-	@patch('requests.put')
+	@patch('requests.Session.put')
 	def test_disable_display_tag(self, mock_disable_display_tag):
 		mock_disable_display_tag.return_value = JSONMock()
 		result = self.analysis_api.disable_display_tag('1234', 'inputId', 'tagID')
 		self.assertIsInstance(result, dict)
 
 
-	@patch('requests.get')
+	@patch('requests.Session.get')
 	def test_get_all_analysis(self, mock_get_all_analysis):
 		mock_get_all_analysis.return_value = JSONMock()
 		result = self.analysis_api.get_all_analysis(self.test_project)
 		self.assertIsInstance(result, dict)
 
 
-	@patch('requests.get')
+	@patch('requests.Session.get')
 	def test_get_analysis(self, mock_get_analysis):
 		mock_get_analysis.return_value = JSONMock()
 		result = self.analysis_api.get_analysis(self.test_project, 0)
 		self.assertIsInstance(result, dict)
 
 
-	@patch('requests.put')
+	@patch('requests.Session.put')
 	def test_name_analysis(self, mock_name_analysis):
 		mock_name_analysis.return_value = SuccessMock()
 		mock_name_analysis.return_value.status_code = 204
@@ -0,0 +1,70 @@
+import hashlib
+import os
+import tempfile
+import unittest
+
+from codedx_api.AnalysisManifest import AnalysisManifest, file_digest
+
+
+class AnalysisManifest_test(unittest.TestCase):
+
+
+	def setUp(self):
+		unittest.TestCase.setUp(self)
+		self.tmp = tempfile.TemporaryDirectory()
+		self.addCleanup(self.tmp.cleanup)
+		self.file_name = os.path.join(self.tmp.name, "scan.xml")
+		with open(self.file_name, "wb") as f:
+			f.write(b"<report/>" * 1000)
+
+
+	def test_file_digest(self):
+		expected = hashlib.sha256(b"<report/>" * 1000).hexdigest()
+		self.assertEqual(file_digest(self.file_name, chunk_size=7), expected)
+
+
+	def test_lookup(self):
+		manifest = AnalysisManifest()
+		digests = manifest.digest([self.file_name])
+		self.assertEqual([name for name, _ in digests], ["scan.xml"])
+		self.assertIsNone(manifest.lookup("WebGoat", digests))
+		manifest.record("WebGoat", digests, 3)
+		self.assertEqual(manifest.lookup("WebGoat", digests), 3)
+		self.assertIsNone(manifest.lookup("Juice Shop", digests))
+		with open(self.file_name, "ab") as f:
+			f.write(b" ")
+		self.assertIsNone(manifest.lookup("WebGoat", manifest.digest([self.file_name])))
+		manifest.forget("WebGoat")
+		self.assertIsNone(manifest.lookup("WebGoat", digests))
+
+
+	def test_same_file_names(self):
+		manifest = AnalysisManifest()
+		files = []
+		for directory in ("sast", "sca"):
+			os.makedirs(os.path.join(self.tmp.name, directory))
+			files.append(os.path.join(self.tmp.name, directory, "results.json"))
+			with open(files[-1], "w") as f:
+				f.write(directory)
+		digests = manifest.digest(files)
+		self.assertEqual(len(digests), 2)
+		manifest.record("WebGoat", digests, 3)
+		self.assertEqual(manifest.lookup("WebGoat", manifest.digest(files)), 3)
+		with open(files[0], "w") as f:
+			f.write("changed")
+		self.assertIsNone(manifest.lookup("WebGoat", manifest.digest(files)))
+
+
+	def test_persistence(self):
+		path = os.path.join(self.tmp.name, "manifest.json")
+		manifest = AnalysisManifest(path)
+		digests = manifest.digest([self.file_name])
+		manifest.record("WebGoat", digests, 3)
+		reloaded = AnalysisManifest(path)
+		self.assertEqual(len(reloaded), 1)
+		self.assertEqual(reloaded.lookup("WebGoat", digests), 3)
+		self.assertFalse(os.path.exists(f"{ path }.part"))
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,137 @@
+import os
+import tempfile
+import threading
+import unittest
+
+from codedx_api.AnalysisManifest import AnalysisManifest
+from codedx_api.CodeDxAPI import CodeDx
+from codedx_api.JobPolling import PollingStrategy
+from tests.MockServer import MockServer
+
+# DO NOT UPDATE - MOCK REQUESTS DO NOT REQUIRE CREDENTIALS
+api_key = "0000-0000-0000-0000"
+json_type = 'application/json;charset=utf-8'
+
+
+class AnalysisRoute(object):
+	"""Answers the analysis prep workflow, failing the input job of files named bad.xml"""
+
+	def __init__(self, verification_errors: list = None):
+		self.verification_errors = verification_errors or []
+		self.uploads = 0
+		self.lock = threading.Lock()
+
+	def __call__(self, request):
+		path = request.path.replace("/codedx", "", 1)
+		if path == "/api/projects/query":
+			return 200, json_type, [{"id": 7, "name": "WebGoat"}]
+		if path == "/api/analysis-prep":
+			return 200, json_type, {"prepId": "prep"}
+		if path.endswith("/upload"):
+			with self.lock:
+				self.uploads += 1
+				upload = self.uploads
+			job = "bad" if b'bad.xml"' in request.body else f"upload{ upload }"
+			return 202, json_type, {"jobId": job}
+		if path.startswith("/api/jobs/"):
+			job = path.split("/")[3]
+			return 200, json_type, {"jobId": job, "status": "failed" if job == "bad" else "completed"}
+		if path == "/api/analysis-prep/prep":
+			return 200, json_type, {"inputIds": ["input"], "verificationErrors": self.verification_errors}
+		if path.endswith("/analyze"):
+			return 202, json_type, {"jobId": "analysis", "analysisId": 3}
+		if path == "/api/projects/7/analyses/3":
+			return 200, json_type, {"id": 3}
+		return 404, "text/plain", b"Not found"
+
+
+class Analyze_test(unittest.TestCase):
+
+
+	def setUp(self):
+		unittest.TestCase.setUp(self)
+		self.tmp = tempfile.TemporaryDirectory()
+		self.addCleanup(self.tmp.cleanup)
+		self.files = []
+		for name in ("sast.xml", "sca.json", "dast.xml", "bad.xml"):
+			file_name = os.path.join(self.tmp.name, name)
+			with open(file_name, "w") as f:
+				f.write("<report/>" if name.endswith(".xml") else "{}")
+			self.files.append(file_name)
+		self.polling = PollingStrategy(initial_interval=0.01, jitter=0)
+
+
+	def test_analyze_many(self):
+		route = AnalysisRoute()
+		with MockServer(route) as server:
+			with CodeDx(server.url, api_key, polling=self.polling) as cdx:
+				result = cdx.analyze("WebGoat", self.files[:3])
+		self.assertEqual(result, {"id": 3})
+		self.assertEqual(route.uploads, 3)
+		paths = [request.path for request in server.requests]
+		self.assertEqual(paths.count("/codedx/api/analysis-prep"), 1)
+		self.assertEqual(paths.count("/codedx/api/analysis-prep/prep"), 1)
+		self.assertEqual(paths.count("/codedx/api/analysis-prep/prep/analyze"), 1)
+
+
+	def test_duplicate_files(self):
+		route = AnalysisRoute()
+		with MockServer(route) as server:
+			with CodeDx(server.url, api_key, polling=self.polling) as cdx:
+				self.assertEqual(cdx.analyze("WebGoat", [self.files[0], self.files[1], self.files[0]]), {"id": 3})
+		self.assertEqual(route.uploads, 2)
+
+
+	def test_analyze_one(self):
+		with MockServer(AnalysisRoute()) as server:
+			with CodeDx(server.url, api_key, polling=self.polling) as cdx:
+				self.assertEqual(cdx.analyze("WebGoat", self.files[0]), {"id": 3})
+
+
+	def test_failed_input(self):
+		with MockServer(AnalysisRoute()) as server:
+			with CodeDx(server.url, api_key, polling=self.polling) as cdx:
+				with self.assertRaises(RuntimeError):
+					cdx.analyze("WebGoat", self.files)
+		self.assertNotIn("/codedx/api/analysis-prep/prep/analyze", [request.path for request in server.requests])
+
+
+	def test_verification_errors(self):
+		with MockServer(AnalysisRoute(["Unknown format"])) as server:
+			with CodeDx(server.url, api_key, polling=self.polling) as cdx:
+				with self.assertRaises(ValueError):
+					cdx.upload_run_analysis(7, self.files[:2])
+
+
+	def test_project_created_after_load(self):
+		route = AnalysisRoute()
+		def stale_route(request):
+			if request.path == "/codedx/api/projects":
+				return 200, json_type, {"projects": []}
+			return route(request)
+		with MockServer(stale_route) as server:
+			with CodeDx(server.url, api_key, polling=self.polling) as cdx:
+				cdx.get_projects()
+				self.assertEqual(cdx.analyze("WebGoat", self.files[0]), {"id": 3})
+		self.assertNotIn("PUT", [request.method for request in server.requests])
+
+
+	def test_manifest(self):
+		route = AnalysisRoute()
+		manifest = AnalysisManifest(os.path.join(self.tmp.name, "manifest.json"))
+		with MockServer(route) as server:
+			with CodeDx(server.url, api_key, polling=self.polling, manifest=manifest) as cdx:
+				self.assertEqual(cdx.analyze("WebGoat", self.files[:2]), {"id": 3})
+				self.assertEqual(cdx.analyze("WebGoat", self.files[:2]), {"id": 3})
+				self.assertEqual(route.uploads, 2)
+				with open(self.files[0], "a") as f:
+					f.write(" ")
+				cdx.analyze("WebGoat", self.files[:2])
+				self.assertEqual(route.uploads, 4)
+		paths = [request.path for request in server.requests]
+		self.assertEqual(paths.count("/codedx/api/analysis-prep"), 2)
+		self.assertEqual(paths.count("/codedx/api/projects/7/analyses/3"), 3)
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,98 @@
+import asyncio
+import os
+import tempfile
+import unittest
+
+from requests.exceptions import HTTPError
+
+from codedx_api.AsyncCodeDxAPI import AsyncCodeDx
+
+try:
+	import httpx
+except ImportError:
+	httpx = None
+
+# DO NOT UPDATE - MOCK REQUESTS DO NOT REQUIRE CREDENTIALS
+api_key = "0000-0000-0000-0000"
+base_url = "https://codedx.example.org/codedx"
+json_type = 'application/json;charset=utf-8'
+
+
+def codedx_route(request):
+	"""Answers the requests needed by the composite AsyncCodeDx methods"""
+	path = request.url.path
+	if path.endswith("/api/projects/query"):
+		return httpx.Response(200, headers={"Content-Type": json_type}, json=[{"id": 7, "name": "WebGoat"}])
+	if path.endswith("/report/pdf"):
+		return httpx.Response(200, headers={"Content-Type": json_type}, json={"jobId": "report-job"})
+	if path.endswith("/result"):
+		return httpx.Response(200, headers={"Content-Type": "application/pdf"}, content=b"%PDF")
+	if "/api/jobs/" in path:
+		return httpx.Response(200, headers={"Content-Type": json_type}, json={"jobId": path.split("/")[-1], "status": "completed"})
+	if path.endswith("/api/analysis-prep"):
+		return httpx.Response(200, headers={"Content-Type": json_type}, json={"prepId": "prep"})
+	if path.endswith("/upload"):
+		return httpx.Response(202, headers={"Content-Type": json_type}, json={"jobId": "upload-job"})
+	if path.endswith("/analyze"):
+		return httpx.Response(202, headers={"Content-Type": json_type}, json={"jobId": "analysis-job", "analysisId": 3})
+	if path.endswith("/analysis-prep/prep"):
+		return httpx.Response(200, headers={"Content-Type": json_type}, json={"inputIds": ["input"], "verificationErrors": []})
+	if path.endswith("/api/projects/7/analyses/3"):
+		return httpx.Response(200, headers={"Content-Type": json_type}, json={"id": 3})
+	if "/api/findings/" in path:
+		return httpx.Response(200, headers={"Content-Type": json_type}, json={"id": int(path.split("/")[-1])})
+	return httpx.Response(404, text="Not found")
+
+
+@unittest.skipIf(httpx is None, "httpx is not installed")
+class AsyncCodeDxAPI_test(unittest.IsolatedAsyncioTestCase):
+
+
+	async def asyncSetUp(self):
+		client = httpx.AsyncClient(transport=httpx.MockTransport(codedx_route))
+		self.codedx_api = AsyncCodeDx(base_url, api_key, client=client)
+
+
+	async def asyncTearDown(self):
+		await self.codedx_api.client.aclose()
+
+
+	async def test_concurrent_requests(self):
+		results = await asyncio.gather(*[self.codedx_api.get_finding(i) for i in range(200)])
+		self.assertEqual([result["id"] for result in results], list(range(200)))
+
+
+	async def test_error_response(self):
+		with self.assertRaises(HTTPError):
+			await self.codedx_api.get_projects()
+
+
+	async def test_get_project_id(self):
+		result = await self.codedx_api.get_project_id("WebGoat")
+		self.assertEqual(result, 7)
+
+
+	async def test_get_pdf(self):
+		with tempfile.TemporaryDirectory() as tmp:
+			file_name = os.path.join(tmp, "report.pdf")
+			await self.codedx_api.get_pdf("WebGoat", file_name=file_name)
+			with open(file_name, 'rb') as f:
+				self.assertEqual(f.read(), b"%PDF")
+
+
+	async def test_analyze(self):
+		test_file_name = os.path.join(os.path.dirname(__file__), 'testdata.xml')
+		result = await self.codedx_api.analyze("WebGoat", test_file_name)
+		self.assertEqual(result, {"id": 3})
+		result = await self.codedx_api.analyze("WebGoat", [test_file_name, test_file_name])
+		self.assertEqual(result, {"id": 3})
+
+
+	async def test_async_context_manager(self):
+		async with AsyncCodeDx(base_url, api_key, max_connections=5) as codedx_api:
+			self.assertFalse(codedx_api.client.is_closed)
+		self.assertTrue(codedx_api.client.is_closed)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import json
+import time
+import unittest
+
+from codedx_api.BulkTriage import BulkTriageRunner, triage_report
+from codedx_api.CodeDxAPI import CodeDx
+from codedx_api.JobPolling import PollingStrategy
+from tests.MockServer import MockServer
+
+# DO NOT UPDATE - MOCK REQUESTS DO NOT REQUIRE CREDENTIALS
+api_key = "0000-0000-0000-0000"
+json_type = 'application/json;charset=utf-8'
+
+
+def triage_route(request):
+	path = request.path.replace("/codedx", "", 1)
+	if path == "/api/projects":
+		projects = [{"id": i, "name": f"project{ i }"} for i in range(1, 11)]
+		return 200, json_type, {"projects": projects}
+	if path.endswith("/bulk-status-update"):
+		project = path.split("/")[3]
+		if project == "7":
+			return 500, "text/plain", b"Update error"
+		status = json.loads(request.body)["status"]
+		return 200, json_type, {"jobId": f"job{ project }-{ status }"}
+	if path.startswith("/api/jobs/"):
+		job = path.split("/")[3]
+		return 200, json_type, {"jobId": job, "status": "failed" if job == "job9-fixed" else "completed"}
+	return 404, "text/plain", b"Not found"
+
+
+class BulkTriage_test(unittest.TestCase):
+
+
+	def test_run(self):
+		updates = [(f"project{ i }", "false-positive", {"detectionMethod": "ZAP"}) for i in range(1, 11)]
+		updates += [(9, "fixed", {"finding": [1, 2]}), ("missing", "ignored", None)]
+		polling = PollingStrategy(initial_interval=0.01, jitter=0)
+		with MockServer(triage_route) as server:
+			with CodeDx(server.url, api_key, polling=polling) as cdx:
+				results = BulkTriageRunner(cdx, submit_workers=4).run(updates)
+		self.assertEqual([result.project for result in results], [update[0] for update in updates])
+		self.assertEqual(results[0].job_id, "job1-false-positive")
+		self.assertTrue(results[0].ok)
+		self.assertFalse(results[6].ok)
+		self.assertIsInstance(results[10].error, RuntimeError)
+		self.assertIsInstance(results[11].error, ValueError)
+		self.assertEqual(sum(1 for result in results if result.ok), 9)
+		update_requests = [request for request in server.requests if request.path.endswith("/bulk-status-update")]
+		self.assertEqual(len(update_requests), 11)
+		self.assertEqual(json.loads(update_requests[0].body)["filter"], {"detectionMethod": "ZAP"})
+		project_requests = [request for request in server.requests if request.path == "/codedx/api/projects"]
+		self.assertEqual(len(project_requests), 1)
+
+		report = triage_report(results)
+		self.assertEqual(report["project1"], {"updates": 1, "succeeded": 1, "failed": 0, "errors": []})
+		self.assertEqual(report["project7"]["failed"], 1)
+		self.assertEqual(report[9]["failed"], 1)
+
+
+	def test_update_statuses_bulk(self):
+		polling = PollingStrategy(initial_interval=0.01, jitter=0)
+		with MockServer(triage_route) as server:
+			with CodeDx(server.url, api_key, polling=polling) as cdx:
+				results = cdx.update_statuses_bulk([(1, "ignored", None), (2, "not-a-status", None)])
+		self.assertTrue(results[0].ok)
+		self.assertIsInstance(results[1].error, ValueError)
+
+
+	def test_queued_jobs(self):
+		started = time.monotonic()
+		def queued_route(request):
+			if request.path.startswith("/codedx/api/jobs/"):
+				status = "completed" if time.monotonic() - started > 0.3 else "queued"
+				return 200, json_type, {"jobId": request.path.split("/")[4], "status": status}
+			return triage_route(request)
+		polling = PollingStrategy(initial_interval=0.01, max_interval=0.02, jitter=0, timeout=0.05)
+		with MockServer(queued_route) as server:
+			with CodeDx(server.url, api_key, polling=polling) as cdx:
+				results = BulkTriageRunner(cdx, timeout=5).run([(1, "ignored", None), (2, "ignored", None)])
+				self.assertTrue(all(result.ok for result in results))
+				started = time.monotonic() + 60
+				results = BulkTriageRunner(cdx, timeout=0.2).run([(1, "ignored", None)])
+				self.assertIsInstance(results[0].error, RuntimeError)
+				results = BulkTriageRunner(cdx, submit_workers=1).run([(1, "ignored", None), (2, "ignored", None)])
+				self.assertTrue(all(isinstance(result.error, RuntimeError) for result in results))
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -15,3 +15,27 @@ class CodeDxAPI_test(unittest.TestCase):
 
 	def test_create_codedx(self):
 		self.assertTrue(1 == 1)
+
+	def test_shared_session(self):
+		self.assertIs(self.codedx_api.projects_api.session, self.codedx_api.session)
+		adapter = self.codedx_api.session.get_adapter("https://codedx.example.org")
+		self.assertEqual(adapter._pool_maxsize, 10)
+
+	def test_pool_options(self):
+		codedx_api = CodeDx(api_key, base_url, pool_maxsize=32, keep_alive=False, timeout=5)
+		adapter = codedx_api.session.get_adapter("https://codedx.example.org")
+		self.assertEqual(adapter._pool_maxsize, 32)
+		self.assertEqual(codedx_api.headers["Connection"], "close")
+		self.assertEqual(codedx_api.projects_api.timeout, 5)
+
+	@patch('requests.Session.close')
+	def test_context_manager(self, mock_close):
+		with CodeDx(api_key, base_url) as codedx_api:
+			self.assertIsInstance(codedx_api, CodeDx)
+		mock_close.assert_called_once()
+
+	@patch('requests.Session.close')
+	def test_borrowed_session_not_closed(self, mock_close):
+		codedx_api = CodeDx(api_key, base_url, session=self.codedx_api.session)
+		codedx_api.close()
+		mock_close.assert_not_called()
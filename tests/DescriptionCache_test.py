@@ -0,0 +1,70 @@
+import os
+import tempfile
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from codedx_api.DescriptionCache import DescriptionCache, rule_key
+
+
+class FakeFindings(object):
+	"""Findings client where finding i belongs to rule i % 3"""
+
+	def __init__(self):
+		self.lock = threading.Lock()
+		self.description_calls = 0
+		self.metadata_calls = 0
+
+	def get_finding(self, finding, options=None):
+		with self.lock:
+			self.metadata_calls += 1
+		return {"id": finding, "descriptor": {"id": finding % 3}}
+
+	def get_finding_description(self, finding):
+		with self.lock:
+			self.description_calls += 1
+		return {"general": f"rule { finding % 3 }"}
+
+
+class DescriptionCache_test(unittest.TestCase):
+
+
+	def setUp(self):
+		unittest.TestCase.setUp(self)
+		self.client = FakeFindings()
+
+
+	def test_rule_key(self):
+		self.assertEqual(rule_key({"id": 1, "descriptor": {"id": 5}}), "descriptor:5")
+		self.assertEqual(rule_key({"id": 1, "tool": "ZAP", "rule": {"name": "XSS"}}), "rule:ZAP:XSS")
+		self.assertIsNone(rule_key({"id": 1}))
+
+
+	def test_get(self):
+		cache = DescriptionCache(self.client)
+		findings = [{"id": i, "descriptor": {"id": i % 3}} for i in range(30)]
+		with ThreadPoolExecutor(max_workers=8) as pool:
+			results = list(pool.map(cache.get, findings))
+		self.assertEqual(results[4], {"general": "rule 1"})
+		self.assertEqual(self.client.description_calls, 3)
+		self.assertEqual(cache.stats(), {"hits": 27, "misses": 3, "rules": 3})
+		self.assertEqual(cache.get(7), {"general": "rule 1"})
+		self.assertEqual(self.client.metadata_calls, 1)
+		cache.get({"id": 100})
+		self.assertEqual(self.client.description_calls, 4)
+
+
+	def test_persistence(self):
+		with tempfile.TemporaryDirectory() as tmp:
+			path = os.path.join(tmp, "descriptions.json")
+			with DescriptionCache(self.client, path) as cache:
+				cache.get({"id": 1, "descriptor": {"id": 1}})
+			cache = DescriptionCache(self.client, path)
+			self.assertEqual(len(cache), 1)
+			cache.get({"id": 4, "descriptor": {"id": 1}})
+			self.assertEqual(self.client.description_calls, 1)
+			self.assertEqual(cache.hits, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+import os
+import unittest
+
+from codedx_api.APIs.FindingFilter import (UnsupportedFilter, compile_filter,
+                                           count_findings, filter_findings)
+from codedx_api.APIs.FindingRecord import Finding
+
+FINDINGS = [
+	{"id": 1, "severity": {"name": "High"}, "status": "new", "descriptor": {"tool": "ZAP", "name": "XSS"}, "cwe": {"id": 79}, "primaryLocation": {"path": "src/web/views.py"}, "updateDate": "2024-02-01T10:00:00Z"},
+	{"id": 2, "severity": {"name": "Medium"}, "status": "escalated", "descriptor": {"tool": "Semgrep", "name": "SQLi"}, "cwe": {"id": 89}, "primaryLocation": {"path": "src/db.py"}, "updateDate": 1704067200000},
+	{"id": 3, "severity": {"name": "Low"}, "status": "fixed", "descriptor": {"tool": "ZAP", "name": "Header"}, "primaryLocation": {"path": "README.md"}, "updateDate": "2024-03-01T00:00:00.000+0000"},
+	{"id": 4, "severity": {"name": "High"}, "status": "gone", "descriptor": {"tool": "Semgrep", "name": "SQLi"}, "cwe": {"id": 89}}
+]
+
+
+class FindingFilter_test(unittest.TestCase):
+
+
+	def matches(self, filters) -> list:
+		return [finding["id"] for finding in filter_findings(FINDINGS, filters)]
+
+
+	def test_fields(self):
+		self.assertEqual(self.matches({}), [1, 2, 3, 4])
+		self.assertEqual(self.matches({"severity": "high"}), [1, 4])
+		self.assertEqual(self.matches({"severity": ["High", "Medium"], "status": ["new", "escalated"]}), [1, 2])
+		self.assertEqual(self.matches({"detectionMethod": "ZAP"}), [1, 3])
+		self.assertEqual(self.matches({"cwe": 89, "~status": "gone"}), [2])
+		self.assertEqual(self.matches({"finding": [3, 4, 5]}), [3, 4])
+		self.assertEqual(self.matches({"rule": "sqli"}), [2, 4])
+
+
+	def test_paths(self):
+		self.assertEqual(self.matches({"path": "src"}), [1, 2])
+		self.assertEqual(self.matches({"path": "src/*.py"}), [1, 2])
+		self.assertEqual(self.matches({"path": "README.md"}), [3])
+		self.assertEqual(self.matches({"~path": "src/"}), [3, 4])
+
+
+	def test_dates(self):
+		self.assertEqual(self.matches({"updateDate": {"start": "2024-01-15"}}), [1, 3])
+		self.assertEqual(self.matches({"updateDate": {"end": "2024-02-01T10:00:00+00:00"}}), [1, 2])
+		self.assertEqual(self.matches({"updateDate": {"start": 1704067200000, "end": "2024-01-01"}}), [2])
+		with self.assertRaises(UnsupportedFilter):
+			compile_filter({"updateDate": "2024-01-01"})
+
+
+	def test_records(self):
+		records = [Finding(finding) for finding in FINDINGS]
+		self.assertEqual(count_findings(records, {"tool": "Semgrep", "severity": "High"}), 1)
+		self.assertEqual(count_findings(records, {"updateDate": {"start": "2024-01-15"}}), 2)
+
+
+	def test_unsupported(self):
+		with self.assertRaises(UnsupportedFilter):
+			compile_filter({"globalSearch": "xss"})
+		with self.assertRaises(ValueError):
+			compile_filter({"~triageTime": 1})
+
+
+@unittest.skipUnless(os.environ.get("CODEDX_URL") and os.environ.get("CODEDX_API_KEY") and os.environ.get("CODEDX_PROJECT"),
+	"Set CODEDX_URL, CODEDX_API_KEY and CODEDX_PROJECT to check parity with a CodeDx server")
+class FindingFilterParity_test(unittest.TestCase):
+
+
+	FILTERS = [
+		{},
+		{"severity": ["Critical", "High"]},
+		{"~status": ["fixed", "gone"]},
+		{"severity": "Medium", "status": "new"},
+		{"cwe": [79, 89]}
+	]
+
+
+	def test_parity(self):
+		from codedx_api.CodeDxAPI import CodeDx
+		with CodeDx(os.environ["CODEDX_URL"], os.environ["CODEDX_API_KEY"]) as cdx:
+			project = int(os.environ["CODEDX_PROJECT"])
+			findings = list(cdx.iter_findings(project, records=True))
+			for filters in self.FILTERS:
+				with self.subTest(filters=filters):
+					expected = cdx.get_finding_count(project, {"filter": filters})["count"]
+					self.assertEqual(count_findings(findings, filters), expected)
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,68 @@
+import unittest
+from unittest.mock import patch
+
+from codedx_api.APIs.FindingRecord import Finding
+from codedx_api.APIs.FindingsAPI import Findings
+from tests.MockResponses import JSONMock
+
+# DO NOT UPDATE - MOCK REQUESTS DO NOT REQUIRE CREDENTIALS
+api_key = "0000-0000-0000-0000"
+base_url = "sample-url.codedx.com"
+
+ROW = {
+	"id": 12,
+	"severity": {"id": 2, "name": "High"},
+	"status": "unresolved",
+	"descriptor": {"id": 40, "name": "SQL Injection", "tool": "Semgrep"},
+	"cwe": {"id": 89},
+	"primaryLocation": {"path": "src/db.py", "lineRange": {"start": 10, "end": 12}},
+	"updateDate": "2024-02-01"
+}
+
+
+class FindingRecord_test(unittest.TestCase):
+
+
+	def test_fields(self):
+		finding = Finding(ROW)
+		self.assertEqual(finding.id, 12)
+		self.assertEqual(finding.severity, "High")
+		self.assertEqual(finding.status, "unresolved")
+		self.assertEqual(finding.tool, "Semgrep")
+		self.assertEqual(finding.rule, "SQL Injection")
+		self.assertEqual(finding.cwe, 89)
+		self.assertEqual(finding.path, "src/db.py")
+		self.assertEqual(finding.line, 10)
+		self.assertEqual(finding.update_date, "2024-02-01")
+		self.assertFalse(hasattr(finding, "__dict__"))
+
+
+	def test_lazy_fields(self):
+		finding = Finding(ROW)
+		self.assertEqual(finding["primaryLocation.lineRange.end"], 12)
+		self.assertIsNone(finding.get("comments"))
+		with self.assertRaises(KeyError):
+			finding["comments"]
+		self.assertEqual(finding.to_dict(), ROW)
+		self.assertEqual(finding, Finding(dict(ROW)))
+
+
+	def test_interned(self):
+		first = Finding(dict(ROW, severity={"name": "".join(["Hi", "gh"])}))
+		second = Finding(ROW)
+		self.assertIs(first.severity, second.severity)
+
+
+	@patch('requests.Session.post')
+	def test_records_from_api(self, mock_get_finding_table):
+		mock_get_finding_table.return_value = JSONMock()
+		mock_get_finding_table.return_value.data = [ROW]
+		findings_api = Findings(api_key, base_url)
+		result = findings_api.get_finding_table(0, records=True)
+		self.assertIsInstance(result[0], Finding)
+		result = list(findings_api.iter_findings(0, records=True))
+		self.assertEqual(result[0].severity, "High")
+
+
+if __name__ == '__main__':
+    unittest.main()
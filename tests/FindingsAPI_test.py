@@ -1,10 +1,35 @@
+import threading
 import unittest
 from unittest.mock import patch
 
 from codedx_api.APIs.BaseAPIClient import ContentType
 from codedx_api.APIs.FindingsAPI import Findings
+from codedx_api.DescriptionCache import DescriptionCache
 from tests.MockResponses import DataMock, JSONMock
 
+
+class TableMock(object):
+	"""Serves pages of a finding table with the given number of findings"""
+
+	def __init__(self, total: int):
+		self.total = total
+		self.pages = []
+		self.lock = threading.Lock()
+
+	def __call__(self, url, headers=None, json=None, timeout=None):
+		if url.endswith("/count"):
+			response = JSONMock()
+			response.data = {"count": self.total}
+			return response
+		pagination = json["pagination"]
+		with self.lock:
+			self.pages.append(pagination["page"])
+		start = (pagination["page"] - 1) * pagination["perPage"]
+		end = min(start + pagination["perPage"], self.total)
+		response = JSONMock()
+		response.data = [{"id": i} for i in range(start, end)]
+		return response
+
 # DO NOT UPDATE - MOCK REQUESTS DO NOT REQUIRE CREDENTIALS
 api_key = "0000-0000-0000-0000"
 base_url = "sample-url.codedx.com"
@@ -19,7 +44,7 @@ class FindingsAPI_test(unittest.TestCase):
 		self.request_filters = {"sort": {"by": "id", "direction": "ascending"}}
 
 
-	@patch('requests.get')
+	@patch('requests.Session.get')
 	def test_get_finding(self, mock_get_finding):
 		mock_get_finding.return_value = JSONMock()
 		result = self.findings_api.get_finding(5)
@@ -28,14 +53,14 @@ class FindingsAPI_test(unittest.TestCase):
 		self.assertIsInstance(result, dict)
 
 
-	@patch('requests.get')
+	@patch('requests.Session.get')
 	def test_get_finding_description(self, mock_get_finding_description):
 		mock_get_finding_description.return_value = JSONMock()
 		result = self.findings_api.get_finding_description(5)
 		self.assertIsInstance(result, dict)
 
 
-	@patch('requests.get')
+	@patch('requests.Session.get')
 	def test_get_finding_history(self, mock_get_finding_history):
 		mock_get_finding_history.return_value = JSONMock()
 		mock_get_finding_history.return_value.data = ["findings"]
@@ -43,7 +68,73 @@ class FindingsAPI_test(unittest.TestCase):
 		self.assertIsInstance(result, list)
 
 
-	@patch('requests.post')
+	@patch('requests.Session.get')
+	def test_get_finding_details(self, mock_get):
+		def respond(url, headers=None, timeout=None):
+			if "/api/findings/13" in url:
+				response = JSONMock()
+				response.status_code = 404
+				response.content = b"Not found"
+				return response
+			response = JSONMock()
+			response.data = {"url": url}
+			return response
+		mock_get.side_effect = respond
+		ids = [1, 2, 2, 13, 3, 1]
+		results = dict(self.findings_api.get_finding_details(ids, ["finding", "description"], ["descriptor"], max_workers=3))
+		self.assertEqual(sorted(results), [1, 2, 3, 13])
+		self.assertEqual(mock_get.call_count, 7)
+		self.assertIsInstance(results[13], Exception)
+		self.assertTrue(results[2]["finding"]["url"].endswith("/api/findings/2?expand=descriptor"))
+		self.assertTrue(results[2]["description"]["url"].endswith("/api/findings/2/description"))
+		with self.assertRaises(ValueError):
+			list(self.findings_api.get_finding_details(ids, ["comments"]))
+
+
+	@patch('requests.Session.get')
+	def test_get_finding_details_cached(self, mock_get):
+		def respond(url, headers=None, timeout=None):
+			response = JSONMock()
+			finding = int(url.split("/api/findings/")[1].split("/")[0].split("?")[0])
+			response.data = {"id": finding, "descriptor": {"id": finding % 2}, "url": url}
+			return response
+		mock_get.side_effect = respond
+		cache = DescriptionCache(self.findings_api)
+		results = dict(self.findings_api.get_finding_details(range(10), ["finding", "description"], description_cache=cache))
+		self.assertEqual(len(results), 10)
+		self.assertTrue(results[3]["finding"]["url"].endswith("?expand=descriptor"))
+		self.assertEqual(cache.misses, 2)
+		self.assertEqual(mock_get.call_count, 12)
+
+
+	@patch('requests.Session.get')
+	def test_get_finding_snippets(self, mock_get):
+		source = "\n".join(f"line { i }" for i in range(1, 21)).encode()
+		def respond(url, headers=None, timeout=None):
+			if url.endswith("/missing.py"):
+				response = JSONMock()
+				response.status_code = 404
+				response.content = b"Not found"
+				return response
+			return DataMock(ContentType.TEXT.text(), source)
+		mock_get.side_effect = respond
+		findings = [
+			{"id": 1, "loc.path": "src/a.py", "loc.line": 2},
+			{"id": 2, "primaryLocation": {"path": "src/a.py", "lineRange": {"start": 10}}},
+			{"id": 3, "loc.path": "src/b.py", "loc.line": 20},
+			{"id": 4, "loc.path": "src/missing.py", "loc.line": 1},
+			{"id": 5}
+		]
+		results = dict(self.findings_api.get_finding_snippets(self.test_project, findings, context=2))
+		self.assertEqual(sorted(results), [1, 2, 3, 4])
+		self.assertEqual(mock_get.call_count, 3)
+		self.assertEqual(results[1], {"path": "src/a.py", "start": 1, "line": 2, "lines": ["line 1", "line 2", "line 3", "line 4"]})
+		self.assertEqual(results[2]["lines"], ["line 8", "line 9", "line 10", "line 11", "line 12"])
+		self.assertEqual(results[3]["lines"], ["line 18", "line 19", "line 20"])
+		self.assertIsInstance(results[4], Exception)
+
+
+	@patch('requests.Session.post')
 	def test_get_finding_table(self, mock_get_finding_table):
 		mock_get_finding_table.return_value = JSONMock()
 		mock_get_finding_table.return_value.data = ["findings"]
@@ -57,7 +148,43 @@ class FindingsAPI_test(unittest.TestCase):
 		self.assertIsInstance(result, list)
 
 
-	@patch('requests.post')
+	@patch('requests.Session.post')
+	def test_iter_findings(self, mock_get_finding_table):
+		for prefetch in [True, False]:
+			for total in [0, 7, 10, 25]:
+				table = TableMock(total)
+				mock_get_finding_table.side_effect = table
+				result = list(self.findings_api.iter_findings(self.test_project, {"severity": "High"}, page_size=5, prefetch=prefetch))
+				self.assertEqual([finding["id"] for finding in result], list(range(total)))
+				self.assertEqual(sorted(table.pages), list(range(1, total // 5 + 2)))
+		body = mock_get_finding_table.call_args.kwargs["json"]
+		self.assertEqual(body["filter"], {"severity": "High"})
+		self.assertEqual(body["sort"], {"by": "id", "direction": "ascending"})
+
+
+	@patch('requests.Session.post')
+	def test_iter_findings_parallel(self, mock_get_finding_table):
+		for total in [0, 7, 10, 103]:
+			table = TableMock(total)
+			mock_get_finding_table.side_effect = table
+			result = list(self.findings_api.iter_findings(self.test_project, page_size=5, max_workers=4))
+			self.assertEqual([finding["id"] for finding in result], list(range(total)))
+			self.assertEqual(sorted(table.pages), list(range(1, -(-total // 5) + 1)))
+			result = self.findings_api.iter_findings(self.test_project, page_size=5, max_workers=4, ordered=False)
+			self.assertEqual(sorted(finding["id"] for finding in result), list(range(total)))
+
+
+	@patch('requests.Session.post')
+	def test_iter_finding_pages(self, mock_get_finding_table):
+		table = TableMock(100)
+		mock_get_finding_table.side_effect = table
+		pages = self.findings_api.iter_finding_pages(self.test_project, page_size=10)
+		self.assertEqual(len(next(pages)), 10)
+		pages.close()
+		self.assertLessEqual(len(table.pages), 2)
+
+
+	@patch('requests.Session.post')
 	def test_get_finding_count(self, mock_get_finding_count):
 		mock_get_finding_count.return_value = JSONMock()
 		result = self.findings_api.get_finding_count(self.test_project)
@@ -66,7 +193,7 @@ class FindingsAPI_test(unittest.TestCase):
 		self.assertIsInstance(result, dict)
 
 
-	@patch('requests.post')
+	@patch('requests.Session.post')
 	def test_get_finding_group_count(self, mock_get_finding_group_count):
 		mock_get_finding_group_count.return_value = JSONMock()
 		mock_get_finding_group_count.return_value.data = [{"test": "data"}]
@@ -80,7 +207,7 @@ class FindingsAPI_test(unittest.TestCase):
 		self.assertIsInstance(result, list)
 
 
-	@patch('requests.post')
+	@patch('requests.Session.post')
 	def test_get_finding_flow(self, mock_get_finding_flow):
 		mock_get_finding_flow.return_value = JSONMock()
 		mock_get_finding_flow.return_value.data = [{"findings": "test"}]
@@ -96,13 +223,15 @@ class FindingsAPI_test(unittest.TestCase):
 			self.findings_api.get_finding_flow(self.test_project)
 
 
-	@patch('requests.get')
+	@patch('requests.Session.get')
 	def test_get_finding_file(self, mock_get_finding_file):
 		mock_get_finding_file.return_value = DataMock(ContentType.TEXT, "text")
 		result = self.findings_api.get_finding_file(self.test_project, "file")
 		self.assertIsInstance(result, str)
+		self.assertTrue(mock_get_finding_file.call_args[0][0].endswith("/files/tree/file"))
 		result = self.findings_api.get_finding_file(self.test_project, 1)
 		self.assertIsInstance(result, str)
+		self.assertTrue(mock_get_finding_file.call_args[0][0].endswith("/files/1"))
 
 
 if __name__ == '__main__':
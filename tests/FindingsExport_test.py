@@ -0,0 +1,98 @@
+import gzip
+import json
+import os
+import tempfile
+import unittest
+
+from codedx_api.APIs.FindingsAPI import Findings
+from codedx_api.FindingsExport import export_findings, read_position
+
+
+class FakeTable(Findings):
+	"""Finding table with the given ids, served through the real pagination code"""
+
+	def __init__(self, ids: list):
+		self.ids = ids
+		self.pages = []
+
+	def get_finding_table(self, project, options=None, req_body=None, records=False):
+		pagination = req_body["pagination"]
+		self.pages.append(pagination["page"])
+		start = (pagination["page"] - 1) * pagination["perPage"]
+		return [{"id": i, "severity": "High"} for i in self.ids[start:start + pagination["perPage"]]]
+
+	def get_finding_count(self, project, req_body=None):
+		return {"count": len(self.ids)}
+
+
+def read_ids(file_name: str, compress: bool) -> list:
+	with (gzip.open if compress else open)(file_name, "rb") as f:
+		return [json.loads(line)["id"] for line in f]
+
+
+class FindingsExport_test(unittest.TestCase):
+
+
+	def setUp(self):
+		unittest.TestCase.setUp(self)
+		self.tmp = tempfile.TemporaryDirectory()
+		self.addCleanup(self.tmp.cleanup)
+
+
+	def test_export(self):
+		for compress in (False, True):
+			with self.subTest(compress=compress):
+				file_name = os.path.join(self.tmp.name, "findings.ndjson" + (".gz" if compress else ""))
+				updates = []
+				stats = export_findings(FakeTable(list(range(23))), 1, file_name, page_size=5, progress=lambda stats: updates.append(stats.rows))
+				self.assertEqual(read_ids(file_name, compress), list(range(23)))
+				self.assertEqual(stats.rows, 23)
+				self.assertEqual(stats.last_id, 22)
+				self.assertEqual(updates, [5, 10, 15, 20, 23])
+				self.assertGreater(stats.rows_per_sec, 0)
+
+
+	def test_resume(self):
+		for compress in (False, True):
+			with self.subTest(compress=compress):
+				file_name = os.path.join(self.tmp.name, "findings.ndjson" + (".gz" if compress else ""))
+				export_findings(FakeTable(list(range(0, 24, 2))), 1, file_name, page_size=5)
+				client = FakeTable(list(range(0, 24, 2)) + [30, 31, 32])
+				stats = export_findings(client, 1, file_name, page_size=5, resume=True)
+				self.assertEqual(stats.resumed_rows, 12)
+				self.assertEqual(stats.rows, 3)
+				self.assertEqual(client.pages, [3, 3, 4])
+				self.assertEqual(read_ids(file_name, compress), list(range(0, 24, 2)) + [30, 31, 32])
+
+
+	def test_resume_after_deletions(self):
+		file_name = os.path.join(self.tmp.name, "findings.ndjson")
+		export_findings(FakeTable(list(range(12))), 1, file_name, page_size=5)
+		client = FakeTable([0, 1, 2, 3, 4, 11, 12, 13])
+		stats = export_findings(client, 1, file_name, page_size=5, resume=True)
+		self.assertEqual(client.pages, [3, 2, 2])
+		self.assertEqual(read_ids(file_name, False), list(range(14)))
+		self.assertEqual(stats.rows, 2)
+
+
+	def test_interrupted_file(self):
+		file_name = os.path.join(self.tmp.name, "findings.ndjson")
+		with open(file_name, "wb") as f:
+			f.write(b'{"id":1}\n{"id":2}\n{"id":')
+		self.assertEqual(read_position(file_name, False), (2, 2))
+		self.assertEqual(read_ids(file_name, False), [1, 2])
+		file_name = os.path.join(self.tmp.name, "findings.ndjson.gz")
+		with gzip.open(file_name, "wb") as f:
+			f.write(b'{"id":1}\n{"id":2}\n{"id":3}\n' * 200)
+		with open(file_name, "rb") as f:
+			data = f.read()
+		with open(file_name, "wb") as f:
+			f.write(data[:-12])
+		rows, last_id = read_position(file_name, True)
+		self.assertEqual(read_ids(file_name, True)[-1], last_id)
+		self.assertEqual(len(read_ids(file_name, True)), rows)
+		self.assertTrue(0 < rows < 600)
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,158 @@
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import unittest
+
+from codedx_api.APIs.FindingFilter import UnsupportedFilter, filter_findings
+from codedx_api.FindingsMirror import FindingsMirror
+
+
+class FakeTable(object):
+	"""Finding table that honours the updateDate filter"""
+
+	def __init__(self, findings: list):
+		self.findings = findings
+		self.requests = []
+
+	def iter_finding_pages(self, project, filters=None, options=None, page_size=500, max_workers=1):
+		self.requests.append(filters)
+		start = (filters or {}).get("updateDate", {}).get("start")
+		rows = [finding for finding in self.findings if start is None or finding["updateDate"] >= start]
+		for i in range(0, len(rows), page_size):
+			yield rows[i:i + page_size]
+
+
+def finding(i: int, severity: str, status: str, update: str) -> dict:
+	return {
+		"id": i,
+		"severity": {"name": severity},
+		"status": status,
+		"tool": "ZAP" if i % 2 else "Semgrep",
+		"loc.path": f"src/file{ i % 3 }.py",
+		"updateDate": update
+	}
+
+
+class FindingsMirror_test(unittest.TestCase):
+
+
+	def setUp(self):
+		unittest.TestCase.setUp(self)
+		self.findings = [finding(i, "High" if i < 4 else "Low", "unresolved", f"2024-01-0{ i % 5 + 1 }") for i in range(10)]
+		self.client = FakeTable(self.findings)
+
+
+	def test_snapshot_and_queries(self):
+		with FindingsMirror(self.client, page_size=3) as mirror:
+			self.assertEqual(mirror.snapshot(1), 10)
+			self.assertEqual(mirror.count(1), 10)
+			self.assertEqual(mirror.count(1, severity="High"), 4)
+			self.assertEqual(mirror.count(1, severity=["High", "Low"], tool="ZAP"), 5)
+			self.assertEqual(mirror.group_count(1, "path"), {"src/file0.py": 4, "src/file1.py": 3, "src/file2.py": 3})
+			self.assertEqual([row["id"] for row in mirror.findings(1, batch_size=4, severity="Low")], list(range(4, 10)))
+			self.assertEqual(mirror.watermark(1), "2024-01-05")
+			self.assertEqual(mirror.count(2), 0)
+			with self.assertRaises(ValueError):
+				mirror.count(1, description="x")
+
+
+	def test_codedx_filters(self):
+		self.findings[3]["cwe"] = {"id": 79}
+		cases = [
+			{"severity": ["high", "CRITICAL"], "~status": "fixed"},
+			{"~severity": "High"},
+			{"path": "src/file1.py", "detectionMethod": "zap"},
+			{"path": "src/*", "~tool": "ZAP"},
+			{"finding": [1, 2, 3], "cwe": 79},
+			{"updateDate": {"start": "2024-01-02T00:00:00Z", "end": 1704326400000}},
+			{"updateDate": {"start": "2024-01-03"}, "rule": "missing"}
+		]
+		with FindingsMirror(self.client, page_size=3) as mirror:
+			mirror.snapshot(1)
+			for filters in cases:
+				with self.subTest(filters=filters):
+					expected = [row["id"] for row in filter_findings(self.findings, filters)]
+					self.assertEqual(mirror.count(1, filters), len(expected))
+					self.assertEqual([row["id"] for row in mirror.findings(1, batch_size=2, filters=filters)], expected)
+					self.assertEqual(sum(mirror.group_count(1, "severity", filters).values()), len(expected))
+			self.assertEqual(mirror.count(1, {"~severity": "Low"}, tool="Semgrep"), 2)
+			self.assertEqual(mirror.group_count(1, "tool", {"path": "src/file0.py"}), {"Semgrep": 2, "ZAP": 2})
+			with self.assertRaises(UnsupportedFilter):
+				mirror.count(1, {"globalSearch": "xss"})
+
+
+	def test_sync(self):
+		with tempfile.TemporaryDirectory() as tmp:
+			path = os.path.join(tmp, "findings.db")
+			with FindingsMirror(self.client, path) as mirror:
+				self.assertEqual(mirror.sync(1), 10)
+			self.findings[2] = finding(2, "High", "false-positive", "2024-01-06")
+			self.findings.append(finding(10, "Critical", "unresolved", "2024-01-07"))
+			with FindingsMirror(self.client, path) as mirror:
+				self.assertEqual(mirror.sync(1), 4)
+				self.assertEqual(self.client.requests[-1], {"updateDate": {"start": "2024-01-05"}})
+				self.assertEqual(mirror.count(1), 11)
+				self.assertEqual(mirror.group_count(1, "status"), {"false-positive": 1, "unresolved": 10})
+				self.assertEqual(mirror.watermark(1), "2024-01-07")
+
+
+	def test_mixed_date_formats(self):
+		self.client.findings = [
+			dict(finding(1, "High", "unresolved", "2024-01-05T10:00:00+02:00")),
+			dict(finding(2, "High", "unresolved", "2024-01-05T09:00:00.5Z")),
+			dict(finding(3, "High", "unresolved", 1704448800000)),
+			dict(finding(4, "High", "unresolved", "2024-01-04T23:00:00-0100"))
+		]
+		pages = self.client.iter_finding_pages
+		requests = []
+		def unfiltered_pages(project, filters=None, *args, **kwargs):
+			requests.append(filters)
+			return pages(project, None, *args, **kwargs)
+		self.client.iter_finding_pages = unfiltered_pages
+		with FindingsMirror(self.client) as mirror:
+			mirror.snapshot(1)
+			self.assertEqual(mirror.watermark(1), 1704448800000)
+			self.client.findings[1]["updateDate"] = "2024-01-05T10:30:00Z"
+			mirror.sync(1)
+			self.assertEqual(requests[-1], {"updateDate": {"start": 1704448800000}})
+			self.assertEqual(mirror.watermark(1), "2024-01-05T10:30:00Z")
+
+
+	def test_migrate(self):
+		with tempfile.TemporaryDirectory() as tmp:
+			path = os.path.join(tmp, "findings.db")
+			db = sqlite3.connect(path)
+			db.execute("CREATE TABLE findings (project INTEGER NOT NULL, id INTEGER NOT NULL, severity TEXT, status TEXT, tool TEXT, cwe TEXT, path TEXT, updateDate TEXT, data TEXT NOT NULL, PRIMARY KEY (project, id))")
+			db.execute("INSERT INTO findings VALUES (1, 1, 'High', 'unresolved', 'ZAP', NULL, 'a.py', '2024-01-05', ?)", (json.dumps(finding(1, "High", "unresolved", "2024-01-05")),))
+			db.commit()
+			db.close()
+			with FindingsMirror(self.client, path) as mirror:
+				self.assertEqual(mirror.db.execute("SELECT updated FROM findings").fetchone()[0], 1704412800)
+				self.assertEqual(mirror.snapshot(1), 10)
+
+
+	def test_queries_during_download(self):
+		with FindingsMirror(self.client, page_size=3) as mirror:
+			mirror.snapshot(1)
+			counts = []
+			pages = self.client.iter_finding_pages
+
+			def slow_pages(*args, **kwargs):
+				for page in pages(*args, **kwargs):
+					yield page
+					query = threading.Thread(target=lambda: counts.append(mirror.count(1)))
+					query.start()
+					query.join(timeout=5)
+					self.assertFalse(query.is_alive())
+
+			self.client.iter_finding_pages = slow_pages
+			self.findings.pop()
+			self.assertEqual(mirror.snapshot(1), 9)
+			self.assertEqual(counts, [10, 10, 10])
+			self.assertEqual(mirror.count(1), 9)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import threading
+import unittest
+
+from codedx_api.GroupCounts import GroupCountAggregator
+
+
+class FakeCodeDx(object):
+	"""Client with three projects whose counts depend on their latest analysis"""
+
+	def __init__(self):
+		self.lock = threading.Lock()
+		self.analyses = {1: 10, 2: 20, 3: 30}
+		self.count_calls = []
+		self.project_calls = 0
+
+	def get_projects(self):
+		self.project_calls += 1
+		return {"projects": [{"id": 1, "name": "WebGoat"}, {"id": 2, "name": "Juice Shop"}, {"id": 3, "name": "Broken"}]}
+
+	def get_all_analysis(self, project):
+		return [{"id": analysis} for analysis in range(1, self.analyses[project] + 1)]
+
+	def get_finding_group_count(self, project, req_body):
+		if project == 3:
+			raise Exception("Server error")
+		with self.lock:
+			self.count_calls.append((project, req_body["countBy"]))
+		return [{"id": 1, "name": "High", "count": project}, {"id": 2, "name": "Low", "count": self.analyses[project]}]
+
+
+class GroupCounts_test(unittest.TestCase):
+
+
+	def setUp(self):
+		unittest.TestCase.setUp(self)
+		self.client = FakeCodeDx()
+
+
+	def test_refresh(self):
+		aggregator = GroupCountAggregator(self.client, filters={"~status": "gone"})
+		table = aggregator.refresh()
+		self.assertEqual(table["severity"]["High"], {"WebGoat": 1, "Juice Shop": 2})
+		self.assertEqual(aggregator.totals("tool"), {"High": 3, "Low": 30})
+		self.assertEqual(sorted(set(field for _, field in self.client.count_calls)), ["detectionMethod", "severity", "status"])
+		self.assertEqual(aggregator.stats, {"refreshed": 2, "skipped": 0, "failed": 1})
+		self.assertIn("Broken", aggregator.errors)
+		self.assertIn(("WebGoat", "status", "Low", 10), list(aggregator.rows()))
+
+
+	def test_unchanged_projects_skipped(self):
+		aggregator = GroupCountAggregator(self.client, fields=("severity",))
+		aggregator.refresh()
+		self.assertEqual(len(self.client.count_calls), 2)
+		self.client.analyses[2] = 21
+		table = aggregator.refresh()
+		self.assertEqual(self.client.count_calls[2:], [(2, "severity")])
+		self.assertEqual(table["severity"]["Low"], {"WebGoat": 10, "Juice Shop": 21})
+		self.assertEqual(aggregator.stats, {"refreshed": 1, "skipped": 1, "failed": 1})
+		aggregator.refresh(force=True)
+		self.assertEqual(len(self.client.count_calls), 5)
+		self.assertEqual(self.client.project_calls, 1)
+
+
+	def test_unknown_field(self):
+		with self.assertRaises(ValueError):
+			GroupCountAggregator(self.client, fields=("cwe",))
+
+
+if __name__ == '__main__':
+	unittest.main()
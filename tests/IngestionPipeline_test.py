@@ -0,0 +1,173 @@
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+from codedx_api.AnalysisManifest import AnalysisManifest
+from codedx_api.CodeDxAPI import CodeDx
+from codedx_api.IngestionPipeline import IngestionPipeline
+from codedx_api.JobPolling import PollingStrategy
+from tests.MockServer import MockServer
+
+# DO NOT UPDATE - MOCK REQUESTS DO NOT REQUIRE CREDENTIALS
+api_key = "0000-0000-0000-0000"
+json_type = 'application/json;charset=utf-8'
+
+
+class FleetRoute(object):
+	"""CodeDx with projects 1 to 10, where project 4 rejects uploads and project 5 fails verification"""
+
+	def __init__(self):
+		self.lock = threading.Lock()
+		self.preps = 0
+		self.pending = 0
+		self.max_pending = 0
+		self.created = []
+
+	def __call__(self, request):
+		path = request.path.replace("/codedx", "", 1)
+		if path == "/api/projects/query":
+			name = json.loads(request.body)["filter"]["name"]
+			projects = [{"id": int(name[7:]), "name": name}] if name[7:].isdigit() and int(name[7:]) <= 10 else []
+			return 200, json_type, projects
+		if path == "/api/projects" and request.method == "PUT":
+			with self.lock:
+				self.created.append(request.body)
+			return 200, json_type, {"id": 99}
+		if path == "/api/analysis-prep":
+			project = json.loads(request.body)["projectId"]
+			with self.lock:
+				self.pending += 1
+				self.max_pending = max(self.max_pending, self.pending)
+			return 200, json_type, {"prepId": f"prep{ project }"}
+		if path.endswith("/upload"):
+			if "prep4" in path:
+				with self.lock:
+					self.pending -= 1
+				return 500, "text/plain", b"Upload error"
+			return 202, json_type, {"jobId": "input"}
+		if path.startswith("/api/jobs/"):
+			return 200, json_type, {"jobId": path.split("/")[3], "status": "completed"}
+		if path.startswith("/api/analysis-prep/prep") and path.endswith("/analyze"):
+			project = int(path.split("/")[3][4:])
+			return 202, json_type, {"jobId": "analysis", "analysisId": project * 10}
+		if path.startswith("/api/analysis-prep/prep"):
+			errors = ["Unknown format"] if path.endswith("prep5") else []
+			if errors:
+				with self.lock:
+					self.pending -= 1
+			return 200, json_type, {"inputIds": ["input"], "verificationErrors": errors}
+		if "/analyses/" in path:
+			with self.lock:
+				self.pending -= 1
+			return 200, json_type, {"id": int(path.split("/")[-1])}
+		return 404, "text/plain", b"Not found"
+
+
+class IngestionPipeline_test(unittest.TestCase):
+
+
+	def setUp(self):
+		unittest.TestCase.setUp(self)
+		self.tmp = tempfile.TemporaryDirectory()
+		self.addCleanup(self.tmp.cleanup)
+		self.files = []
+		for name in ("sast.xml", "sca.json"):
+			file_name = os.path.join(self.tmp.name, name)
+			with open(file_name, "w") as f:
+				f.write("{}")
+			self.files.append(file_name)
+		self.polling = PollingStrategy(initial_interval=0.01, jitter=0)
+
+
+	def test_run(self):
+		route = FleetRoute()
+		jobs = [(f"project{ i }", self.files) for i in range(1, 11)] + [("project-new", self.files[0])]
+		with MockServer(route) as server:
+			with CodeDx(server.url, api_key, polling=self.polling) as cdx:
+				pipeline = IngestionPipeline(cdx, upload_workers=2, wait_workers=2, max_pending=3, polling=self.polling)
+				results = pipeline.run(iter(jobs))
+		self.assertEqual([result.project for result in results], [job[0] for job in jobs])
+		self.assertEqual(results[0].analysis, {"id": 10})
+		self.assertEqual(results[10].analysis, {"id": 990})
+		self.assertEqual(results[3].failed_stage, "upload")
+		self.assertEqual(results[4].failed_stage, "inputs")
+		self.assertIsInstance(results[4].error, ValueError)
+		self.assertEqual(sum(1 for result in results if result.ok), 9)
+		self.assertLessEqual(route.max_pending, 3)
+		self.assertEqual(len(route.created), 1)
+		self.assertEqual(set(results[0].timings), {"upload", "inputs", "analysis"})
+		stats = pipeline.stats
+		self.assertEqual((stats["upload"].completed, stats["upload"].failed), (10, 1))
+		self.assertEqual((stats["inputs"].completed, stats["inputs"].failed), (9, 1))
+		self.assertEqual(stats["analysis"].completed, 9)
+		self.assertGreater(stats["analysis"].throughput, 0)
+		self.assertGreaterEqual(stats["upload"].p95_latency, min(stats["upload"].latencies))
+
+
+	def test_manifest(self):
+		route = FleetRoute()
+		jobs = [(f"project{ i }", self.files) for i in (1, 2, 3)]
+		with MockServer(route) as server:
+			with CodeDx(server.url, api_key, polling=self.polling, manifest=AnalysisManifest()) as cdx:
+				cdx.ingest(jobs)
+				results = cdx.ingest(jobs)
+		self.assertTrue(all(result.ok and result.reused for result in results))
+		self.assertEqual(results[1].analysis, {"id": 20})
+		uploads = [request for request in server.requests if request.path.endswith("/upload")]
+		self.assertEqual(len(uploads), 6)
+
+
+	def test_project_created_after_load(self):
+		route = FleetRoute()
+		def stale_route(request):
+			if request.path == "/codedx/api/projects" and request.method == "GET":
+				return 200, json_type, {"projects": []}
+			return route(request)
+		with MockServer(stale_route) as server:
+			with CodeDx(server.url, api_key, polling=self.polling) as cdx:
+				cdx.get_projects()
+				results = cdx.ingest([("project1", self.files)])
+		self.assertTrue(results[0].ok)
+		self.assertEqual(route.created, [])
+
+
+	def test_duplicate_files(self):
+		with MockServer(FleetRoute()) as server:
+			with CodeDx(server.url, api_key, polling=self.polling) as cdx:
+				results = cdx.ingest([("project1", [self.files[0], self.files[1], self.files[0]])])
+		self.assertTrue(results[0].ok)
+		self.assertEqual(results[0].files, self.files)
+		self.assertEqual(len([request for request in server.requests if request.path.endswith("/upload")]), 2)
+
+
+	def test_queued_jobs(self):
+		route = FleetRoute()
+		started = time.monotonic()
+		def queued_route(request):
+			if request.path.startswith("/codedx/api/jobs/"):
+				status = "completed" if time.monotonic() - started > 0.3 else "queued"
+				return 200, json_type, {"jobId": request.path.split("/")[4], "status": status}
+			return route(request)
+		polling = PollingStrategy(initial_interval=0.01, max_interval=0.02, jitter=0, timeout=0.05)
+		with MockServer(queued_route) as server:
+			with CodeDx(server.url, api_key, polling=polling) as cdx:
+				results = IngestionPipeline(cdx, timeout=5).run([("project1", self.files), ("project2", self.files)])
+				self.assertTrue(all(result.ok for result in results))
+				started = time.monotonic() + 60
+				results = IngestionPipeline(cdx).run([("project1", self.files)])
+		self.assertEqual(results[0].failed_stage, "inputs")
+		self.assertIsInstance(results[0].error, RuntimeError)
+
+
+	def test_ingest(self):
+		with MockServer(FleetRoute()) as server:
+			with CodeDx(server.url, api_key, polling=self.polling) as cdx:
+				results = cdx.ingest([("project1", self.files), ("project2", self.files[1])])
+		self.assertTrue(all(result.ok for result in results))
+
+
+if __name__ == '__main__':
+	unittest.main()
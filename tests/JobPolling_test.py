@@ -0,0 +1,92 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from codedx_api.CodeDxAPI import CodeDx
+from codedx_api.JobPolling import PollingStrategy, WaitStats, poll_job, run_timeout
+
+# DO NOT UPDATE - MOCK REQUESTS DO NOT REQUIRE CREDENTIALS
+api_key = "0000-0000-0000-0000"
+base_url = "https://[CODE_DX_BASE_URL].org/codedx"
+
+
+class FakeClock(object):
+	def __init__(self):
+		self.now = 0.0
+
+	def __call__(self):
+		return self.now
+
+	def sleep(self, seconds):
+		self.now += seconds
+
+
+class JobPolling_test(unittest.TestCase):
+
+
+	def setUp(self):
+		unittest.TestCase.setUp(self)
+		self.clock = FakeClock()
+		self.strategy = PollingStrategy(initial_interval=0.5, fast_polls=2, backoff=2, max_interval=4, jitter=0, timeout=30)
+
+
+	def test_intervals(self):
+		intervals = self.strategy.intervals()
+		self.assertEqual([next(intervals) for _ in range(7)], [0.5, 0.5, 1, 2, 4, 4, 4])
+		jittered = PollingStrategy(initial_interval=1, jitter=0.5).intervals()
+		self.assertTrue(0.5 <= next(jittered) <= 1.5)
+		with self.assertRaises(ValueError):
+			PollingStrategy(initial_interval=10, max_interval=1)
+
+
+	def test_run_timeout(self):
+		self.assertEqual(run_timeout(self.strategy, 0, 8), 30)
+		self.assertEqual(run_timeout(self.strategy, 8, 8), 30)
+		self.assertEqual(run_timeout(self.strategy, 20, 8), 90)
+		self.assertIsNone(run_timeout(self.strategy.with_timeout(None), 20, 8))
+
+
+	def test_poll_job(self):
+		statuses = iter(["running", "running", "running", "completed"])
+		job_status = MagicMock(side_effect=lambda job_id, timeout: {"jobId": job_id, "status": next(statuses)})
+		strategy = PollingStrategy(initial_interval=0.5, fast_polls=2, jitter=0, request_timeout=3)
+		job, stats = poll_job(job_status, {"jobId": "1"}, strategy, sleep=self.clock.sleep, clock=self.clock)
+		self.assertEqual(job["status"], "completed")
+		self.assertIsInstance(stats, WaitStats)
+		self.assertEqual(stats.polls, 4)
+		self.assertEqual(stats.elapsed, 0.5 + 0.5 + 1 + 2)
+		job_status.assert_called_with("1", 3)
+
+
+	def test_poll_completed_job(self):
+		job_status = MagicMock()
+		job, stats = poll_job(job_status, {"jobId": "1", "status": "completed"}, self.strategy, sleep=self.clock.sleep, clock=self.clock)
+		self.assertEqual(stats.polls, 0)
+		job_status.assert_not_called()
+
+
+	def test_poll_timeout(self):
+		job_status = MagicMock(return_value={"jobId": "1", "status": "running"})
+		with self.assertRaises(RuntimeError):
+			poll_job(job_status, {"jobId": "1"}, self.strategy, sleep=self.clock.sleep, clock=self.clock)
+		self.assertEqual(self.clock.now, 30)
+
+
+	def test_poll_failed(self):
+		job_status = MagicMock(return_value={"jobId": "1", "status": "failed"})
+		with self.assertRaises(RuntimeError):
+			poll_job(job_status, {"jobId": "1"}, self.strategy, sleep=self.clock.sleep, clock=self.clock)
+		self.assertEqual(job_status.call_count, 1)
+
+
+	@patch('codedx_api.CodeDxAPI.CodeDx.job_status')
+	def test_wait_for_job(self, mock_job_status):
+		mock_job_status.return_value = {"jobId": "1", "status": "completed"}
+		codedx_api = CodeDx(base_url, api_key, polling=PollingStrategy(initial_interval=0.01, jitter=0))
+		job = codedx_api.wait_for_job({"jobId": "1"})
+		self.assertEqual(job["status"], "completed")
+		job, stats = codedx_api.poll_job({"jobId": "1"})
+		self.assertEqual(stats.polls, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
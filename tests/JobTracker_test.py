@@ -0,0 +1,92 @@
+import threading
+import time
+import unittest
+
+from codedx_api.CodeDxAPI import CodeDx
+from codedx_api.JobPolling import PollingStrategy
+from codedx_api.JobTracker import JobTracker
+
+# DO NOT UPDATE - MOCK REQUESTS DO NOT REQUIRE CREDENTIALS
+api_key = "0000-0000-0000-0000"
+base_url = "https://[CODE_DX_BASE_URL].org/codedx"
+
+
+class FakeJobs(object):
+	"""Completes each job after a given number of polls and records concurrency"""
+
+	def __init__(self, polls_needed: dict, failing=()):
+		self.polls_needed = dict(polls_needed)
+		self.failing = failing
+		self.lock = threading.Lock()
+		self.active = 0
+		self.max_active = 0
+
+	def job_status(self, job_id, timeout=None):
+		with self.lock:
+			self.active += 1
+			self.max_active = max(self.max_active, self.active)
+		time.sleep(0.005)
+		with self.lock:
+			self.active -= 1
+			self.polls_needed[job_id] -= 1
+			remaining = self.polls_needed[job_id]
+		if job_id in self.failing:
+			return {"jobId": job_id, "status": "failed"}
+		return {"jobId": job_id, "status": "completed" if remaining <= 0 else "running"}
+
+
+class JobTracker_test(unittest.TestCase):
+
+
+	def setUp(self):
+		unittest.TestCase.setUp(self)
+		self.polling = PollingStrategy(initial_interval=0.01, fast_polls=1, max_interval=0.02, jitter=0, timeout=5)
+
+
+	def test_as_completed(self):
+		client = FakeJobs({"slow": 6, "fast": 1, "medium": 3})
+		tracker = JobTracker(client, {"A": {"jobId": "slow"}, "B": {"jobId": "fast"}, "C": {"jobId": "medium"}}, self.polling)
+		labels = [tracked.label for tracked in tracker.as_completed()]
+		self.assertEqual(labels, ["B", "C", "A"])
+		self.assertTrue(all(tracked.ok for tracked in tracker.jobs))
+		self.assertEqual(tracker.jobs[0].stats.polls, 6)
+
+
+	def test_bounded_concurrency(self):
+		client = FakeJobs({str(i): 3 for i in range(40)})
+		tracker = JobTracker(client, [{"jobId": str(i)} for i in range(40)], self.polling, max_workers=4)
+		results = tracker.wait_all()
+		self.assertEqual(len(results), 40)
+		self.assertLessEqual(client.max_active, 4)
+		self.assertEqual([tracked.job_id for tracked in results], [str(i) for i in range(40)])
+
+
+	def test_failed_and_completed_jobs(self):
+		client = FakeJobs({"bad": 1, "good": 1}, failing=("bad",))
+		tracker = JobTracker(client, [{"jobId": "bad"}, {"jobId": "good"}, {"jobId": "done", "status": "completed"}], self.polling)
+		results = tracker.wait_all()
+		self.assertIsInstance(results[0].error, RuntimeError)
+		self.assertTrue(results[1].ok)
+		self.assertEqual(results[2].polls, 0)
+
+
+	def test_timeouts(self):
+		client = FakeJobs({"forever": 10**6})
+		tracker = JobTracker(client, [{"jobId": "forever"}], self.polling)
+		with self.assertRaises(RuntimeError):
+			tracker.wait_all(timeout=0.1)
+		polling = PollingStrategy(initial_interval=0.01, jitter=0, timeout=0.1)
+		tracker = JobTracker(client, [{"jobId": "forever"}], polling)
+		results = tracker.wait_all()
+		self.assertIsInstance(results[0].error, RuntimeError)
+
+
+	def test_track_jobs(self):
+		codedx_api = CodeDx(base_url, api_key, polling=self.polling)
+		tracker = codedx_api.track_jobs([{"jobId": "1", "status": "completed"}])
+		self.assertIs(tracker.client, codedx_api)
+		self.assertEqual(len(tracker.wait_all()), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,13 @@
+import io
+import os
+import tempfile
 import unittest
 from unittest.mock import patch
 
+from requests.exceptions import ContentDecodingError
+
 from codedx_api.APIs import JobsAPI
-from tests.MockResponses import DataMock, JSONMock
+from tests.MockResponses import DataMock, JSONMock, StreamMock
 
 # DO NOT UPDATE - MOCK REQUESTS DO NOT REQUIRE CREDENTIALS
 api_key = "0000-0000-0000-0000"
@@ -15,14 +20,14 @@ class JobsAPI_test(unittest.TestCase):
 		self.job_api = JobsAPI.Jobs(api_key, base_url)
 
 
-	@patch('requests.get')
+	@patch('requests.Session.get')
 	def test_job_status(self, mock_job_status):
 		mock_job_status.return_value = JSONMock()
 		test_job = "string"
 		result = self.job_api.job_status(test_job)
 		self.assertIsInstance(result, dict)
 
-	@patch('requests.get')
+	@patch('requests.Session.get')
 	def test_job_result(self, mock_job_result):
 		content_type = 'text/csv'
 		test_data = "test"
@@ -32,5 +37,32 @@ class JobsAPI_test(unittest.TestCase):
 		self.assertTrue(result is not None)
 		self.assertIsInstance(result, str)
 
+	@patch('requests.Session.get')
+	def test_job_result_stream(self, mock_job_result):
+		mock_job_result.return_value = StreamMock('application/pdf', [b"%PDF", b"-1.4"])
+		with tempfile.TemporaryDirectory() as tmp:
+			file_name = os.path.join(tmp, "report.pdf")
+			result = self.job_api.job_result("string", 'application/pdf', destination=file_name)
+			self.assertEqual(result, 8)
+			with open(file_name, 'rb') as f:
+				self.assertEqual(f.read(), b"%PDF-1.4")
+			self.assertEqual(os.listdir(tmp), ["report.pdf"])
+		self.assertTrue(mock_job_result.return_value.closed)
+		self.assertTrue(mock_job_result.call_args.kwargs["stream"])
+		buffer = io.BytesIO()
+		mock_job_result.return_value = StreamMock('application/pdf', [b"%PDF"])
+		self.job_api.job_result("string", 'application/pdf', destination=buffer)
+		self.assertEqual(buffer.getvalue(), b"%PDF")
+
+	@patch('requests.Session.get')
+	def test_job_result_stream_wrong_type(self, mock_job_result):
+		mock_job_result.return_value = StreamMock('text/csv', [b"a,b"])
+		with tempfile.TemporaryDirectory() as tmp:
+			file_name = os.path.join(tmp, "report.pdf")
+			with self.assertRaises(ContentDecodingError):
+				self.job_api.job_result("string", 'application/pdf', destination=file_name)
+			self.assertEqual(os.listdir(tmp), [])
+		self.assertTrue(mock_job_result.return_value.closed)
+
 if __name__ == '__main__':
     unittest.main()
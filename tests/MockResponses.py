@@ -23,3 +23,17 @@ class DataMock(SuccessMock):
             "Content-Type": content_type
         }
         self.content = data
+
+
+class StreamMock(DataMock):
+    def __init__(self, content_type: str, chunks: list):
+        super().__init__(content_type, None)
+        self.chunks = chunks
+        self.closed = False
+
+    def iter_content(self, chunk_size: int = 1):
+        for chunk in self.chunks:
+            yield chunk
+
+    def close(self):
+        self.closed = True
@@ -0,0 +1,65 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class MockRequest(object):
+	def __init__(self, method: str, path: str, headers: dict, body: bytes):
+		self.method = method
+		self.path = path
+		self.headers = headers
+		self.body = body
+
+
+class MockServer(object):
+	"""Local HTTP server that answers requests with a routing function.
+
+	The routing function receives a MockRequest and returns a tuple of
+	(status code, content type, body).
+	"""
+
+	def __init__(self, route):
+		self.route = route
+		self.requests = []
+		self._lock = threading.Lock()
+		server = self
+
+		class Handler(BaseHTTPRequestHandler):
+			protocol_version = "HTTP/1.1"
+
+			def _handle(self):
+				length = int(self.headers.get("Content-Length", 0))
+				body = self.rfile.read(length) if length else b""
+				request = MockRequest(self.command, self.path, dict(self.headers), body)
+				with server._lock:
+					server.requests.append(request)
+				status, content_type, data = server.route(request)
+				if not isinstance(data, bytes):
+					data = json.dumps(data).encode()
+				self.send_response(status)
+				self.send_header("Content-Type", content_type)
+				self.send_header("Content-Length", str(len(data)))
+				self.end_headers()
+				self.wfile.write(data)
+
+			do_GET = do_POST = do_PUT = do_DELETE = _handle
+
+			def log_message(self, *args):
+				pass
+
+		self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+		self.httpd.daemon_threads = True
+		self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+	@property
+	def url(self) -> str:
+		host, port = self.httpd.server_address
+		return f"http://{ host }:{ port }/codedx"
+
+	def __enter__(self):
+		self.thread.start()
+		return self
+
+	def __exit__(self, *args):
+		self.httpd.shutdown()
+		self.httpd.server_close()
@@ -0,0 +1,116 @@
+import unittest
+from unittest.mock import patch
+
+from codedx_api.APIs.ProjectCache import ProjectCache
+from codedx_api.CodeDxAPI import CodeDx
+from tests.MockResponses import JSONMock, SuccessMock
+
+# DO NOT UPDATE - MOCK REQUESTS DO NOT REQUIRE CREDENTIALS
+api_key = "0000-0000-0000-0000"
+base_url = "https://[CODE_DX_BASE_URL].org/codedx"
+
+
+class FakeClock(object):
+	def __init__(self):
+		self.now = 0.0
+
+	def __call__(self):
+		return self.now
+
+
+class ProjectCache_test(unittest.TestCase):
+
+
+	def setUp(self):
+		unittest.TestCase.setUp(self)
+		self.clock = FakeClock()
+		self.cache = ProjectCache(ttl=10, max_size=3, clock=self.clock)
+		self.codedx_api = CodeDx(base_url, api_key)
+
+
+	def test_ttl(self):
+		self.cache.put("WebGoat", 1)
+		self.assertEqual(self.cache.lookup("WebGoat"), (True, 1))
+		self.clock.now = 10
+		self.assertEqual(self.cache.lookup("WebGoat"), (False, None))
+		self.assertEqual(len(self.cache), 0)
+
+
+	def test_lru(self):
+		for i, name in enumerate(["A", "B", "C"]):
+			self.cache.put(name, i)
+		self.cache.lookup("A")
+		self.cache.put("D", 3)
+		self.assertEqual(self.cache.lookup("B"), (False, None))
+		self.assertEqual(self.cache.lookup("A"), (True, 0))
+
+
+	def test_load(self):
+		self.cache.load([{"name": "A", "id": 1}, {"name": "B", "id": 2}])
+		self.assertEqual(self.cache.lookup("B"), (True, 2))
+		self.assertEqual(self.cache.lookup("Missing"), (False, None))
+		self.cache = ProjectCache(ttl=10, max_size=3, negative=True, clock=self.clock)
+		self.cache.load([{"name": "A", "id": 1}, {"name": "B", "id": 2}])
+		self.assertEqual(self.cache.lookup("Missing"), (True, None))
+		self.cache.invalidate(project_id=2)
+		self.assertEqual(self.cache.lookup("B"), (False, None))
+		self.assertEqual(self.cache.lookup("A"), (True, 1))
+		self.cache.load([{"name": str(i), "id": i} for i in range(5)])
+		self.assertEqual(self.cache.lookup("Missing"), (False, None))
+
+
+	def test_shared_cache(self):
+		self.assertIs(self.codedx_api.projects_api.project_cache, self.codedx_api.project_cache)
+
+
+	@patch('requests.Session.post')
+	def test_get_project_id(self, mock_query):
+		mock_query.return_value = JSONMock()
+		mock_query.return_value.data = [{"id": 4, "name": "WebGoat"}]
+		self.assertEqual(self.codedx_api.get_project_id("WebGoat"), 4)
+		self.assertEqual(self.codedx_api.get_project_id("WebGoat"), 4)
+		self.assertEqual(mock_query.call_count, 1)
+		self.codedx_api.get_project_id("WebGoat", use_cache=False)
+		self.assertEqual(mock_query.call_count, 2)
+
+
+	@patch('requests.Session.delete')
+	@patch('requests.Session.put')
+	@patch('requests.Session.get')
+	def test_invalidation(self, mock_get, mock_put, mock_delete):
+		mock_get.return_value = JSONMock()
+		mock_get.return_value.data = {"projects": [{"id": 1, "name": "A"}, {"id": 2, "name": "B"}]}
+		self.codedx_api.get_projects()
+		self.assertEqual(self.codedx_api.get_project_ids(["A", "B"]), {"A": 1, "B": 2})
+		self.assertEqual(mock_get.call_count, 1)
+		mock_put.return_value = JSONMock()
+		mock_put.return_value.data = {"id": 3, "name": "C"}
+		self.codedx_api.create_project("C")
+		self.assertEqual(self.codedx_api.get_project_id("C"), 3)
+		mock_put.return_value = SuccessMock()
+		self.codedx_api.update_project(1, new_name="A2")
+		self.assertEqual(self.codedx_api.project_cache.lookup("A"), (False, None))
+		mock_delete.return_value = SuccessMock()
+		self.codedx_api.delete_project(2)
+		self.assertEqual(self.codedx_api.project_cache.lookup("B"), (False, None))
+
+
+	@patch('requests.Session.post')
+	@patch('requests.Session.get')
+	def test_project_created_elsewhere(self, mock_get, mock_query):
+		mock_get.return_value = JSONMock()
+		mock_get.return_value.data = {"projects": [{"id": 1, "name": "A"}]}
+		self.codedx_api.get_projects()
+		mock_get.return_value.data = {"projects": [{"id": 1, "name": "A"}, {"id": 2, "name": "B"}]}
+		self.assertEqual(self.codedx_api.get_project_ids(["A", "B"]), {"A": 1, "B": 2})
+		mock_query.return_value = JSONMock()
+		mock_query.return_value.data = [{"id": 3, "name": "C"}]
+		self.assertEqual(self.codedx_api.get_project_id("C"), 3)
+		negative = CodeDx(base_url, api_key, project_cache=ProjectCache(negative=True))
+		negative.get_projects()
+		self.assertIsNone(negative.get_project_id("C"))
+		self.assertEqual(mock_query.call_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -16,7 +16,7 @@ class ProjectsAPI_test(unittest.TestCase):
 		self.proj_api = ProjectsAPI.Projects(api_key, base_url)
 
 
-	@patch('requests.get')
+	@patch('requests.Session.get')
 	def test_get_projects(self, mock_get_projects):
 		# Creating Mock
 		mock_get_projects.return_value = JSONMock()
@@ -24,7 +24,7 @@ class ProjectsAPI_test(unittest.TestCase):
 		self.assertIsInstance(projs, dict)
 
 
-	@patch('requests.put')
+	@patch('requests.Session.put')
 	def test_create_project(self, mock_create_project):
 		mock_create_project.return_value = JSONMock()
 		test_name = "CreateTest"
@@ -32,7 +32,7 @@ class ProjectsAPI_test(unittest.TestCase):
 		self.assertIsInstance(result, dict)
 
 
-	@patch('requests.put')
+	@patch('requests.Session.put')
 	def test_update_project(self, mock_update_project):
 		mock_update_project.return_value = SuccessMock()
 		test_name = "UpdateTest"
@@ -40,14 +40,14 @@ class ProjectsAPI_test(unittest.TestCase):
 		result = self.proj_api.update_project(test_id, new_name=test_name)
 
 
-	@patch('requests.delete')
+	@patch('requests.Session.delete')
 	def test_delete_project(self, mock_delete_project):
 		mock_delete_project.return_value.status_code = 204
 		test_id = 1
 		result = self.proj_api.delete_project(test_id)
 
 
-	@patch('requests.post')
+	@patch('requests.Session.post')
 	def test_query_project(self, mock_query_projects):
 		mock_query_projects.return_value = JSONMock()
 		mock_query_projects.return_value.data = [{"project": "test"}, {"project2": "test"}]
@@ -65,7 +65,7 @@ class ProjectsAPI_test(unittest.TestCase):
 		self.assertIsInstance(result, list)
 
 
-	@patch('requests.post')
+	@patch('requests.Session.post')
 	def test_query_count(self, mock_query_count):
 		mock_query_count.return_value = JSONMock()
 		mock_query_count.return_value.data = 5
@@ -76,21 +76,21 @@ class ProjectsAPI_test(unittest.TestCase):
 		self.assertIsInstance(result, int)
 
 
-	@patch('requests.get')
+	@patch('requests.Session.get')
 	def test_project_status(self, mock_project_status):
 		mock_project_status.return_value = JSONMock()
 		result = self.proj_api.project_status(0)
 		self.assertIsInstance(result, dict)
 
 
-	@patch('requests.post')
+	@patch('requests.Session.post')
 	def test_file_mappings(self, mock_file_mappings):
 		mock_file_mappings.return_value = JSONMock()
 		result = self.proj_api.file_mappings(0, {"files": "/Proj/foo"})
 		self.assertIsInstance(result, dict)
 
 
-	@patch('requests.get')
+	@patch('requests.Session.get')
 	def test_project_files(self, mock_project_files):
 		mock_project_files.return_value = JSONMock()
 		mock_project_files.return_value.data = ["file1", "file2"]
@@ -98,21 +98,21 @@ class ProjectsAPI_test(unittest.TestCase):
 		self.assertIsInstance(result, list)
 
 
-	@patch('requests.get')
+	@patch('requests.Session.get')
 	def test_project_roles(self, mock_project_roles):
 		mock_project_roles.return_value = JSONMock()
 		mock_project_roles.return_value.data = ["Admin", "Creator"]
 		result = self.proj_api.project_roles(0)
 
 
-	@patch('requests.get')
+	@patch('requests.Session.get')
 	def test_project_user(self, mock_project_user):
 		mock_project_user.return_value = JSONMock()
 		result = self.proj_api.project_user(0, 0)
 		self.assertIsInstance(result, dict)
 
 
-	@patch('requests.put')
+	@patch('requests.Session.put')
 	def test_project_user(self, mock_update_user):
 		mock_update_user.return_value = SuccessMock()
 		roles = {
@@ -125,7 +125,7 @@ class ProjectsAPI_test(unittest.TestCase):
 		self.assertIsNone(result)
 
 
-	@patch('requests.post')
+	@patch('requests.Session.post')
 	def test_get_project_id(self, mock_get_id):
 		mock_get_id.return_value = JSONMock()
 		mock_result = [
@@ -0,0 +1,100 @@
+import os
+import tempfile
+import time
+import unittest
+
+from codedx_api.CodeDxAPI import CodeDx
+from codedx_api.JobPolling import PollingStrategy
+from codedx_api.ReportPipeline import ReportPipeline
+from tests.MockServer import MockServer
+
+# DO NOT UPDATE - MOCK REQUESTS DO NOT REQUIRE CREDENTIALS
+api_key = "0000-0000-0000-0000"
+json_type = 'application/json;charset=utf-8'
+
+
+def report_route(request):
+	path = request.path.replace("/codedx", "", 1)
+	if path == "/api/projects":
+		projects = [{"id": i, "name": f"project{ i }"} for i in range(1, 21)]
+		return 200, json_type, {"projects": projects}
+	if path.endswith("/report/pdf"):
+		project = path.split("/")[3]
+		if project == "13":
+			return 500, "text/plain", b"Report error"
+		return 200, json_type, {"jobId": f"job{ project }"}
+	if path.endswith("/result"):
+		return 200, "application/pdf", f"%PDF { path.split('/')[3] }".encode()
+	if path.startswith("/api/jobs/"):
+		return 200, json_type, {"jobId": path.split("/")[3], "status": "completed"}
+	return 404, "text/plain", b"Not found"
+
+
+class QueuedRoute(object):
+	"""Report jobs that stay queued for the given number of seconds"""
+
+	def __init__(self, delay: float):
+		self.delay = delay
+		self.started = time.monotonic()
+
+	def __call__(self, request):
+		path = request.path.replace("/codedx", "", 1)
+		if path.startswith("/api/jobs/") and not path.endswith("/result"):
+			status = "completed" if time.monotonic() - self.started > self.delay else "queued"
+			return 200, json_type, {"jobId": path.split("/")[3], "status": status}
+		return report_route(request)
+
+
+class ReportPipeline_test(unittest.TestCase):
+
+
+	def test_get_reports(self):
+		projects = [f"project{ i }" for i in range(1, 21)] + ["missing"]
+		polling = PollingStrategy(initial_interval=0.01, jitter=0)
+		with MockServer(report_route) as server, tempfile.TemporaryDirectory() as tmp:
+			with CodeDx(server.url, api_key, polling=polling) as cdx:
+				results = cdx.get_reports(projects, "pdf", tmp, summary_mode="detailed")
+			self.assertEqual(len(results), 21)
+			self.assertIsInstance(results["missing"].error, ValueError)
+			self.assertIsNotNone(results["project13"].error)
+			for i in range(1, 21):
+				if i == 13:
+					continue
+				result = results[f"project{ i }"]
+				self.assertTrue(result.ok)
+				with open(result.file_name, 'rb') as f:
+					self.assertEqual(f.read(), f"%PDF job{ i }".encode())
+				self.assertEqual(result.bytes, len(f"%PDF job{ i }"))
+			self.assertEqual(sorted(os.listdir(tmp)), sorted(f"project{ i }.pdf" for i in range(1, 21) if i != 13))
+			project_requests = [request for request in server.requests if request.path == "/codedx/api/projects"]
+			self.assertEqual(len(project_requests), 1)
+
+
+	def test_queued_jobs_do_not_time_out(self):
+		polling = PollingStrategy(initial_interval=0.01, max_interval=0.02, jitter=0, timeout=0.05)
+		with MockServer(QueuedRoute(0.3)) as server, tempfile.TemporaryDirectory() as tmp:
+			with CodeDx(server.url, api_key, polling=polling) as cdx:
+				results = ReportPipeline(cdx, timeout=5).run(["project1", "project2"], "pdf", tmp)
+		self.assertTrue(all(result.ok for result in results.values()))
+
+
+	def test_run_timeout(self):
+		polling = PollingStrategy(initial_interval=0.01, max_interval=0.02, jitter=0)
+		with MockServer(QueuedRoute(60)) as server, tempfile.TemporaryDirectory() as tmp:
+			with CodeDx(server.url, api_key, polling=polling) as cdx:
+				results = ReportPipeline(cdx, timeout=0.2).run(["project1", "project2"], "pdf", tmp)
+		self.assertTrue(all(isinstance(result.error, RuntimeError) for result in results.values()))
+
+
+	def test_default_timeout(self):
+		polling = PollingStrategy(initial_interval=0.01, max_interval=0.02, jitter=0, timeout=0.1)
+		with MockServer(QueuedRoute(60)) as server, tempfile.TemporaryDirectory() as tmp:
+			with CodeDx(server.url, api_key, polling=polling) as cdx:
+				start = time.monotonic()
+				results = ReportPipeline(cdx, submit_workers=1).run(["project1", "project2"], "pdf", tmp)
+				self.assertLess(time.monotonic() - start, 5)
+		self.assertTrue(all(isinstance(result.error, RuntimeError) for result in results.values()))
+
+
+if __name__ == '__main__':
+    unittest.main()
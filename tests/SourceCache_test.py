@@ -0,0 +1,105 @@
+import os
+import tempfile
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from codedx_api.SourceCache import SourceFileCache
+
+
+class FakeFiles(object):
+	"""Findings client serving 100-byte files and a settable latest analysis"""
+
+	def __init__(self):
+		self.lock = threading.Lock()
+		self.file_calls = 0
+		self.analysis_calls = 0
+		self.analysis = 1
+
+	def get_all_analysis(self, project):
+		with self.lock:
+			self.analysis_calls += 1
+		return [{"id": i} for i in range(1, self.analysis + 1)]
+
+	def get_finding_file(self, project, file, use_cache=True, by=None):
+		with self.lock:
+			self.file_calls += 1
+		return f"{ file }:{ self.analysis }".encode().ljust(100)
+
+
+class SourceCache_test(unittest.TestCase):
+
+
+	def setUp(self):
+		unittest.TestCase.setUp(self)
+		self.client = FakeFiles()
+		self.tmp = tempfile.TemporaryDirectory()
+		self.addCleanup(self.tmp.cleanup)
+
+
+	def test_get(self):
+		cache = SourceFileCache(self.tmp.name, self.client)
+		files = ["src/a.py", 7, "src/a.py", 7] * 5
+		with ThreadPoolExecutor(max_workers=8) as pool:
+			results = list(pool.map(lambda file: cache.get(1, file), files))
+		self.assertEqual(results[0].strip(), b"src/a.py:1")
+		self.assertEqual(results[1].strip(), b"7:1")
+		self.assertEqual(self.client.file_calls, 2)
+		self.assertEqual(cache.stats(), {"hits": 18, "misses": 2, "files": 2, "bytes": 200})
+		self.assertEqual(cache.get(1, "7").strip(), b"7:1")
+		self.assertEqual(self.client.file_calls, 3)
+
+
+	def test_new_analysis(self):
+		cache = SourceFileCache(self.tmp.name, self.client, analysis_ttl=0)
+		cache.get(1, "src/a.py")
+		cache.get(1, "src/a.py")
+		self.assertEqual(self.client.file_calls, 1)
+		self.client.analysis = 2
+		self.assertEqual(cache.get(1, "src/a.py").strip(), b"src/a.py:2")
+		self.assertEqual(self.client.file_calls, 2)
+
+
+	def test_eviction(self):
+		cache = SourceFileCache(self.tmp.name, self.client, max_bytes=250)
+		cache.get(1, "a")
+		cache.get(1, "b")
+		cache._entries[min(cache._entries, key=lambda name: cache._entries[name][1])] = (100, 0)
+		cache.get(1, "a")
+		cache.get(1, "c")
+		self.assertEqual(cache.size, 200)
+		self.assertEqual(len(os.listdir(self.tmp.name)), 2)
+		cache.get(1, "a")
+		self.assertEqual(self.client.file_calls, 3)
+
+
+	def test_reopen(self):
+		SourceFileCache(self.tmp.name, self.client).get(1, "a")
+		cache = SourceFileCache(self.tmp.name, self.client)
+		self.assertEqual(cache.size, 100)
+		cache.get(1, "a")
+		self.assertEqual(self.client.file_calls, 1)
+
+
+	def test_client_file_cache(self):
+		from codedx_api.CodeDxAPI import CodeDx
+		cdx = CodeDx("https://codedx.example.org/codedx", "key", file_cache=SourceFileCache(self.tmp.name))
+		self.assertIs(cdx.file_cache.client, cdx)
+		self.assertIsNone(CodeDx("https://codedx.example.org/codedx", "key").file_cache)
+		cdx.get_all_analysis = self.client.get_all_analysis
+		cdx.get_file_by_path = lambda project, path: f"path { path }".encode()
+		cdx.get_file_by_id = lambda project, file: f"id { file }".encode()
+		self.assertEqual(cdx.get_finding_file(1, "src/a.py"), b"path src/a.py")
+		self.assertEqual(cdx.get_finding_file(1, "src/a.py"), b"path src/a.py")
+		self.assertEqual(cdx.file_cache.stats()["hits"], 1)
+		self.assertEqual(cdx.get_finding_file(1, "123"), b"id 123")
+		self.assertEqual(cdx.get_finding_file(1, 123), b"id 123")
+		self.assertEqual(cdx.get_finding_file(1, "123", by="path"), b"path 123")
+		self.assertEqual(cdx.get_finding_file(1, "123", use_cache=False, by="path"), b"path 123")
+		self.assertEqual(cdx.file_cache.stats()["hits"], 2)
+		with self.assertRaises(ValueError):
+			cdx.get_finding_file(1, "123", by="name")
+
+
+if __name__ == '__main__':
+	unittest.main()
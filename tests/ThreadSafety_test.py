@@ -0,0 +1,61 @@
+import os
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from codedx_api.CodeDxAPI import CodeDx
+from tests.MockServer import MockServer
+
+# DO NOT UPDATE - MOCK REQUESTS DO NOT REQUIRE CREDENTIALS
+api_key = "0000-0000-0000-0000"
+json_type = 'application/json;charset=utf-8'
+
+
+def echo_route(request):
+	data = {
+		"path": request.path,
+		"requestId": request.headers.get("X-Client-Request-Id"),
+		"contentType": request.headers.get("Content-Type")
+	}
+	return 200, json_type, data
+
+
+class ThreadSafety_test(unittest.TestCase):
+
+
+	def setUp(self):
+		unittest.TestCase.setUp(self)
+		self.test_file = os.path.join(os.path.dirname(__file__), 'testdata.xml')
+
+
+	def _call(self, cdx, i):
+		"""Issues one of several request types and checks that nothing leaked between threads"""
+		kind = i % 3
+		if kind == 0:
+			data = cdx.get_finding(i)
+			self.assertEqual(data["path"], f"/codedx/api/findings/{ i }")
+			self.assertIsNone(data["requestId"])
+			self.assertEqual(data["contentType"], "application/json")
+		elif kind == 1:
+			data = cdx.upload_analysis(f"prep{ i }", self.test_file, client_request_id=f"req{ i }")
+			self.assertEqual(data["requestId"], f"req{ i }")
+			self.assertTrue(data["contentType"].startswith("multipart/form-data"))
+		else:
+			data = cdx.create_analysis(i)
+			self.assertIsNone(data["requestId"])
+			self.assertEqual(data["contentType"], "application/json")
+		return i
+
+
+	def test_shared_client(self):
+		with MockServer(echo_route) as server:
+			with CodeDx(server.url, api_key, pool_maxsize=16, timeout=10) as cdx:
+				with ThreadPoolExecutor(max_workers=16) as pool:
+					results = list(pool.map(lambda i: self._call(cdx, i), range(600)))
+				self.assertEqual(results, list(range(600)))
+				self.assertEqual(len(server.requests), 600)
+				self.assertNotIn("X-Client-Request-Id", cdx.headers)
+				self.assertEqual(cdx.headers["Content-Type"], "application/json")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import json
+import unittest
+
+from codedx_api.CodeDxAPI import CodeDx
+from codedx_api.JobPolling import PollingStrategy
+from codedx_api.TriagePlanner import TriagePlanner, plan_batches
+from tests.MockServer import MockServer
+
+# DO NOT UPDATE - MOCK REQUESTS DO NOT REQUIRE CREDENTIALS
+api_key = "0000-0000-0000-0000"
+json_type = 'application/json;charset=utf-8'
+
+# Findings 1 to 5 of project 1 are already false positives
+FALSE_POSITIVES = {1, 2, 3, 4, 5}
+
+
+def triage_route(request):
+	path = request.path.replace("/codedx", "", 1)
+	if path == "/api/projects":
+		return 200, json_type, {"projects": [{"id": 1, "name": "WebGoat"}, {"id": 2, "name": "Juice Shop"}]}
+	if path.endswith("/findings/count"):
+		filters = json.loads(request.body)["filter"]
+		count = len(FALSE_POSITIVES & set(filters["finding"])) if filters["status"] == "false-positive" and "/projects/1/" in path else 0
+		return 200, json_type, {"count": count}
+	if path.endswith("/bulk-status-update"):
+		return 200, json_type, {"jobId": f"job{ len(request.body) }"}
+	if path.startswith("/api/jobs/"):
+		return 200, json_type, {"jobId": path.split("/")[3], "status": "completed"}
+	return 404, "text/plain", b"Not found"
+
+
+class TriagePlanner_test(unittest.TestCase):
+
+
+	def test_plan_batches(self):
+		decisions = [(1, i, "false-positive") for i in range(12, 0, -1)]
+		decisions += [(1, 3, "fixed"), (2, 1, "ignored"), (1, 20, "fixed")]
+		batches = plan_batches(decisions, chunk_size=5)
+		self.assertEqual([(batch.project, batch.status, batch.findings) for batch in batches], [
+			(1, "false-positive", [1, 2, 4, 5, 6]),
+			(1, "false-positive", [7, 8, 9, 10, 11]),
+			(1, "false-positive", [12]),
+			(1, "fixed", [3, 20]),
+			(2, "ignored", [1])
+		])
+		self.assertEqual(batches[4].update(), (2, "ignored", {"finding": [1]}))
+		with self.assertRaises(ValueError):
+			plan_batches([(1, 1, "done")])
+
+
+	def test_apply(self):
+		decisions = [("WebGoat", i, "false-positive") for i in range(1, 11)]
+		decisions += [("Juice Shop", 4, "ignored")]
+		polling = PollingStrategy(initial_interval=0.01, jitter=0)
+		with MockServer(triage_route) as server:
+			with CodeDx(server.url, api_key, polling=polling) as cdx:
+				planner = TriagePlanner(cdx, chunk_size=5)
+				results = planner.apply(decisions)
+		self.assertEqual([batch.findings for batch in planner.skipped], [[1, 2, 3, 4, 5]])
+		self.assertEqual([(result.project, result.filters) for result in results], [
+			("WebGoat", {"finding": [6, 7, 8, 9, 10]}),
+			("Juice Shop", {"finding": [4]})
+		])
+		self.assertTrue(all(result.ok for result in results))
+		project_requests = [request for request in server.requests if request.path == "/codedx/api/projects"]
+		self.assertEqual(len(project_requests), 1)
+
+
+if __name__ == '__main__':
+	unittest.main()